@@ -0,0 +1,3 @@
+"""
+Benchmarks for OpenSCM using `airspeed velocity <https://asv.readthedocs.io>`_.
+"""
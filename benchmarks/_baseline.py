@@ -0,0 +1,101 @@
+"""
+Reference benchmark results stored in ``benchmarks/baseline``.
+
+airspeed velocity keeps results per machine and environment (whose name contains the
+path of the Python interpreter when benchmarking the development environment), so
+results stored on one machine are not found on another one. ``store`` copies the
+results of a commit into ``benchmarks/baseline``. ``restore`` copies them back into the
+results directory as results of the local machine and environment (taken from the
+results of the current commit) and prints the commit hash of the reference results,
+e.g. to pass it to ``asv compare``::
+
+    python -m benchmarks._baseline store <commit>
+    python -m benchmarks._baseline restore <current commit>
+
+The reference timings are of the machine described in
+``benchmarks/baseline/machine.json``, so differences to them of less than the
+difference between the machines are not significant.
+"""
+import glob
+import json
+import os
+import shutil
+import sys
+from typing import Any, Dict, cast
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline")
+"""Directory of the reference results"""
+
+BASELINE_RESULTS = os.path.join(BASELINE_DIR, "results.json")
+"""File of the reference results"""
+
+
+def _get_results_path(commit_hash: str) -> str:
+    """
+    Get the path of the results of a commit in the results directory.
+
+    Raises
+    ------
+    SystemExit
+        There are no results or results of several machines or environments
+    """
+    with open("asv.conf.json") as f:
+        results_dir = json.load(f)["results_dir"]
+    paths = glob.glob(
+        os.path.join(results_dir, "*", "{}-*.json".format(commit_hash[:8]))
+    )
+    if len(paths) != 1:
+        raise SystemExit(
+            "Expected results of {} for a single machine and environment, found "
+            "{}".format(commit_hash, paths)
+        )
+    return paths[0]
+
+
+def _load(path: str) -> Dict[str, Any]:
+    """
+    Load a results file.
+    """
+    with open(path) as f:
+        return cast(Dict[str, Any], json.load(f))
+
+
+def store(commit_hash: str) -> None:
+    """
+    Store the results of a commit as reference results.
+    """
+    path = _get_results_path(commit_hash)
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    shutil.copyfile(path, BASELINE_RESULTS)
+    shutil.copyfile(
+        os.path.join(os.path.dirname(path), "machine.json"),
+        os.path.join(BASELINE_DIR, "machine.json"),
+    )
+
+
+def restore(commit_hash: str) -> None:
+    """
+    Restore the reference results next to the results of the current commit and
+    print the commit hash of the reference results.
+
+    Results of the reference commit benchmarked locally take precedence, they are
+    not overwritten.
+    """
+    current_path = _get_results_path(commit_hash)
+    current = _load(current_path)
+    baseline = _load(BASELINE_RESULTS)
+    path = os.path.join(
+        os.path.dirname(current_path),
+        "{}-{}.json".format(baseline["commit_hash"][:8], current["env_name"]),
+    )
+    if not os.path.exists(path):
+        for key in ["env_name", "params", "python"]:
+            baseline[key] = current[key]
+        with open(path, "w") as f:
+            json.dump(baseline, f)
+
+    print(baseline["commit_hash"])
+
+
+if __name__ == "__main__":
+    {"store": store, "restore": restore}[sys.argv[1]](sys.argv[2])
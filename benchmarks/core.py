@@ -0,0 +1,87 @@
+"""
+Benchmarks of reading and writing parameters via views.
+"""
+import numpy as np
+
+from openscm.core import ParameterSet
+from openscm.parameters import ParameterType
+from openscm.timeseries_converter import create_time_points
+
+PERIOD_LENGTH = 365 * 24 * 60 * 60
+"""Period length of the timeseries (about a year in seconds)"""
+
+
+class TimeParameterSetViews:
+    params = (
+        [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+        [10, 1000, 100000],
+    )
+    param_names = ["timeseries_type", "length"]
+
+    def setup(self, timeseries_type, length):
+        self.parameterset = ParameterSet()
+        self.time_points = create_time_points(0, PERIOD_LENGTH, length, timeseries_type)
+        self.values = np.random.random(length)
+        self.writable_view = self.parameterset.get_writable_timeseries_view(
+            ("Emissions", "CO2"),
+            ("World",),
+            "GtCO2/a",
+            self.time_points,
+            timeseries_type,
+        )
+        self.writable_view.set(self.values)
+        self.view = self.parameterset.get_timeseries_view(
+            ("Emissions", "CO2"),
+            ("World",),
+            "MtC/a",
+            self.time_points,
+            timeseries_type,
+        )
+        self.aggregated_view = self.parameterset.get_timeseries_view(
+            ("Emissions",), ("World",), "MtC/a", self.time_points, timeseries_type,
+        )
+
+    def time_get_view(self, timeseries_type, length):
+        self.parameterset.get_timeseries_view(
+            ("Emissions", "CO2"),
+            ("World",),
+            "MtC/a",
+            self.time_points,
+            timeseries_type,
+        )
+
+    def time_set(self, timeseries_type, length):
+        self.writable_view.set(self.values)
+
+    def time_get(self, timeseries_type, length):
+        # memoized as the parameter is not written to in between
+        self.view.get()
+
+    def time_get_aggregated(self, timeseries_type, length):
+        # memoized as the parameter is not written to in between
+        self.aggregated_view.get()
+
+    def time_set_get(self, timeseries_type, length):
+        # the write invalidates the memoized values, so that they are read again
+        self.writable_view.set(self.values)
+        self.view.get()
+
+    def time_set_get_aggregated(self, timeseries_type, length):
+        self.writable_view.set(self.values)
+        self.aggregated_view.get()
+
+
+class PeakMemParameterTree:
+    params = [10, 100]
+    param_names = ["regions"]
+
+    def peakmem_create_parameters(self, regions):
+        parameterset = ParameterSet()
+        for r in range(regions):
+            for gas in range(50):
+                for sector in range(10):
+                    parameterset.get_writable_scalar_view(
+                        ("Emissions", "Gas {}".format(gas), "Sector {}".format(sector)),
+                        ("World", "Region {}".format(r)),
+                        "Mt CO2 / yr",
+                    )
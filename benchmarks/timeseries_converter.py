@@ -0,0 +1,106 @@
+"""
+Benchmarks of the timeseries conversion.
+"""
+import numpy as np
+
+from openscm.parameters import ParameterType
+from openscm.timeseries_converter import (
+    ExtrapolationType,
+    InterpolationType,
+    TimeseriesConverter,
+    create_time_points,
+)
+
+PERIOD_LENGTH = 30 * 24 * 60 * 60
+"""Period length of the source timeseries (about a month in seconds)"""
+
+MAX_VALUES_NUM = 10 ** 8
+"""Maximum number of values per benchmark (to keep memory use feasible)"""
+
+
+def _get_time_points(timeseries_type, length, grid):
+    """
+    Get source and target time points.
+
+    The target timeseries has a three times longer period length and is either aligned
+    with the source timeseries (``"regular"``) or shifted by half a source period
+    (``"shifted"``, which needs the general conversion and extrapolation).
+    """
+    source = create_time_points(0, PERIOD_LENGTH, length, timeseries_type)
+    target = create_time_points(
+        0 if grid == "regular" else PERIOD_LENGTH // 2,
+        3 * PERIOD_LENGTH,
+        length // 3,
+        timeseries_type,
+    )
+    return source, target
+
+
+class TimeCreateTimePoints:
+    params = (
+        [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+        [10, 1000, 100000],
+    )
+    param_names = ["timeseries_type", "length"]
+
+    def time_create_time_points(self, timeseries_type, length):
+        create_time_points(0, PERIOD_LENGTH, length, timeseries_type)
+
+
+class TimeTimeseriesConverterInit:
+    params = (
+        [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+        [10, 1000, 100000],
+        ["regular", "shifted"],
+    )
+    param_names = ["timeseries_type", "length", "grid"]
+
+    def setup(self, timeseries_type, length, grid):
+        self.source, self.target = _get_time_points(timeseries_type, length, grid)
+
+    def time_init(self, timeseries_type, length, grid):
+        TimeseriesConverter(
+            self.source,
+            self.target,
+            timeseries_type,
+            InterpolationType.LINEAR,
+            ExtrapolationType.LINEAR,
+        )
+
+
+class TimeTimeseriesConverterConvert:
+    params = (
+        [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+        [10, 1000, 100000],
+        [1, 100, 10000],
+        ["regular", "shifted"],
+    )
+    param_names = ["timeseries_type", "length", "ensemble_size", "grid"]
+
+    def setup(self, timeseries_type, length, ensemble_size, grid):
+        if length * ensemble_size > MAX_VALUES_NUM:
+            raise NotImplementedError("Too many values")
+        source, target = _get_time_points(timeseries_type, length, grid)
+        self.converter = TimeseriesConverter(
+            source,
+            target,
+            timeseries_type,
+            InterpolationType.LINEAR,
+            ExtrapolationType.LINEAR,
+        )
+        shape = (self.converter.source_length,)
+        if ensemble_size > 1:
+            shape = (ensemble_size,) + shape
+        self.source_values = np.random.random(shape)
+        self.target_values = self.converter.convert_from(self.source_values)
+
+    def time_convert_from(self, timeseries_type, length, ensemble_size, grid):
+        self.converter.convert_from(self.source_values)
+
+    def time_convert_to(self, timeseries_type, length, ensemble_size, grid):
+        self.converter.convert_to(self.target_values)
+
+    def time_convert_direct(self, timeseries_type, length, ensemble_size, grid):
+        self.converter._convert(
+            self.source_values, self.converter._source, self.converter._target
+        )
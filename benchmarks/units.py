@@ -0,0 +1,97 @@
+"""
+Benchmarks of the unit conversion.
+"""
+import numpy as np
+
+from openscm.units import (
+    UnitConverter,
+    calculate_co2_equivalent_totals,
+    convert_units,
+    get_co2_equivalent_factors,
+    get_conversion_factor,
+)
+
+UNIT_PAIRS = [
+    ("GtCO2/a", "MtC/a", None),
+    ("degC", "K", None),
+    ("MtCH4/a", "GtCO2/a", "AR4GWP100"),
+]
+"""Source unit, target unit and context of the benchmarked conversions"""
+
+
+class TimeUnitConverterInit:
+    params = [UNIT_PAIRS]
+    param_names = ["units"]
+
+    def setup(self, units):
+        # load the unit registry and contexts outside of the timing
+        UnitConverter(*units)
+
+    def time_init(self, units):
+        UnitConverter(*units)
+
+
+class TimeUnitConverterConvert:
+    params = (UNIT_PAIRS, [1, 1000, 1000000])
+    param_names = ["units", "size"]
+
+    def setup(self, units, size):
+        self.converter = UnitConverter(*units)
+        self.values = np.random.random(size)
+
+    def time_convert_from(self, units, size):
+        self.converter.convert_from(self.values)
+
+    def time_convert_to(self, units, size):
+        self.converter.convert_to(self.values)
+
+
+BASKET_UNITS = [
+    "Mt CH4 / yr",
+    "kt N2O / yr",
+    "Gt C / yr",
+    "kt SF6 / yr",
+    "kt HFC134a / yr",
+    "kt CF4 / yr",
+]
+"""Units of the gases of the benchmarked CO2-equivalent basket"""
+
+
+class TimeCO2EquivalentTotals:
+    params = [1, 100, 1000]
+    param_names = ["ensemble_size"]
+
+    def setup(self, ensemble_size):
+        get_co2_equivalent_factors(BASKET_UNITS, "Mt CO2 / yr", "AR4GWP100")
+        self.values = np.random.random((ensemble_size, len(BASKET_UNITS), 500))
+
+    def time_calculate_co2_equivalent_totals(self, ensemble_size):
+        calculate_co2_equivalent_totals(
+            self.values, BASKET_UNITS, "Mt CO2 / yr", "AR4GWP100"
+        )
+
+
+class TimeConvertUnits:
+    params = [10, 1000, 100000]
+    param_names = ["rows"]
+
+    def setup(self, rows):
+        source_units, target_units, _ = zip(*UNIT_PAIRS[:2])
+        choice = np.random.randint(len(source_units), size=rows)
+        self.source_units = np.array(source_units)[choice]
+        self.target_units = np.array(target_units)[choice]
+        self.values = np.random.random((rows, 100))
+        convert_units(self.values, self.source_units, self.target_units)
+
+    def time_convert_units(self, rows):
+        convert_units(self.values, self.source_units, self.target_units)
+
+
+class TimeGetConversionFactor:
+    def setup(self):
+        get_conversion_factor("Mt CH4 / yr", "Mt CO2 / yr", "AR4GWP100")
+
+    def time_get_conversion_factor(self):
+        for source in BASKET_UNITS:
+            for target in BASKET_UNITS:
+                get_conversion_factor(source, target, "AR4GWP100")
@@ -8,17 +8,25 @@ Parts of this API definition seems unpythonic as it is designed to be easily
 implementable in several programming languages.
 """
 
-from typing import Optional, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from .parameter_views import (
     GenericView,
+    RegionAggregatedScalarView,
+    RegionAggregatedTimeseriesView,
     ScalarView,
     TimeseriesView,
     WritableGenericView,
     WritableScalarView,
     WritableTimeseriesView,
 )
-from .parameters import ParameterInfo, ParameterType, _Parameter
+from .parameters import (
+    ParameterInfo,
+    ParameterType,
+    TimeseriesBlock,
+    _Parameter,
+    _TimeseriesStorage,
+)
 from .regions import _Region
 from .timeseries_converter import ExtrapolationType, InterpolationType
 from .utils import ensure_input_is_tuple
@@ -34,7 +42,10 @@ class ParameterSet:
     _root: _Region
     """Root region (contains all parameters)"""
 
-    def __init__(self, name_root: str = "World"):
+    _timeseries_storage: Optional[_TimeseriesStorage]
+    """Block storage for the timeseries parameters (``None`` if not used)"""
+
+    def __init__(self, name_root: str = "World", block_storage: bool = False):
         """
         Initialize.
 
@@ -42,8 +53,13 @@ class ParameterSet:
         ----------
         name_root : str
             Name of root region, default is "World"
+        block_storage : bool
+            If ``True``, the data of all timeseries parameters with the same type and
+            time points is stored as rows of one contiguous array (see
+            :attr:`timeseries_blocks`) rather than in an array per parameter
         """
         self._root = _Region(name_root)
+        self._timeseries_storage = _TimeseriesStorage() if block_storage else None
 
     def _get_or_create_region(self, name: Union[str, Tuple[str, ...]]) -> _Region:
         """
@@ -259,7 +275,9 @@ class ParameterSet:
         parameter = self._get_or_create_parameter(
             name, self._get_or_create_region(region)
         )
-        parameter.attempt_read(timeseries_type, unit, time_points)
+        parameter.attempt_read(
+            timeseries_type, unit, time_points, self._timeseries_storage
+        )
         return TimeseriesView(
             parameter,
             unit,
@@ -318,7 +336,9 @@ class ParameterSet:
         parameter = self._get_or_create_parameter(
             name, self._get_or_create_region(region)
         )
-        parameter.attempt_write(timeseries_type, unit, time_points)
+        parameter.attempt_write(
+            timeseries_type, unit, time_points, self._timeseries_storage
+        )
         return WritableTimeseriesView(
             parameter,
             unit,
@@ -328,6 +348,156 @@ class ParameterSet:
             extrapolation_type,
         )  # WritableTimeseriesView
 
+    def _attempt_read_over_regions(
+        self,
+        name: Tuple[str, ...],
+        region: Tuple[str, ...],
+        parameter_type: ParameterType,
+        unit: str,
+        time_points: Optional[Sequence[int]] = None,
+    ) -> List[_Parameter]:
+        """
+        Tell the parameter in all regions without subregions below a region that it
+        will be read from in an aggregated way over these regions.
+
+        No subregions can be added anywhere below the region afterwards (see
+        :func:`openscm.regions._Region.attempt_aggregate_subregions`), so the regions
+        are only collected once.
+
+        Parameters
+        ----------
+        name
+            :ref:`Hierarchical name <parameter-hierarchy>` of the parameter
+        region
+            Hierarchical name of the region to aggregate over
+        parameter_type
+            Parameter type to be read
+        unit
+            Unit to be read
+        time_points
+            Timeseries time points; only for timeseries parameters
+
+        Returns
+        -------
+        List[_Parameter]
+            The parameter in each of the regions
+
+        Raises
+        ------
+        ParameterTypeError
+            Parameter is not of type ``parameter_type`` in one of the regions
+        ValueError
+            Name not given or invalid region
+        """
+        parameters = []
+        for leaf_region in self._get_or_create_region(
+            region
+        ).attempt_aggregate_subregions():
+            parameter = self._get_or_create_parameter(name, leaf_region)
+            parameter.attempt_read(
+                parameter_type, unit, time_points, self._timeseries_storage,
+            )
+            parameters.append(parameter)
+        return parameters
+
+    def get_region_aggregated_scalar_view(
+        self, name: Tuple[str, ...], region: Tuple[str, ...], unit: str
+    ) -> RegionAggregatedScalarView:
+        """
+        Get a read-only view to the sum of a scalar parameter over all regions without
+        subregions below a region (or the region itself if it has no subregions).
+
+        Building the view creates the parameter as a scalar in each of these regions if
+        not viewed there so far (so that, e.g., :meth:`get_parameter_info` returns it
+        for each of them afterwards). No subregions can be added below the region
+        afterwards.
+
+        Parameters
+        ----------
+        name
+            :ref:`Hierarchical name <parameter-hierarchy>` of the parameter
+        region
+            Hierarchical name of the region to aggregate over
+        unit
+            Unit for the values in the view
+
+        Returns
+        -------
+        RegionAggregatedScalarView
+            Read-only view to the sum of the parameter over the regions
+
+        Raises
+        ------
+        ParameterTypeError
+            Parameter is not scalar
+        ValueError
+            Name not given or invalid region
+        """
+        return RegionAggregatedScalarView(
+            self._attempt_read_over_regions(name, region, ParameterType.SCALAR, unit),
+            unit,
+        )
+
+    def get_region_aggregated_timeseries_view(
+        self,
+        name: Tuple[str, ...],
+        region: Tuple[str, ...],
+        unit: str,
+        time_points: Sequence[int],
+        timeseries_type: ParameterType,
+        interpolation_type: InterpolationType = InterpolationType.LINEAR,
+        extrapolation_type: ExtrapolationType = ExtrapolationType.NONE,
+    ) -> RegionAggregatedTimeseriesView:
+        """
+        Get a read-only view to the sum of a timeseries parameter over all regions
+        without subregions below a region (or the region itself if it has no
+        subregions).
+
+        Building the view creates the parameter as a timeseries in each of these
+        regions if not viewed there so far (so that, e.g., :meth:`get_parameter_info`
+        returns it for each of them afterwards). No subregions can be added below the
+        region afterwards.
+
+        Parameters
+        ----------
+        name
+            :ref:`Hierarchical name <parameter-hierarchy>` of the parameter
+        region
+            Hierarchical name of the region to aggregate over
+        unit
+            Unit for the values in the view
+        time_points
+            Time points of the timeseries (seconds since ``1970-01-01 00:00:00``)
+        timeseries_type
+            Time series type
+        interpolation_type
+            Interpolation type
+        extrapolation_type
+            Extrapolation type
+
+        Returns
+        -------
+        RegionAggregatedTimeseriesView
+            Read-only view to the sum of the parameter over the regions
+
+        Raises
+        ------
+        ParameterTypeError
+            Parameter is not timeseries
+        ValueError
+            Name not given or invalid region
+        """
+        return RegionAggregatedTimeseriesView(
+            self._attempt_read_over_regions(
+                name, region, timeseries_type, unit, time_points
+            ),
+            unit,
+            time_points,
+            timeseries_type,
+            interpolation_type,
+            extrapolation_type,
+        )
+
     def get_generic_view(
         self, name: Tuple[str, ...], region: Tuple[str, ...]
     ) -> GenericView:
@@ -430,6 +600,16 @@ class ParameterSet:
                 return parameter.info
         return None
 
+    @property
+    def timeseries_blocks(self) -> Sequence[TimeseriesBlock]:
+        """
+        Blocks of timeseries parameters with the same type and time points (empty if
+        the parameter set does not use block storage)
+        """
+        if self._timeseries_storage is None:
+            return []
+        return self._timeseries_storage.blocks
+
 
 class Core:
     """
@@ -3,7 +3,7 @@ Parameter views provide ways to read and write parameter data with a defined uni
 and time information.
 """
 
-from typing import Any, Sequence, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 
@@ -13,17 +13,186 @@ from .timeseries_converter import (
     ExtrapolationType,
     InterpolationType,
     TimeseriesConverter,
+    get_timeseries_converter,
 )
-from .units import UnitConverter
+from .units import UnitConverter, get_unit_converter
 
 # pylint: disable=protected-access,too-many-arguments
 
 
+def _get_timeseries_conversion(
+    timeseries_converter: TimeseriesConverter,
+    unit_converter: UnitConverter,
+    inverse: bool,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Get the conversion of timeseries in both time points and units (from the source
+    to the target time points and unit or, if ``inverse`` is ``True``, the other way
+    round) as a single operation.
+
+    Timeseries converters are shared (see
+    :func:`openscm.timeseries_converter.get_timeseries_converter`) and keep the fused
+    conversions they create, so views with the same units and time points share them.
+    """
+    scaling = unit_converter._scaling
+    offset = unit_converter._offset
+    if inverse:
+        return timeseries_converter.create_affine_conversion(
+            1 / scaling, -offset / scaling, inverse=True
+        )
+    return timeseries_converter.create_affine_conversion(scaling, offset)
+
+
+def _get_leaf_parameters(parameter: _Parameter) -> List[_Parameter]:
+    """
+    Get the parameters without children below ``parameter`` (depth-first).
+    """
+    if not parameter._children:
+        return [parameter]
+    return [
+        leaf
+        for child in parameter._children.values()
+        for leaf in _get_leaf_parameters(child)
+    ]
+
+
+class _Aggregation:
+    """
+    Sum of the values of the leaf parameters below one or several parameters (e.g. of
+    the same parameter in several regions), converted into the unit (and, for
+    timeseries, time points) of a view.
+
+    The leaves are collected once and grouped by their timeseries conversion. Reading
+    then needs one stacked array and one weighted sum (the unit scalings) per group,
+    and one timeseries conversion per group rather than per leaf, as the conversion is
+    linear. The sum is cached until any of the leaves is written to (see
+    :func:`openscm.parameters._Parameter.increment_version`).
+    """
+
+    __slots__ = ("_groups", "_parameters", "_value", "_version")
+
+    _parameters: Sequence[_Parameter]
+    """Aggregated parameters"""
+
+    _groups: List[
+        Tuple[List[_Parameter], np.ndarray, float, Optional[TimeseriesConverter]]
+    ]
+    """
+    Leaves, their unit scalings, the sum of their unit offsets and their timeseries
+    converter (``None`` for scalars) per group of leaves
+    """
+
+    _version: Optional[int]
+    """Version (see :attr:`version`) the cached sum is valid for"""
+
+    _value: Union[None, float, np.ndarray]
+    """Cached sum"""
+
+    def __init__(
+        self,
+        parameters: Sequence[_Parameter],
+        unit: str,
+        get_timeseries_converter_for_leaf: Optional[
+            Callable[[_Parameter], TimeseriesConverter]
+        ] = None,
+    ):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        parameters
+            Aggregated parameters
+        unit
+            Unit of the sum
+        get_timeseries_converter_for_leaf
+            Function returning the timeseries converter for a leaf parameter (only for
+            timeseries)
+        """
+        self._parameters = parameters
+        self._version = None
+        self._value = None
+
+        groups: Dict[
+            Optional[TimeseriesConverter], Tuple[List[_Parameter], List[float], float]
+        ] = {}
+        for leaf in (leaf for p in parameters for leaf in _get_leaf_parameters(p)):
+            unit_converter = get_unit_converter(cast(str, leaf._info._unit), unit)
+            timeseries_converter = (
+                None
+                if get_timeseries_converter_for_leaf is None
+                else get_timeseries_converter_for_leaf(leaf)
+            )
+            leaves, scalings, offset = groups.get(timeseries_converter, ([], [], 0.0))
+            leaves.append(leaf)
+            scalings.append(unit_converter._scaling)
+            groups[timeseries_converter] = (
+                leaves,
+                scalings,
+                offset + unit_converter._offset,
+            )
+        self._groups = [
+            (leaves, np.array(scalings), offset, timeseries_converter)
+            for timeseries_converter, (leaves, scalings, offset) in groups.items()
+        ]
+
+    def get(self) -> Union[float, np.ndarray]:
+        """
+        Get the (cached) sum.
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Sum of the values of all leaves
+
+        Raises
+        ------
+        ParameterEmptyError
+            A leaf parameter is empty, i.e. has not yet been written to
+        """
+        version = self.version
+        if self._version == version:
+            return cast(Union[float, np.ndarray], self._value)
+
+        res: Union[float, np.ndarray] = 0.0
+        for leaves, scalings, offset, timeseries_converter in self._groups:
+            if not all(leaf._has_been_written_to for leaf in leaves):
+                raise ParameterEmptyError
+            if timeseries_converter is None:
+                res += float(
+                    scalings @ np.array([leaf._data for leaf in leaves], dtype=float)
+                )
+                res += offset
+            else:
+                values = scalings @ np.stack(
+                    [cast(np.ndarray, leaf._data) for leaf in leaves]
+                )
+                if offset:
+                    values += offset
+                res = res + timeseries_converter.convert_from(values)
+
+        self._version = version
+        self._value = res
+        return res
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the aggregated data, increasing with every write to any of the
+        leaves
+        """
+        if len(self._parameters) == 1:
+            return self._parameters[0]._version
+        return sum(p._version for p in self._parameters)
+
+
 class ParameterView:
     """
     Generic view to a :ref:`parameter <parameters>` (scalar or timeseries).
     """
 
+    __slots__ = ("_parameter",)
+
     _parameter: _Parameter
     """Parameter"""
 
@@ -51,13 +220,20 @@ class ScalarView(ParameterView):
     Read-only view of a scalar parameter.
     """
 
-    _child_data_views: Sequence["ScalarView"]
-    """List of views to the child parameters for aggregated reads"""
+    __slots__ = ("_aggregation", "_unit_converter")
+
+    _aggregation: Optional[_Aggregation]
+    """Aggregation of the child parameters (``None`` if there are none)"""
 
     _unit_converter: UnitConverter
     """Unit converter"""
 
-    def __init__(self, parameter: _Parameter, unit: str):
+    def __init__(
+        self,
+        parameter: _Parameter,
+        unit: str,
+        aggregated: Optional[Sequence[_Parameter]] = None,
+    ):
         """
         Initialize.
 
@@ -67,27 +243,19 @@ class ScalarView(ParameterView):
             Parameter
         unit
             Unit for the values in the view
+        aggregated
+            Parameters whose sum to view instead of ``parameter`` (defaults to
+            ``parameter`` itself if it has child parameters)
         """
         super().__init__(parameter)
-        self._unit_converter = UnitConverter(cast(str, parameter._info._unit), unit)
-
-        def get_data_views_for_children_or_parameter(
-            parameter: _Parameter
-        ) -> Sequence["ScalarView"]:
-            if parameter._children:
-                return sum(
-                    (
-                        get_data_views_for_children_or_parameter(p)
-                        for p in parameter._children.values()
-                    ),
-                    [],
-                )
-            return [ScalarView(parameter, self._unit_converter._target)]
-
-        if self._parameter._children:
-            self._child_data_views = get_data_views_for_children_or_parameter(
-                self._parameter
-            )
+        if aggregated is None and parameter._children:
+            aggregated = [parameter]
+        self._unit_converter = get_unit_converter(
+            cast(str, self._parameter._info._unit), unit
+        )
+        self._aggregation = (
+            None if aggregated is None else _Aggregation(aggregated, unit)
+        )
 
     def get(self) -> float:
         """
@@ -107,8 +275,8 @@ class ScalarView(ParameterView):
         ParameterEmptyError
             Parameter is empty, i.e. has not yet been written to
         """
-        if self._parameter._children:
-            return sum(v.get() for v in self._child_data_views)
+        if self._aggregation is not None:
+            return cast(float, self._aggregation.get())
         if self.is_empty:
             raise ParameterEmptyError
 
@@ -120,6 +288,8 @@ class WritableScalarView(ScalarView):
     View of a scalar parameter whose value can be changed.
     """
 
+    __slots__ = ()
+
     def set(self, value: float) -> None:
         """
         Set current value of scalar parameter.
@@ -130,6 +300,7 @@ class WritableScalarView(ScalarView):
             Value
         """
         self._parameter._data = self._unit_converter.convert_to(value)
+        self._parameter.increment_version()
 
 
 class TimeseriesView(ParameterView):
@@ -137,8 +308,18 @@ class TimeseriesView(ParameterView):
     Read-only :class:`ParameterView` of a timeseries.
     """
 
-    _child_data_views: Sequence["TimeseriesView"]
-    """List of views to the child parameters for aggregated reads"""
+    __slots__ = (
+        "_aggregation",
+        "_convert_from",
+        "_convert_to",
+        "_timeseries_converter",
+        "_unit_converter",
+        "_values",
+        "_version",
+    )
+
+    _aggregation: Optional[_Aggregation]
+    """Aggregation of the child parameters (``None`` if there are none)"""
 
     _timeseries_converter: TimeseriesConverter
     """Timeseries converter"""
@@ -146,6 +327,23 @@ class TimeseriesView(ParameterView):
     _unit_converter: UnitConverter
     """Unit converter"""
 
+    _convert_from: Optional[Callable[[np.ndarray], np.ndarray]]
+    """
+    Conversion from parameter to view time points and unit (``None`` if aggregating)
+    """
+
+    _convert_to: Optional[Callable[[np.ndarray], np.ndarray]]
+    """
+    Conversion from view to parameter time points and unit (built on first write as
+    only writable views need it and it may not exist, e.g. for a zero scaling)
+    """
+
+    _version: Optional[int]
+    """Version of the parameter :attr:`_values` are valid for"""
+
+    _values: Optional[np.ndarray]
+    """Memoized (read-only) values of the last read"""
+
     def __init__(
         self,
         parameter: _Parameter,
@@ -154,6 +352,7 @@ class TimeseriesView(ParameterView):
         timeseries_type: ParameterType,
         interpolation_type: InterpolationType,
         extrapolation_type: ExtrapolationType,
+        aggregated: Optional[Sequence[_Parameter]] = None,
     ):
         """
         Initialize.
@@ -172,43 +371,37 @@ class TimeseriesView(ParameterView):
             Interpolation type
         extrapolation_type
             Extrapolation type
+        aggregated
+            Parameters whose sum to view instead of ``parameter`` (defaults to
+            ``parameter`` itself if it has child parameters)
         """
         super().__init__(parameter)
-        self._unit_converter = UnitConverter(cast(str, parameter._info._unit), unit)
-        self._timeseries_converter = TimeseriesConverter(
-            parameter._info._time_points,
+        if aggregated is None and parameter._children:
+            aggregated = [parameter]
+        self._unit_converter = get_unit_converter(
+            cast(str, self._parameter._info._unit), unit
+        )
+        self._timeseries_converter = get_timeseries_converter(
+            cast(np.ndarray, self._parameter._info._time_points),
             time_points,
             timeseries_type,
             interpolation_type,
             extrapolation_type,
-        )  # TimeseriesConverter
-
-        def get_data_views_for_children_or_parameter(
-            parameter: _Parameter
-        ) -> Sequence["TimeseriesView"]:
-            if parameter._children:
-                return sum(
-                    (
-                        get_data_views_for_children_or_parameter(p)
-                        for p in parameter._children.values()
-                    ),
-                    [],
-                )
-            return [
-                TimeseriesView(
-                    parameter,
-                    self._unit_converter._target,
-                    self._timeseries_converter._target,
-                    timeseries_type,
-                    interpolation_type,
-                    extrapolation_type,
-                )
-            ]
-
-        if self._parameter._children:
-            self._child_data_views = get_data_views_for_children_or_parameter(
-                self._parameter
+        )
+        self._convert_to = None
+        self._version = None
+        self._values = None
+
+        if aggregated is None:
+            self._aggregation = None
+            self._convert_from = _get_timeseries_conversion(
+                self._timeseries_converter, self._unit_converter, False
+            )
+        else:
+            self._aggregation = _Aggregation(
+                aggregated, unit, self._get_leaf_timeseries_converter
             )
+            self._convert_from = None
 
     def get(self) -> Sequence[float]:
         """
@@ -218,6 +411,10 @@ class TimeseriesView(ParameterView):
         the returned value will be the sum of the values of all of the child
         parameters.
 
+        The values are memoized until the parameter (or any of its child parameters)
+        is written to, so repeated reads of unchanged parameters do not convert again.
+        The returned array is hence read-only.
+
         Returns
         -------
         Sequence[float]
@@ -228,18 +425,39 @@ class TimeseriesView(ParameterView):
         ParameterEmptyError
             Parameter is empty, i.e. has not yet been written to
         """
-        if self._parameter._children:
-            return cast(Sequence[float], sum(v.get() for v in self._child_data_views))
-        if self.is_empty:
-            raise ParameterEmptyError
+        version = (
+            self._parameter._version
+            if self._aggregation is None
+            else self._aggregation.version
+        )
+        if self._version == version:
+            return cast(Sequence[float], self._values)
+
+        if self._aggregation is not None:
+            values = cast(np.ndarray, self._aggregation.get())
+        else:
+            if self.is_empty:
+                raise ParameterEmptyError
+            values = cast(Callable[[np.ndarray], np.ndarray], self._convert_from)(
+                cast(np.ndarray, self._parameter._data)
+            )
+        values.flags.writeable = False
 
-        return cast(
-            Sequence[float],
-            self._timeseries_converter.convert_from(
-                self._unit_converter.convert_from(
-                    cast(Sequence[float], self._parameter._data)
-                )
-            ),
+        self._version = version
+        self._values = values
+        return cast(Sequence[float], values)
+
+    def _get_leaf_timeseries_converter(self, leaf: _Parameter) -> TimeseriesConverter:
+        """
+        Get the timeseries converter from the time points of an aggregated leaf
+        parameter to the time points of the view.
+        """
+        return get_timeseries_converter(
+            cast(np.ndarray, leaf._info._time_points),
+            self._timeseries_converter._target,
+            self._timeseries_converter._timeseries_type,
+            self._timeseries_converter._interpolation_type,
+            self._timeseries_converter._extrapolation_type,
         )
 
     @property
@@ -255,6 +473,8 @@ class WritableTimeseriesView(TimeseriesView):
     View of a timeseries whose values can be changed.
     """
 
+    __slots__ = ()
+
     def set(self, values: Sequence[float]) -> None:
         """
         Set value for whole time series.
@@ -271,8 +491,95 @@ class WritableTimeseriesView(TimeseriesView):
         """
         if len(values) != self._timeseries_converter.target_length:
             raise TimeseriesPointsValuesMismatchError
-        self._parameter._data = self._timeseries_converter.convert_to(
-            self._unit_converter.convert_to(values)
+        if self._convert_to is None:
+            self._convert_to = _get_timeseries_conversion(
+                self._timeseries_converter, self._unit_converter, True
+            )
+        # written in place as the data may be a row of a block (see
+        # :class:`openscm.parameters.TimeseriesBlock`)
+        cast(np.ndarray, self._parameter._data)[:] = self._convert_to(
+            cast(np.ndarray, values)
+        )
+        self._parameter.increment_version()
+
+
+class RegionAggregatedScalarView(ScalarView):
+    """
+    Read-only view of the sum of a scalar parameter over regions.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, parameters: Sequence[_Parameter], unit: str):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        parameters
+            The parameter in each of the aggregated regions
+        unit
+            Unit for the values in the view
+
+        Raises
+        ------
+        ParameterEmptyError
+            No parameters given, i.e. the parameter is in none of the regions
+        """
+        if not parameters:
+            raise ParameterEmptyError("Parameter is in none of the regions")
+        super().__init__(parameters[0], unit, parameters)
+
+
+class RegionAggregatedTimeseriesView(TimeseriesView):
+    """
+    Read-only view of the sum of a timeseries parameter over regions.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        parameters: Sequence[_Parameter],
+        unit: str,
+        time_points: np.ndarray,
+        timeseries_type: ParameterType,
+        interpolation_type: InterpolationType,
+        extrapolation_type: ExtrapolationType,
+    ):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        parameters
+            The parameter in each of the aggregated regions
+        unit
+            Unit for the values in the view
+        time_points
+            Timeseries time points
+        timeseries_type
+            Time series type
+        interpolation_type
+            Interpolation type
+        extrapolation_type
+            Extrapolation type
+
+        Raises
+        ------
+        ParameterEmptyError
+            No parameters given, i.e. the parameter is in none of the regions
+        """
+        if not parameters:
+            raise ParameterEmptyError("Parameter is in none of the regions")
+        super().__init__(
+            parameters[0],
+            unit,
+            time_points,
+            timeseries_type,
+            interpolation_type,
+            extrapolation_type,
+            parameters,
         )
 
 
@@ -281,6 +588,8 @@ class GenericView(ParameterView):
     Read-only view of a generic parameter.
     """
 
+    __slots__ = ()
+
     def get(self) -> Any:
         """
         Get current value of generic parameter.
@@ -306,6 +615,8 @@ class WritableGenericView(GenericView):
     View of a generic parameter whose value can be changed.
     """
 
+    __slots__ = ()
+
     def set(self, value: bool) -> None:
         """
         Set current value of boolean parameter.
@@ -2,8 +2,22 @@
 Parameter handling.
 """
 
+import sys
+from contextlib import contextmanager
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union, cast
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 
@@ -33,11 +47,20 @@ class ParameterType(Enum):
     GENERIC = 4
 
 
+_NO_CHILDREN: Mapping[str, "_Parameter"] = MappingProxyType({})
+"""
+Children of parameters without children (shared, as most parameters are leaves of the
+parameter hierarchy)
+"""
+
+
 class ParameterInfo:
     """
     Information for a :ref:`parameter <parameters>`.
     """
 
+    __slots__ = ("_name", "_region", "_time_points", "_type", "_unit")
+
     _name: str
     """Name"""
 
@@ -64,7 +87,8 @@ class ParameterInfo:
         region
             Region
         """
-        self._name = name
+        # names repeat across regions, so share the strings
+        self._name = sys.intern(name)
         self._region = region
         self._time_points = None
         self._type = None
@@ -105,10 +129,20 @@ class _Parameter:
     <parameter-hierarchy>`.
     """
 
-    _children: Dict[str, "_Parameter"]
+    __slots__ = (
+        "_children",
+        "_data",
+        "_has_been_read_from",
+        "_has_been_written_to",
+        "_info",
+        "_parent",
+        "_version",
+    )
+
+    _children: Mapping[str, "_Parameter"]
     """Child parameters"""
 
-    _data: Union[None, bool, float, str, Sequence[float]]
+    _data: Union[None, bool, float, str, Sequence[float], np.ndarray]
     """Data"""
 
     _has_been_read_from: bool
@@ -123,6 +157,12 @@ class _Parameter:
     _parent: Optional["_Parameter"]
     """Parent parameter"""
 
+    _version: int
+    """
+    Number of changes to the data of this parameter or any of its descendants (for
+    invalidating cached reads)
+    """
+
     def __init__(self, name: str, region: "regions._Region"):
         """
         Initialize.
@@ -132,11 +172,12 @@ class _Parameter:
         name
             Name
         """
-        self._children = {}
+        self._children = _NO_CHILDREN
         self._has_been_read_from = False
         self._has_been_written_to = False
         self._info = ParameterInfo(name, region)
         self._parent = None
+        self._version = 0
 
     def get_or_create_child_parameter(self, name: str) -> "_Parameter":
         """
@@ -174,7 +215,9 @@ class _Parameter:
                 raise ParameterReadError
             res = _Parameter(name, self._info._region)
             res._parent = self
-            self._children[name] = res
+            if not self._children:
+                self._children = {}
+            cast(Dict[str, _Parameter], self._children)[name] = res
         return res
 
     def get_subparameter(self, name: Tuple[str, ...]) -> Optional["_Parameter"]:
@@ -206,6 +249,7 @@ class _Parameter:
         parameter_type: ParameterType,
         unit: Optional[str] = None,
         time_points: Optional[np.ndarray] = None,
+        storage: Optional["_TimeseriesStorage"] = None,
     ) -> None:
         """
         Tell parameter that it will be read from. If the parameter has child parameters
@@ -220,6 +264,9 @@ class _Parameter:
             Unit to be read; only for scalar and timeseries parameters
         time_points
             Timeseries time points; only for timeseries parameters
+        storage
+            Block storage to keep the data in; only for timeseries parameters (if not
+            given, the data is kept in an array of its own)
 
         Raises
         ------
@@ -241,15 +288,17 @@ class _Parameter:
                     raise ParameterAggregationError
                 self._data = None
             else:  # parameter is a timeseries
-                self._data = np.full(
-                    (
-                        (len(time_points) - 1)  # type: ignore
-                        if parameter_type == ParameterType.AVERAGE_TIMESERIES
-                        else len(time_points)  # type: ignore
-                    ),
-                    float("NaN"),
-                )
                 self._info._time_points = np.array(time_points, copy=True)
+                if storage is not None and not self._children:
+                    # aggregated parameters are never written to
+                    storage.add(self)
+                else:
+                    self._data = np.full(
+                        _get_timeseries_length(
+                            parameter_type, cast(np.ndarray, time_points)
+                        ),
+                        float("NaN"),
+                    )
         self._has_been_read_from = True
 
     def attempt_write(
@@ -257,6 +306,7 @@ class _Parameter:
         parameter_type: ParameterType,
         unit: Optional[str] = None,
         time_points: Optional[np.ndarray] = None,
+        storage: Optional["_TimeseriesStorage"] = None,
     ) -> None:
         """
         Tell parameter that its data will be written to.
@@ -269,6 +319,9 @@ class _Parameter:
             Unit to be written; only for scalar and timeseries parameters
         time_points
             Timeseries time points; only for timeseries parameters
+        storage
+            Block storage to keep the data in; only for timeseries parameters (if not
+            given, the data is kept in an array of its own)
 
         Raises
         ------
@@ -277,9 +330,19 @@ class _Parameter:
         """
         if self._children:
             raise ParameterReadonlyError
-        self.attempt_read(parameter_type, unit, time_points)
+        self.attempt_read(parameter_type, unit, time_points, storage)
         self._has_been_written_to = True
 
+    def increment_version(self) -> None:
+        """
+        Tell parameter that its data has been changed, invalidating cached reads of it
+        and of its (aggregated) ancestors.
+        """
+        p: Optional["_Parameter"] = self
+        while p is not None:
+            p._version += 1
+            p = p._parent
+
     @property
     def full_name(self) -> Tuple[str]:
         """
@@ -305,3 +368,208 @@ class _Parameter:
         Parent parameter
         """
         return self._parent
+
+
+def _get_timeseries_length(
+    parameter_type: ParameterType, time_points: np.ndarray
+) -> int:
+    """
+    Get the number of values of a timeseries.
+    """
+    if parameter_type == ParameterType.AVERAGE_TIMESERIES:
+        return len(time_points) - 1
+    return len(time_points)
+
+
+class TimeseriesBlock:
+    """
+    Timeseries parameters of the same type and time points stored as the rows of one
+    contiguous array.
+
+    The data of each parameter in the block is a view to its row, so whole-set
+    operations (and serialization) can work on the block directly: :attr:`data` for
+    reading and :func:`modify` for writing.
+
+    When a parameter is added to a full block, the data of all parameters is moved
+    to a larger array. Arrays obtained from :attr:`data` before then keep the old
+    values and are not updated anymore. Adding parameters while the block is being
+    modified would lose the modifications and hence raises an error.
+    """
+
+    __slots__ = (
+        "_data",
+        "_modifying",
+        "_parameters",
+        "_parameter_type",
+        "_time_points",
+    )
+
+    _data: np.ndarray
+    """Array holding the data of the parameters (and some spare rows to grow into)"""
+
+    _modifying: bool
+    """Whether the block is being modified (see :func:`modify`)"""
+
+    _parameters: List[_Parameter]
+    """Parameters in the order of their rows"""
+
+    _parameter_type: ParameterType
+    """Time series type"""
+
+    _time_points: np.ndarray
+    """Timeseries time points"""
+
+    def __init__(self, parameter_type: ParameterType, time_points: np.ndarray):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        parameter_type
+            Time series type
+        time_points
+            Timeseries time points
+        """
+        self._parameter_type = parameter_type
+        self._time_points = np.array(time_points, copy=True)
+        self._parameters = []
+        self._modifying = False
+        self._data = np.full(
+            (1, _get_timeseries_length(parameter_type, time_points)), float("NaN")
+        )
+
+    def add(self, parameter: _Parameter) -> None:
+        """
+        Add a parameter to the block and make its data a view to a new row.
+
+        Parameters
+        ----------
+        parameter
+            Parameter to add
+
+        Raises
+        ------
+        RuntimeError
+            The block is being modified (see :func:`modify`)
+        """
+        if self._modifying:
+            raise RuntimeError("Cannot add parameters to a block being modified")
+        rows = len(self._parameters)
+        if rows == len(self._data):
+            # grow geometrically and rebind the existing parameters to the new rows
+            data = np.full((2 * rows, self._data.shape[1]), float("NaN"))
+            data[:rows] = self._data
+            self._data = data
+            for row, p in enumerate(self._parameters):
+                p._data = data[row]
+        parameter._data = self._data[rows]
+        self._parameters.append(parameter)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        Data of all parameters in the block (one row per parameter, in the order of
+        :attr:`parameter_infos`)
+
+        The returned array is read-only (use :func:`modify` to change the data) and
+        only reflects the data until parameters are added to the block.
+        """
+        data = self._data[: len(self._parameters)]
+        data.flags.writeable = False
+        return data
+
+    @contextmanager
+    def modify(self) -> Iterator[np.ndarray]:
+        """
+        Context manager for changing the data of all parameters in the block.
+
+        Cached reads of the parameters are invalidated when the context is left, so
+        the yielded array is made read-only then. No parameters can be added to the
+        block within the context.
+
+        Yields
+        ------
+        np.ndarray
+            Writable data of all parameters in the block (one row per parameter, in
+            the order of :attr:`parameter_infos`)
+
+        Raises
+        ------
+        RuntimeError
+            The block is already being modified
+        """
+        if self._modifying:
+            raise RuntimeError("Block is already being modified")
+        data = self._data[: len(self._parameters)]
+        self._modifying = True
+        try:
+            yield data
+        finally:
+            self._modifying = False
+            data.flags.writeable = False
+            for p in self._parameters:
+                p.increment_version()
+
+    @property
+    def parameter_infos(self) -> Sequence[ParameterInfo]:
+        """
+        Information about the parameters in the block
+        """
+        return [p._info for p in self._parameters]
+
+    @property
+    def parameter_type(self) -> ParameterType:
+        """
+        Time series type
+        """
+        return self._parameter_type
+
+    @property
+    def time_points(self) -> np.ndarray:
+        """
+        Timeseries time points
+        """
+        return self._time_points
+
+
+class _TimeseriesStorage:
+    """
+    Block storage for timeseries parameters, keeping all timeseries of the same type
+    and time points in one :class:`TimeseriesBlock`.
+    """
+
+    __slots__ = ("_blocks",)
+
+    _blocks: Dict[Tuple[ParameterType, bytes], TimeseriesBlock]
+    """Blocks by time series type and time points"""
+
+    def __init__(self) -> None:
+        """
+        Initialize.
+        """
+        self._blocks = {}
+
+    def add(self, parameter: _Parameter) -> None:
+        """
+        Add a timeseries parameter to the block for its type and time points.
+
+        Parameters
+        ----------
+        parameter
+            Parameter to add (its type and time points need to be set already)
+        """
+        parameter_type = cast(ParameterType, parameter._info._type)
+        time_points = cast(np.ndarray, parameter._info._time_points)
+        key = (parameter_type, np.asarray(time_points, dtype=float).tobytes())
+        block = self._blocks.get(key, None)
+        if block is None:
+            block = TimeseriesBlock(parameter_type, time_points)
+            self._blocks[key] = block
+        block.add(parameter)
+
+    @property
+    def blocks(self) -> Sequence[TimeseriesBlock]:
+        """
+        All blocks
+        """
+        return list(self._blocks.values())
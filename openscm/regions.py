@@ -2,7 +2,7 @@
 Handling of region information.
 """
 
-from typing import Dict, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 from . import parameters
 from .errors import RegionAggregatedError
@@ -16,6 +16,8 @@ class _Region:
     Represents a region in the region hierarchy.
     """
 
+    __slots__ = ("_children", "_has_been_aggregated", "_name", "_parameters", "_parent")
+
     _children: Dict[str, "_Region"]
     """Subregions"""
 
@@ -156,6 +158,29 @@ class _Region:
         """
         self._has_been_aggregated = True
 
+    def attempt_aggregate_subregions(self) -> List["_Region"]:
+        """
+        Tell region that one of its parameters will be read from in an aggregated way
+        over all regions below it, so that no subregions can be added anywhere below
+        it anymore.
+
+        Returns
+        -------
+        List[_Region]
+            Regions without subregions below this region (or this region if it has no
+            subregions)
+        """
+        leaves = []
+        regions = [self]
+        while regions:
+            region = regions.pop()
+            region.attempt_aggregate()
+            if region._children:
+                regions.extend(reversed(list(region._children.values())))
+            else:
+                leaves.append(region)
+        return leaves
+
     @property
     def full_name(self) -> Tuple[str]:
         """
@@ -9,17 +9,22 @@ this module. A thorough explaination of the procedure used is given in a dedicat
 """
 
 from enum import Enum
-from typing import Any, Callable, Dict
+from functools import lru_cache
+from math import factorial
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
 
 import numpy as np
-import scipy.integrate as integrate
-import scipy.interpolate as interpolate
+import scipy.sparse as sparse
+import scipy.sparse.linalg as sparse_linalg
 
-from .errors import InsufficientDataError
+from .errors import InsufficientDataError, TimeseriesPointsValuesMismatchError
 from .parameters import ParameterType
 
 # pylint: disable=too-many-arguments
 
+_TIMESERIES_CONVERTER_CACHE_SIZE = 1024
+"""Maximum number of timeseries converters kept by :func:`get_timeseries_converter`"""
+
 
 class ExtrapolationType(Enum):
     """
@@ -29,7 +34,7 @@ class ExtrapolationType(Enum):
     NONE = -1
     CONSTANT = 0
     LINEAR = 1
-    # TODO support CUBIC = 3
+    CUBIC = 3
 
 
 class InterpolationType(Enum):
@@ -38,7 +43,7 @@ class InterpolationType(Enum):
     """
 
     LINEAR = 1
-    # TODO support CUBIC = 3
+    CUBIC = 3
 
 
 def create_time_points(
@@ -72,14 +77,53 @@ def create_time_points(
     return np.linspace(start_time, end_time_output, points_num_output)
 
 
+def _calc_linearization_points(time_points: np.ndarray) -> np.ndarray:
+    """
+    Calculate the points at which the integral preserving linear interpolation (see
+    :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`)
+    of a timeseries with time points ``time_points`` changes its slope, i.e. the
+    period edges and the period middles.
+
+    Parameters
+    ----------
+    time_points
+        Time points of the timeseries (edges of the periods)
+
+    Returns
+    -------
+    np.ndarray
+        Linearization points (of length ``2 * len(time_points) - 1``)
+    """
+    return (
+        np.concatenate(
+            (
+                # [time_points[0] - (time_points[1] - time_points[0]) / 2],
+                time_points,
+                (time_points[1:] + time_points[:-1]) / 2,
+                [0],
+            )
+        )
+        .reshape((2, len(time_points)))
+        .T.flatten()[:-1]
+    )
+
+
 def _calc_interval_averages(
-    continuous_representation: Callable[[float], float], target_intervals: np.ndarray
+    continuous_representation: Callable[[np.ndarray], np.ndarray],
+    linearization_points: np.ndarray,
+    target_intervals: np.ndarray,
 ) -> np.ndarray:
     """
     Calculate the interval averages of a continuous function.
 
     Here interval average is calculated as the integral over the period divided by
-    the period length.
+    the period length. As the continuous representation is linear between
+    ``linearization_points`` (and so is its extrapolation beyond them), the integral is
+    calculated exactly: the cumulative integral at each target interval edge is the
+    cumulative integral at the last linearization point before it plus the integral of
+    the linear piece in between (given by the midpoint rule). Differencing at the
+    target edges then gives the interval integrals. This avoids numerical integration
+    and is fully vectorized.
 
     Parameters
     ----------
@@ -87,24 +131,45 @@ def _calc_interval_averages(
         Continuous function from which to calculate the interval averages. Should be
         calculated using
         :func:`openscm.timeseries_converter.TimeseriesConverter._calc_continuous_representation`.
+    linearization_points
+        Points between which ``continuous_representation`` is linear (see
+        :func:`openscm.timeseries_converter._calc_linearization_points`)
     target_intervals
         Intervals to calculate the average of.
 
     Returns
     -------
     np.ndarray
-        Array of the interval/period averages
+        Array of the interval/period averages (along the last axis if
+        ``continuous_representation`` represents several timeseries)
     """
-    # TODO: numerical integration here could be very expensive
-    # TODO: update to include caching and/or analytic solutions depending on
-    # TODO:     interpolation choice
-    int_averages = [np.nan] * len(target_intervals[:-1])
-    for i, l in enumerate(target_intervals[:-1]):
-        u = target_intervals[i + 1]
-        y, _ = integrate.quad(continuous_representation, l, u)
-        int_averages[i] = y / (u - l)
+    linearization_values = continuous_representation(linearization_points)
+    linearization_integrals = np.zeros(linearization_values.shape)
+    np.cumsum(
+        np.diff(linearization_points)
+        * (linearization_values[..., 1:] + linearization_values[..., :-1])
+        / 2,
+        axis=-1,
+        out=linearization_integrals[..., 1:],
+    )
+
+    # index of the last linearization point left of each target edge; edges outside
+    # the linearization points are attributed to the first or last point as the
+    # continuous representation is extrapolated linearly (or constantly) there
+    idx = np.clip(
+        np.searchsorted(linearization_points, target_intervals, side="right") - 1,
+        0,
+        len(linearization_points) - 1,
+    )
+    # the midpoint rule is exact for linear pieces and also holds for constant
+    # extrapolation, which is discontinuous at the first and last linearization point
+    target_integrals = linearization_integrals[..., idx] + (
+        target_intervals - linearization_points[idx]
+    ) * continuous_representation((target_intervals + linearization_points[idx]) / 2)
 
-    return np.array(int_averages)
+    return cast(
+        np.ndarray, np.diff(target_integrals, axis=-1) / np.diff(target_intervals)
+    )
 
 
 def _calc_integral_preserving_linear_interpolation(values: np.ndarray) -> np.ndarray:
@@ -117,41 +182,995 @@ def _calc_integral_preserving_linear_interpolation(values: np.ndarray) -> np.nda
     Parameters
     ----------
     values
-        Timeseries values of period averages
+        Timeseries values of period averages (along the last axis, further axes
+        are treated as separate timeseries)
 
     Returns
     -------
     np.ndarray
-        Values of linearization (of length ``2 * len(values) + 1``)
+        Values of linearization (of length ``2 * len(values) + 1`` along the last
+        axis)
     """
-    edge_point_values = (values[1:] + values[:-1]) / 2
+    edge_point_values = (values[..., 1:] + values[..., :-1]) / 2
     middle_point_values = (
-        4 * values[1:-1] - edge_point_values[:-1] - edge_point_values[1:]
+        4 * values[..., 1:-1] - edge_point_values[..., :-1] - edge_point_values[..., 1:]
     ) / 2
     # values = (
     #   1 / 2 * (edges_lower + middle_point_values) * 1 /2
     #   + 1 / 2 * (middle_point_values + edges_upper)
     # ) / 2
     first_edge_point_value = (
-        2 * values[0] - edge_point_values[0]
+        2 * values[..., :1] - edge_point_values[..., :1]
     )  # values[0] = (first_edge_point_value + edge_point_values[0]) / 2
     last_edge_point_value = (
-        2 * values[-1] - edge_point_values[-1]
+        2 * values[..., -1:] - edge_point_values[..., -1:]
     )  # values[-1] = (last_edge_point_value + edge_point_values[-1]) / 2
-    return np.concatenate(
+
+    res = np.empty(values.shape[:-1] + (2 * values.shape[-1] + 1,))
+    res[..., 0::2] = np.concatenate(
+        (first_edge_point_value, edge_point_values, last_edge_point_value), axis=-1
+    )
+    res[..., 1::2] = np.concatenate(
+        (values[..., :1], middle_point_values, values[..., -1:]), axis=-1
+    )
+    return res
+
+
+def _is_outside(points: np.ndarray, target_points: np.ndarray) -> bool:
+    """
+    Check whether any of ``target_points`` is outside of ``points``.
+
+    Parameters
+    ----------
+    points
+        Points (sorted ascendingly)
+    target_points
+        Points to check
+
+    Returns
+    -------
+    bool
+        ``True`` if any target point is before the first or after the last point
+    """
+    return bool(np.any(target_points < points[0]) or np.any(target_points > points[-1]))
+
+
+def _calc_interpolation_brackets(
+    points: np.ndarray, target_points: np.ndarray, extrapolation_type: ExtrapolationType
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the brackets for linearly interpolating values given at ``points`` to
+    ``target_points``.
+
+    Each target point is given by the index of the point bracketing it from below and
+    the weight of the point bracketing it from above, so that interpolating reduces to
+    a gather and a fused multiply-add (see
+    :func:`openscm.timeseries_converter._interpolate_linearly`). Target points outside
+    of ``points`` are extrapolated from the first or last two points or, for
+    ``ExtrapolationType.CONSTANT``, get the first or last value. Whether target points
+    are outside of ``points`` for ``ExtrapolationType.NONE`` has to be checked by the
+    caller (see :func:`openscm.timeseries_converter._is_outside`).
+
+    Parameters
+    ----------
+    points
+        Points at which the values are given (sorted ascendingly)
+    target_points
+        Points to interpolate to
+    extrapolation_type
+        Extrapolation type
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the lower bracketing points
+    np.ndarray
+        Weights of the upper bracketing points
+    """
+    idx = np.clip(
+        np.searchsorted(points, target_points, side="right") - 1, 0, len(points) - 2
+    )
+    weights = (target_points - points[idx]) / (points[idx + 1] - points[idx])
+    if extrapolation_type == ExtrapolationType.CONSTANT:
+        weights = np.clip(weights, 0, 1)
+    return idx, weights
+
+
+def _interpolate_linearly(
+    values: np.ndarray, idx: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Linearly interpolate ``values`` using precomputed brackets (see
+    :func:`openscm.timeseries_converter._calc_interpolation_brackets`).
+
+    Parameters
+    ----------
+    values
+        Values (along the last axis)
+    idx
+        Indices of the lower bracketing points
+    weights
+        Weights of the upper bracketing points
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated values (along the last axis)
+    """
+    lower = values[..., idx]
+    return cast(np.ndarray, lower + weights * (values[..., idx + 1] - lower))
+
+
+def _calc_linear_interpolation_matrix(
+    points: np.ndarray, target_points: np.ndarray, extrapolation_type: ExtrapolationType
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse matrix which linearly interpolates values given at ``points``
+    to ``target_points``.
+
+    Each row has (at most) two non-zero entries, the weights of the points bracketing
+    the respective target point (see
+    :func:`openscm.timeseries_converter._calc_interpolation_brackets`).
+
+    Parameters
+    ----------
+    points
+        Points at which the values are given (sorted ascendingly)
+    target_points
+        Points to interpolate to
+    extrapolation_type
+        Extrapolation type
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Interpolation matrix of shape ``(len(target_points), len(points))``
+
+    Raises
+    ------
+    ValueError
+        Target points are outside of ``points`` and ``extrapolation_type`` is
+        ``ExtrapolationType.NONE``
+    """
+    if extrapolation_type == ExtrapolationType.NONE and _is_outside(
+        points, target_points
+    ):
+        raise ValueError("Target points outside of interpolation range")
+
+    idx, weights = _calc_interpolation_brackets(
+        points, target_points, extrapolation_type
+    )
+
+    return sparse.csr_matrix(
+        (
+            np.concatenate((1 - weights, weights)),
+            (np.tile(np.arange(len(target_points)), 2), np.concatenate((idx, idx + 1))),
+        ),
+        shape=(len(target_points), len(points)),
+    )
+
+
+def _calc_integral_preserving_linear_interpolation_matrix(
+    values_num: int,
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse matrix representation of
+    :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`,
+    i.e. the matrix mapping ``values_num`` period averages to the values of their
+    linearization.
+
+    Parameters
+    ----------
+    values_num
+        Number of period averages (at least 2)
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Linearization matrix of shape ``(2 * values_num + 1, values_num)``
+    """
+    i = np.arange(values_num)
+    inner = i[1:-1]
+    rows = np.concatenate(
+        (
+            # edge points between two periods are the averages of both
+            2 * i[1:],
+            2 * i[1:],
+            # middle points of inner periods
+            2 * inner + 1,
+            2 * inner + 1,
+            2 * inner + 1,
+            # middle points of first and last period
+            [1, 2 * values_num - 1],
+            # first and last edge point
+            [0, 0, 2 * values_num, 2 * values_num],
+        )
+    )
+    cols = np.concatenate(
         (
+            i[:-1],
+            i[1:],
+            inner - 1,
+            inner,
+            inner + 1,
+            [0, values_num - 1],
+            [0, 1, values_num - 1, values_num - 2],
+        )
+    )
+    data = np.concatenate(
+        (
+            np.full(values_num - 1, 1 / 2),
+            np.full(values_num - 1, 1 / 2),
+            np.full(values_num - 2, -1 / 4),
+            np.full(values_num - 2, 3 / 2),
+            np.full(values_num - 2, -1 / 4),
+            [1, 1],
+            [3 / 2, -1 / 2, 3 / 2, -1 / 2],
+        )
+    )
+    return sparse.csr_matrix(
+        (data, (rows, cols)), shape=(2 * values_num + 1, values_num)
+    )
+
+
+def _calc_interval_averages_matrix(
+    time_points: np.ndarray,
+    target_intervals: np.ndarray,
+    extrapolation_type: ExtrapolationType,
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse matrix mapping period averages for the periods given by
+    ``time_points`` to the averages over the periods given by ``target_intervals``.
+
+    This is the matrix representation of
+    :func:`openscm.timeseries_converter._calc_interval_averages` applied to the
+    integral preserving linear interpolation of the values (see
+    :func:`._calc_integral_preserving_linear_interpolation`).
+    Each row only contains the linearization points within the respective target
+    interval (and their neighbours), so the number of non-zero entries is of order
+    ``len(time_points) + len(target_intervals)``.
+
+    Parameters
+    ----------
+    time_points
+        Time points of the source timeseries (edges of the periods)
+    target_intervals
+        Time points of the target timeseries (edges of the periods)
+    extrapolation_type
+        Extrapolation type
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Conversion matrix of shape
+        ``(len(target_intervals) - 1, len(time_points) - 1)``
+
+    Raises
+    ------
+    ValueError
+        Target intervals are outside of the source periods and ``extrapolation_type``
+        is ``ExtrapolationType.NONE``
+    """
+    values_num = len(time_points) - 1
+    linearization_points = _calc_linearization_points(time_points)
+    linearization_matrix = _calc_integral_preserving_linear_interpolation_matrix(
+        values_num
+    )
+
+    # integral over each linear piece of the linearization (trapezoidal rule)
+    segment_matrix = (
+        sparse.diags(np.diff(linearization_points) / 2)
+        @ (
+            sparse.eye(len(linearization_points) - 1, len(linearization_points))
+            + sparse.eye(len(linearization_points) - 1, len(linearization_points), k=1)
+        )
+        @ linearization_matrix
+    )
+
+    # as in ``_calc_interval_averages``, the integral up to each target edge is the
+    # sum over the full pieces left of it plus the integral of the partial piece
+    idx = np.clip(
+        np.searchsorted(linearization_points, target_intervals, side="right") - 1,
+        0,
+        len(linearization_points) - 1,
+    )
+    summation_matrix = sparse.csr_matrix(
+        (
+            np.ones(idx[-1] - idx[0]),
+            (
+                np.repeat(np.arange(len(target_intervals) - 1), np.diff(idx)),
+                np.arange(idx[0], idx[-1]),
+            ),
+        ),
+        shape=(len(target_intervals) - 1, len(linearization_points) - 1),
+    )
+
+    midpoints = (target_intervals + linearization_points[idx]) / 2
+    if extrapolation_type == ExtrapolationType.CONSTANT:
+        # constant extrapolation uses the first and last period average rather than
+        # the first and last linearization value
+        before = midpoints < linearization_points[0]
+        after = midpoints > linearization_points[-1]
+        outside = before | after
+        midpoint_matrix = sparse.diags((~outside).astype(float)) @ (
+            _calc_linear_interpolation_matrix(
+                linearization_points, midpoints, ExtrapolationType.CONSTANT
+            )
+            @ linearization_matrix
+        ) + sparse.csr_matrix(
+            (
+                np.ones(outside.sum()),
+                (np.where(outside)[0], np.where(before[outside], 0, values_num - 1)),
+            ),
+            shape=(len(midpoints), values_num),
+        )
+    else:
+        midpoint_matrix = (
+            _calc_linear_interpolation_matrix(
+                linearization_points, midpoints, extrapolation_type
+            )
+            @ linearization_matrix
+        )
+    partial_matrix = (
+        sparse.diags(target_intervals - linearization_points[idx]) @ midpoint_matrix
+    )
+
+    return sparse.csr_matrix(
+        sparse.diags(1 / np.diff(target_intervals))
+        @ (summation_matrix @ segment_matrix + partial_matrix[1:] - partial_matrix[:-1])
+    )
+
+
+def _get_regular_period(time_points: np.ndarray) -> Optional[float]:
+    """
+    Get the period length of equidistant time points.
+
+    Parameters
+    ----------
+    time_points
+        Time points
+
+    Returns
+    -------
+    Optional[float]
+        Period length or ``None`` if the time points are not equidistant
+    """
+    periods = np.diff(time_points)
+    if len(periods) == 0 or not np.allclose(periods, periods[0], rtol=1e-9, atol=0):
+        return None
+    return float(periods[0])
+
+
+def _get_integer(value: float) -> Optional[int]:
+    """
+    Get ``value`` as an integer if it is one (up to floating point precision).
+
+    Parameters
+    ----------
+    value
+        Value
+
+    Returns
+    -------
+    Optional[int]
+        Integer value or ``None`` if ``value`` is not an integer
+    """
+    res = int(round(value))
+    if abs(value - res) > 1e-9 * max(1, abs(value)):
+        return None
+    return res
+
+
+def _calc_regular_average_refinement_weights(ratio: int) -> np.ndarray:
+    """
+    Calculate the weights of three consecutive periods for the averages over their
+    sub-periods when splitting each of them into ``ratio`` equally long sub-periods.
+
+    As the integral preserving linear interpolation within a period only depends on
+    the period itself and its two neighbours, these weights are the same for all inner
+    periods of an equidistant timeseries (and differ only for the first and the last
+    period).
+
+    Parameters
+    ----------
+    ratio
+        Number of sub-periods per period
+
+    Returns
+    -------
+    np.ndarray
+        Weights of shape ``(3 * ratio, 3)``, the first ``ratio`` rows for the
+        sub-periods of the first period, the next ``ratio`` rows for those of an inner
+        period and the last ``ratio`` rows for those of the last period
+    """
+    linearization_points = np.linspace(0, 3, 7)
+    linearizations = _calc_integral_preserving_linear_interpolation(np.eye(3))
+    return _calc_interval_averages(
+        lambda x: np.array(
+            [
+                np.interp(x, linearization_points, linearization)
+                for linearization in linearizations
+            ]
+        ),
+        linearization_points,
+        np.linspace(0, 3, 3 * ratio + 1),
+    ).T
+
+
+def _calc_regular_conversion_matrix(
+    source_time_points: np.ndarray,
+    target_time_points: np.ndarray,
+    timeseries_type: ParameterType,
+) -> Optional[sparse.csr_matrix]:
+    """
+    Calculate the conversion matrix for equidistant time points directly.
+
+    If source and target time points are both equidistant, one period length is an
+    integer multiple of the other, the target time points are aligned with the finer of
+    both and lie within the source time points (so that no extrapolation is needed),
+    each target value is a fixed linear combination of a fixed number of source values
+    (an average of ``ratio`` values when coarsening and a combination of the two or
+    three neighbouring values when refining). The matrix can then be set up directly
+    rather than as the product of the matrices of the single conversion steps (see
+    :func:`openscm.timeseries_converter._calc_interval_averages_matrix` and
+    :func:`openscm.timeseries_converter._calc_linear_interpolation_matrix`), which is
+    much faster and gives the same matrix up to floating point precision.
+
+    Parameters
+    ----------
+    source_time_points
+        Source timeseries time points
+    target_time_points
+        Target timeseries time points
+    timeseries_type
+        Time series type
+
+    Returns
+    -------
+    Optional[sparse.csr_matrix]
+        Conversion matrix or ``None`` if the time points do not allow for this
+        shortcut
+    """
+    source_period = _get_regular_period(source_time_points)
+    target_period = _get_regular_period(target_time_points)
+    if (
+        source_period is None
+        or target_period is None
+        or target_time_points[0] < source_time_points[0]
+        or target_time_points[-1] > source_time_points[-1]
+    ):
+        return None
+
+    average = timeseries_type == ParameterType.AVERAGE_TIMESERIES
+    source_num = len(source_time_points) - (1 if average else 0)
+    target_num = len(target_time_points) - (1 if average else 0)
+    coarsening_ratio = _get_integer(target_period / source_period)
+    refinement_ratio = _get_integer(source_period / target_period)
+
+    if coarsening_ratio is not None:
+        offset = _get_integer(
+            (target_time_points[0] - source_time_points[0]) / source_period
+        )
+        if offset is None:
+            return None
+        if average:
+            # mean over the ``coarsening_ratio`` source periods of each target period
+            rows = np.repeat(np.arange(target_num), coarsening_ratio)
+            columns = offset + np.arange(target_num * coarsening_ratio)
+            data = np.full(len(columns), 1 / coarsening_ratio)
+        else:
+            # every ``coarsening_ratio``-th source point
+            rows = np.arange(target_num)
+            columns = offset + coarsening_ratio * rows
+            data = np.ones(target_num)
+        return sparse.csr_matrix(
+            (data, (rows, columns)), shape=(target_num, source_num)
+        )
+
+    if refinement_ratio is not None:
+        offset = _get_integer(
+            (target_time_points[0] - source_time_points[0]) / target_period
+        )
+        if offset is None:
+            return None
+        refined = offset + np.arange(target_num)
+        period, sub_period = np.divmod(refined, refinement_ratio)
+        if average:
+            weights = _calc_regular_average_refinement_weights(refinement_ratio)
+            first_column = np.clip(period - 1, 0, source_num - 3)
+            block = np.where(period == 0, 0, np.where(period == source_num - 1, 2, 1))
+            row_weights = weights[block * refinement_ratio + sub_period]
+        else:
+            first_column = np.minimum(period, source_num - 2)
+            upper_weight = (refined - first_column * refinement_ratio) / (
+                refinement_ratio
+            )
+            row_weights = np.stack((1 - upper_weight, upper_weight), axis=-1)
+        return sparse.csr_matrix(
+            (
+                row_weights.ravel(),
+                (first_column[:, np.newaxis] + np.arange(row_weights.shape[1])).ravel(),
+                np.arange(target_num + 1) * row_weights.shape[1],
+            ),
+            shape=(target_num, source_num),
+        )
+
+    return None
+
+
+def _calc_cubic_spline_system(
+    points: np.ndarray,
+) -> Tuple[sparse_linalg.SuperLU, sparse.csr_matrix]:
+    """
+    Calculate the linear system determining the second derivatives of the cubic spline
+    through values given at ``points``.
+
+    The second derivatives ``m`` of the spline at ``points`` are the solution of
+    ``A m = B y`` for values ``y``, where the inner rows ensure continuous first
+    derivatives and the first and last rows are the "not-a-knot" conditions (continuous
+    third derivatives at the second and the second to last point). ``A`` is banded, so
+    it is factorized once per set of points and each spline only needs a
+    back-substitution.
+
+    Parameters
+    ----------
+    points
+        Points at which the values are given (sorted ascendingly, at least three)
+
+    Returns
+    -------
+    sparse_linalg.SuperLU
+        Factorization of ``A``
+    sparse.csr_matrix
+        ``B``
+    """
+    points_num = len(points)
+    periods = np.diff(points)
+    inner = np.arange(1, points_num - 1)
+
+    # continuous first derivatives at inner points
+    rows = [np.repeat(inner, 3)]
+    columns = [(inner[:, np.newaxis] + np.arange(-1, 2)).ravel()]
+    system_data = [
+        np.stack(
+            (periods[:-1] / 6, (periods[:-1] + periods[1:]) / 3, periods[1:] / 6),
+            axis=-1,
+        ).ravel()
+    ]
+    rhs_data = np.stack(
+        (1 / periods[:-1], -1 / periods[:-1] - 1 / periods[1:], 1 / periods[1:]),
+        axis=-1,
+    ).ravel()
+
+    # not-a-knot conditions (for three points, both reduce to a parabola)
+    rows.append(np.zeros(3, dtype=int))
+    columns.append(np.arange(3))
+    system_data.append(
+        np.array([1 / periods[0], -1 / periods[0] - 1 / periods[1], 1 / periods[1]])
+    )
+    rows.append(np.full(3, points_num - 1))
+    if points_num == 3:
+        columns.append(np.arange(3))
+        system_data.append(np.array([0, 1, -1]))
+    else:
+        columns.append(np.arange(points_num - 3, points_num))
+        system_data.append(
             np.array(
-                [
-                    np.concatenate(([first_edge_point_value], edge_point_values)),
-                    np.concatenate(([values[0]], middle_point_values, [values[-1]])),
+                [1 / periods[-2], -1 / periods[-2] - 1 / periods[-1], 1 / periods[-1]]
+            )
+        )
+
+    system_matrix = sparse.csc_matrix(
+        (np.concatenate(system_data), (np.concatenate(rows), np.concatenate(columns))),
+        shape=(points_num, points_num),
+    )
+    rhs_matrix = sparse.csr_matrix(
+        (rhs_data, (rows[0], columns[0])), shape=(points_num, points_num)
+    )
+    return sparse_linalg.splu(system_matrix), rhs_matrix
+
+
+def _calc_cubic_spline_coefficients(
+    lower_weights: np.ndarray,
+    upper_weights: np.ndarray,
+    periods: np.ndarray,
+    derivative: int,
+) -> np.ndarray:
+    """
+    Calculate the coefficients of a derivative of a cubic spline.
+
+    Within each interval, the ``derivative``-th derivative of the spline is a linear
+    combination of the values and of the second derivatives at both interval edges.
+
+    Parameters
+    ----------
+    lower_weights
+        Relative distances of the evaluation points to the upper interval edges
+    upper_weights
+        Relative distances of the evaluation points to the lower interval edges
+    periods
+        Interval lengths
+    derivative
+        Order of the derivative (``0`` for the spline itself)
+
+    Returns
+    -------
+    np.ndarray
+        Coefficients of the lower and upper values and of the lower and upper second
+        derivatives (along the last axis)
+    """
+    if derivative == 0:
+        return np.stack(
+            (
+                lower_weights,
+                upper_weights,
+                (lower_weights ** 3 - lower_weights) * periods ** 2 / 6,
+                (upper_weights ** 3 - upper_weights) * periods ** 2 / 6,
+            ),
+            axis=-1,
+        )
+    if derivative == 1:
+        return np.stack(
+            (
+                -1 / periods,
+                1 / periods,
+                (1 - 3 * lower_weights ** 2) * periods / 6,
+                (3 * upper_weights ** 2 - 1) * periods / 6,
+            ),
+            axis=-1,
+        )
+    zeros = np.zeros(len(periods))
+    if derivative == 2:
+        return np.stack((zeros, zeros, lower_weights, upper_weights), axis=-1)
+    if derivative == 3:
+        return np.stack((zeros, zeros, -1 / periods, 1 / periods), axis=-1)
+
+    return np.zeros((len(periods), 4))
+
+
+def _calc_cubic_spline_matrix(
+    points: np.ndarray,
+    target_points: np.ndarray,
+    extrapolation_type: ExtrapolationType,
+    integral: bool = False,
+    derivative: int = 0,
+) -> sparse.csr_matrix:
+    """
+    Calculate the sparse matrix evaluating the cubic spline given by the values and
+    second derivatives at ``points`` at ``target_points``.
+
+    Target points outside of ``points`` are extrapolated with the first or last cubic
+    piece (``ExtrapolationType.CUBIC``), or its Taylor expansion at the first or last
+    point (``ExtrapolationType.LINEAR``, ``ExtrapolationType.CONSTANT``). If the spline
+    is the cumulative integral of a timeseries (``integral`` is ``True``), the
+    extrapolation types refer to its derivative, i.e. to the timeseries itself, which is
+    then extrapolated with the first or last period average for
+    ``ExtrapolationType.CONSTANT``. Whether target points are outside of ``points`` for
+    ``ExtrapolationType.NONE`` has to be checked by the caller.
+
+    Parameters
+    ----------
+    points
+        Points at which the values are given (sorted ascendingly)
+    target_points
+        Points to evaluate the spline at
+    extrapolation_type
+        Extrapolation type
+    integral
+        Whether the spline is the cumulative integral of the timeseries
+    derivative
+        Order of the derivative of the spline to evaluate
+
+    Returns
+    -------
+    sparse.csr_matrix
+        Matrix of shape ``(len(target_points), 2 * len(points))`` acting on the values
+        stacked onto the second derivatives
+    """
+    idx, upper_weights = _calc_interpolation_brackets(
+        points, target_points, ExtrapolationType.LINEAR
+    )
+    periods = np.diff(points)[idx]
+    coefficients = _calc_cubic_spline_coefficients(
+        1 - upper_weights, upper_weights, periods, derivative
+    )
+
+    if extrapolation_type != ExtrapolationType.CUBIC:
+        taylor_order = {ExtrapolationType.CONSTANT: 0, ExtrapolationType.LINEAR: 1}.get(
+            extrapolation_type, 1
+        ) + (1 if integral else 0)
+        for outside, end, end_weight in [
+            (target_points < points[0], points[0], 0.0),
+            (target_points > points[-1], points[-1], 1.0),
+        ]:
+            if not np.any(outside):
+                continue
+            distances = (target_points[outside] - end)[:, np.newaxis]
+            end_weights = np.full(outside.sum(), end_weight)
+            end_periods = periods[outside]
+            if integral and extrapolation_type == ExtrapolationType.CONSTANT:
+                # the slope of the integral is the first or last period average
+                end_coefficients = [
+                    _calc_cubic_spline_coefficients(
+                        1 - end_weights, end_weights, end_periods, 0
+                    ),
+                    np.stack(
+                        (
+                            -1 / end_periods,
+                            1 / end_periods,
+                            np.zeros(len(end_periods)),
+                            np.zeros(len(end_periods)),
+                        ),
+                        axis=-1,
+                    ),
+                ]
+            else:
+                end_coefficients = [
+                    _calc_cubic_spline_coefficients(
+                        1 - end_weights, end_weights, end_periods, order
+                    )
+                    for order in range(taylor_order + 1)
                 ]
-            ).T.reshape(2 * len(values)),
-            [last_edge_point_value],
+            coefficients[outside] = sum(
+                end_coefficients[order]
+                * distances ** (order - derivative)
+                / factorial(order - derivative)
+                for order in range(derivative, len(end_coefficients))
+            )
+
+    return sparse.csr_matrix(
+        (
+            coefficients.ravel(),
+            np.stack(
+                (idx, idx + 1, len(points) + idx, len(points) + idx + 1), axis=-1
+            ).ravel(),
+            np.arange(len(target_points) + 1) * 4,
+        ),
+        shape=(len(target_points), 2 * len(points)),
+    )
+
+
+def _calc_cubic_spline_conversion_operator(
+    time_points: np.ndarray,
+    target_time_points: np.ndarray,
+    timeseries_type: ParameterType,
+    extrapolation_type: ExtrapolationType,
+) -> sparse_linalg.LinearOperator:
+    """
+    Calculate the linear operator converting timeseries data for timeseries time points
+    ``time_points`` to ``target_time_points`` using cubic splines.
+
+    Point timeseries are interpolated with the cubic spline through their values. For
+    average timeseries, the cubic spline through the cumulative integral of the
+    timeseries at the period edges is differenced at the target period edges, which
+    preserves the integral over each source period. The spline system is factorized
+    once, so applying the operator only needs a back-substitution and sparse products.
+
+    Parameters
+    ----------
+    time_points
+        Source timeseries time points
+    target_time_points
+        Target timeseries time points
+    timeseries_type
+        Time series type
+    extrapolation_type
+        Extrapolation type (target time points outside of ``time_points`` for
+        ``ExtrapolationType.NONE`` have to be checked by the caller)
+
+    Returns
+    -------
+    sparse_linalg.LinearOperator
+        Conversion operator acting on the timeseries values along the first axis
+    """
+    points_num = len(time_points)
+    integral = timeseries_type == ParameterType.AVERAGE_TIMESERIES
+    spline_system, rhs_matrix = _calc_cubic_spline_system(time_points)
+    evaluation_matrix = _calc_cubic_spline_matrix(
+        time_points, target_time_points, extrapolation_type, integral=integral
+    )
+    if integral:
+        # differences of the cumulative integral divided by the target period lengths
+        evaluation_matrix = sparse.csr_matrix(
+            sparse.diags(1 / np.diff(target_time_points))
+            @ (
+                sparse.eye(len(target_time_points) - 1, len(target_time_points), k=1)
+                - sparse.eye(len(target_time_points) - 1, len(target_time_points))
+            )
+            @ evaluation_matrix
         )
+    value_matrix = evaluation_matrix[:, :points_num]
+    second_derivative_matrix = evaluation_matrix[:, points_num:]
+    periods = np.diff(time_points)
+
+    def convert(values: np.ndarray) -> np.ndarray:
+        if integral:
+            spline_values = np.zeros((points_num,) + values.shape[1:])
+            np.cumsum(
+                values * periods.reshape((-1,) + (1,) * (values.ndim - 1)),
+                axis=0,
+                out=spline_values[1:],
+            )
+        else:
+            spline_values = values
+        return cast(
+            np.ndarray,
+            value_matrix.dot(spline_values)
+            + second_derivative_matrix.dot(
+                spline_system.solve(np.asarray(rhs_matrix.dot(spline_values)))
+            ),
+        )
+
+    return sparse_linalg.LinearOperator(
+        shape=(evaluation_matrix.shape[0], points_num - (1 if integral else 0)),
+        matvec=convert,
+        matmat=convert,
+        dtype=float,
     )
 
 
-class TimeseriesConverter:
+class IncrementalTimeseriesConversion:
+    """
+    Incremental conversion of a timeseries whose values become available one after
+    another (e.g. during step-wise model runs).
+
+    Each call of :func:`append` takes the source values appended since the last call
+    and returns only the target values which have become determinable, i.e. whose
+    conversion only depends on source values received so far. Only the tail of the
+    source values still needed for the remaining target values is kept, so each call
+    only costs in the order of the number of values appended and returned rather than
+    of the length of the whole timeseries.
+
+    Create via :func:`TimeseriesConverter.create_incremental_conversion`.
+    """
+
+    _conversion_matrix: sparse.csr_matrix
+    """Conversion matrix"""
+
+    _required_lengths: np.ndarray
+    """
+    Number of source values needed to determine each target value (and all target
+    values before it)
+    """
+
+    _first_needed: np.ndarray
+    """
+    Index of the first source value needed by each target value or any target value
+    after it (with the number of source values appended for the final entry)
+    """
+
+    _tail: Optional[np.ndarray]
+    """Source values still needed for target values not yet returned"""
+
+    _tail_start: int
+    """Index of the first source value in ``_tail``"""
+
+    _received_length: int
+    """Number of source values received so far"""
+
+    _converted_length: int
+    """Number of target values returned so far"""
+
+    def __init__(self, conversion_matrix: sparse.csr_matrix):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        conversion_matrix
+            Conversion matrix (see :func:`TimeseriesConverter._calc_conversion_matrix`)
+        """
+        self._conversion_matrix = sparse.csr_matrix(conversion_matrix)
+        self._conversion_matrix.sort_indices()
+        indptr = self._conversion_matrix.indptr
+        indices = self._conversion_matrix.indices
+        target_length, source_length = self._conversion_matrix.shape
+        nonempty = np.diff(indptr) > 0
+
+        # indices are sorted within rows, so the first and last entries of each row
+        # are its first and last needed source values
+        last_needed = np.full(target_length, -1)
+        last_needed[nonempty] = indices[indptr[1:][nonempty] - 1]
+        self._required_lengths = np.maximum.accumulate(last_needed) + 1
+
+        first_needed = np.full(target_length + 1, source_length)
+        first_needed[:-1][nonempty] = indices[indptr[:-1][nonempty]]
+        self._first_needed = np.minimum.accumulate(first_needed[::-1])[::-1]
+
+        self._tail = None
+        self._tail_start = 0
+        self._received_length = 0
+        self._converted_length = 0
+
+    def append(self, values: np.ndarray) -> np.ndarray:
+        """
+        Append source values and get the newly determinable target values.
+
+        Parameters
+        ----------
+        values
+            Source values appended since the last call (along the last axis, further
+            leading axes for several timeseries at once must stay the same between
+            calls)
+
+        Returns
+        -------
+        np.ndarray
+            Target values which have become determinable (along the last axis, possibly
+            empty)
+
+        Raises
+        ------
+        TimeseriesPointsValuesMismatchError
+            More values appended than the source timeseries has
+        """
+        values = np.asarray(values, dtype=float)
+        if self._received_length + values.shape[-1] > self.source_length:
+            raise TimeseriesPointsValuesMismatchError
+        if self._tail is None:
+            self._tail = np.empty(values.shape[:-1] + (0,))
+        self._tail = np.concatenate((self._tail, values), axis=-1)
+        self._received_length += values.shape[-1]
+
+        start = self._converted_length
+        end = int(
+            np.searchsorted(self._required_lengths, self._received_length, side="right")
+        )
+        if end == start:
+            return np.empty(values.shape[:-1] + (0,))
+
+        indptr = self._conversion_matrix.indptr[start : end + 1]
+        res: np.ndarray = (
+            sparse.csr_matrix(
+                (
+                    self._conversion_matrix.data[indptr[0] : indptr[-1]],
+                    self._conversion_matrix.indices[indptr[0] : indptr[-1]]
+                    - self._tail_start,
+                    indptr - indptr[0],
+                ),
+                shape=(end - start, self._tail.shape[-1]),
+            )
+            .dot(self._tail.T)
+            .T
+        )
+        self._converted_length = end
+
+        tail_start = min(int(self._first_needed[end]), self._received_length)
+        self._tail = self._tail[..., tail_start - self._tail_start :]
+        self._tail_start = tail_start
+
+        return res
+
+    @property
+    def source_length(self) -> int:
+        """
+        Length of source timeseries
+        """
+        return int(self._conversion_matrix.shape[1])
+
+    @property
+    def target_length(self) -> int:
+        """
+        Length of target timeseries
+        """
+        return int(self._conversion_matrix.shape[0])
+
+    @property
+    def received_length(self) -> int:
+        """
+        Number of source values received so far
+        """
+        return self._received_length
+
+    @property
+    def converted_length(self) -> int:
+        """
+        Number of target values returned so far
+        """
+        return self._converted_length
+
+
+class TimeseriesConverter:  # pylint: disable=too-many-instance-attributes
     """
     Converts timeseries and their points between two timeseriess (each defined by a time
     of the first point and a period length).
@@ -172,6 +1191,27 @@ class TimeseriesConverter:
     _extrapolation_type: ExtrapolationType
     """Extrapolation type"""
 
+    _conversion_matrix_from: Optional[
+        Union[sparse.csr_matrix, sparse_linalg.LinearOperator]
+    ]
+    """
+    Precomputed matrix (or, for cubic interpolation, linear operator) converting from
+    source to target timeseries (``None`` if the conversion is not possible)
+    """
+
+    _conversion_matrix_to: Optional[
+        Union[sparse.csr_matrix, sparse_linalg.LinearOperator]
+    ]
+    """
+    Precomputed matrix (or, for cubic interpolation, linear operator) converting from
+    target to source timeseries (``None`` if the conversion is not possible)
+    """
+
+    _affine_conversions: Dict[
+        Tuple[float, float, bool], Callable[[np.ndarray], np.ndarray]
+    ]
+    """Conversions created by :func:`create_affine_conversion` by their arguments"""
+
     def __init__(
         self,
         source_time_points: np.ndarray,
@@ -200,29 +1240,140 @@ class TimeseriesConverter:
         ------
         InsufficientDataError
             Timeseries too short to extrapolate
+
+        ValueError
+            Cubic extrapolation of linearly interpolated timeseries requested
         """
+        if (
+            interpolation_type == InterpolationType.LINEAR
+            and extrapolation_type == ExtrapolationType.CUBIC
+        ):
+            # cubic extrapolation continues the first and last piece of the cubic
+            # spline, which a linear interpolation does not have
+            raise ValueError(
+                "Cubic extrapolation continues the cubic spline interpolation and is "
+                "hence only possible with cubic interpolation"
+            )
+
         self._source = np.array(source_time_points, copy=True)
         self._target = np.array(target_time_points, copy=True)
         self._timeseries_type = timeseries_type
         self._interpolation_type = interpolation_type
         self._extrapolation_type = extrapolation_type
+        self._affine_conversions = {}
 
         if (
             source_time_points[0] > target_time_points[1]
         ):  # TODO Consider extrapolation type
             raise InsufficientDataError
 
+        self._conversion_matrix_from = self._calc_conversion_matrix(
+            self._source, self._target
+        )
+        self._conversion_matrix_to = self._calc_conversion_matrix(
+            self._target, self._source
+        )
+
+    def _calc_conversion_matrix(
+        self, source_time_points: np.ndarray, target_time_points: np.ndarray
+    ) -> Optional[Union[sparse.csr_matrix, sparse_linalg.LinearOperator]]:
+        """
+        Calculate the sparse matrix converting timeseries data for timeseries time
+        points ``source_time_points`` to the time points ``target_time_points``.
+
+        As all supported conversions are linear in the timeseries values, this matrix
+        only needs to be calculated once per pair of time points. Converting is then a
+        single sparse matrix-vector product. For equidistant time points the matrix is
+        set up directly (see
+        :func:`openscm.timeseries_converter._calc_regular_conversion_matrix`). Cubic
+        interpolation needs to solve for the spline, so a linear operator with the
+        factorized spline system is returned instead (see
+        :func:`openscm.timeseries_converter._calc_cubic_spline_conversion_operator`).
+
+        Parameters
+        ----------
+        source_time_points
+            Source timeseries time points
+        target_time_points
+            Target timeseries time points
+
+        Returns
+        -------
+        Optional[Union[sparse.csr_matrix, sparse_linalg.LinearOperator]]
+            Conversion matrix (or operator) or ``None`` if the source timeseries is too
+            short or the target time points are outside the source time points and
+            ``self._extrapolation_type`` is ``ExtrapolationType.None`` (in which case
+            :func:`_convert` raises the respective error)
+        """
+        if (
+            len(source_time_points)
+            - (1 if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0)
+            < 3
+        ):
+            return None
+
+        if self._extrapolation_type == ExtrapolationType.NONE and _is_outside(
+            source_time_points, target_time_points
+        ):
+            return None
+
+        if self._interpolation_type == InterpolationType.CUBIC:
+            return _calc_cubic_spline_conversion_operator(
+                source_time_points,
+                target_time_points,
+                self._timeseries_type,
+                self._extrapolation_type,
+            )
+
+        return self._calc_linear_conversion_matrix(
+            source_time_points, target_time_points
+        )
+
+    def _calc_linear_conversion_matrix(
+        self, source_time_points: np.ndarray, target_time_points: np.ndarray
+    ) -> sparse.csr_matrix:
+        """
+        Calculate the sparse matrix converting timeseries data for timeseries time
+        points ``source_time_points`` to the time points ``target_time_points`` using
+        linear interpolation.
+
+        Parameters
+        ----------
+        source_time_points
+            Source timeseries time points
+        target_time_points
+            Target timeseries time points
+
+        Returns
+        -------
+        sparse.csr_matrix
+            Conversion matrix
+        """
+        res = _calc_regular_conversion_matrix(
+            source_time_points, target_time_points, self._timeseries_type
+        )
+        if res is not None:
+            return res
+
+        if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+            return _calc_interval_averages_matrix(
+                source_time_points, target_time_points, self._extrapolation_type
+            )
+
+        return _calc_linear_interpolation_matrix(
+            source_time_points, target_time_points, self._extrapolation_type
+        )
+
     def _calc_continuous_representation(
-        # TODO remove when NotImplementedError removed:
         # pylint: disable=missing-raises-doc
         self,
         time_points: np.ndarray,
         values: np.ndarray,
-    ) -> Callable[[float], float]:
+    ) -> Callable[[np.ndarray], np.ndarray]:
         """
         Calculate a "continuous" representation of a timeseries (see
-        :func:`openscm.timeseries_converter._calc_integral_preserving_linear_interpolation`)
-        with the time points ``time_points`` and values ``values``.
+        :func:`._calc_integral_preserving_linear_interpolation`) with the time points
+        ``time_points`` and values ``values``.
 
         Parameters
         ----------
@@ -233,61 +1384,95 @@ class TimeseriesConverter:
 
         Returns
         -------
-        Callable[[float], float]
+        Callable[[np.ndarray], np.ndarray]
             Function that represents the interpolated timeseries. It takes a single
             argument, time ("x-value"), and returns a single float, the value of the
-            interpolated timeseries at that point in time ("y-value").
+            interpolated timeseries at that point in time ("y-value"). Points outside
+            of ``time_points`` are extrapolated according to
+            ``self._extrapolation_type`` (whether extrapolation is allowed at all is
+            checked by :func:`_convert`).
         """
-        if (self._timeseries_type == ParameterType.AVERAGE_TIMESERIES) and (
-            self._interpolation_type == InterpolationType.LINEAR
-        ):
-            # our custom implementation of a mean preserving linear interpolation
-            linearization_points = (
-                np.concatenate(
-                    (
-                        # [time_points[0] - (time_points[1] - time_points[0]) / 2],
+        if self._interpolation_type == InterpolationType.CUBIC:
+            # for average timeseries, the spline through the cumulative integral at the
+            # period edges, its derivative then represents the timeseries
+            integral = self._timeseries_type == ParameterType.AVERAGE_TIMESERIES
+            if integral:
+                spline_values = np.zeros(values.shape[:-1] + (len(time_points),))
+                np.cumsum(
+                    values * np.diff(time_points), axis=-1, out=spline_values[..., 1:]
+                )
+            else:
+                spline_values = values
+            spline_system, rhs_matrix = _calc_cubic_spline_system(time_points)
+            spline_coefficients = np.concatenate(
+                (
+                    spline_values,
+                    spline_system.solve(np.asarray(rhs_matrix.dot(spline_values.T))).T,
+                ),
+                axis=-1,
+            )
+
+            def res_cubic(x: np.ndarray) -> np.ndarray:
+                x = np.asarray(x)
+                res = (
+                    _calc_cubic_spline_matrix(
                         time_points,
-                        (time_points[1:] + time_points[:-1]) / 2,
-                        [0],
+                        np.atleast_1d(x),
+                        self._extrapolation_type,
+                        integral=integral,
+                        derivative=1 if integral else 0,
                     )
+                    .dot(spline_coefficients.T)
+                    .T
                 )
-                .reshape((2, len(time_points)))
-                .T.flatten()[:-1]
-            )
+                return cast(np.ndarray, res.reshape(res.shape[:-1] + x.shape))
+
+            return res_cubic
+
+        if self._interpolation_type != InterpolationType.LINEAR:
+            raise NotImplementedError
+
+        if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+            # our custom implementation of a mean preserving linear interpolation
+            linearization_points = _calc_linearization_points(time_points)
             linearization_values = _calc_integral_preserving_linear_interpolation(
                 values
             )
-            res_average = interpolate.interp1d(
-                linearization_points,
-                linearization_values,
-                kind=self._get_scipy_interpolation_arg(),
-                **self._get_scipy_extrapolation_args(values),
-            )  # type: Callable[[float], float]
+
+            def res_average(x: np.ndarray) -> np.ndarray:
+                x = np.asarray(x)
+                target_points = np.atleast_1d(x)
+                res = _interpolate_linearly(
+                    linearization_values,
+                    *_calc_interpolation_brackets(
+                        linearization_points, target_points, self._extrapolation_type
+                    )
+                )
+                if self._extrapolation_type == ExtrapolationType.CONSTANT:
+                    # extrapolate with the first and last period average rather than
+                    # the first and last linearization value
+                    res = np.where(
+                        target_points < linearization_points[0], values[..., :1], res
+                    )
+                    res = np.where(
+                        target_points > linearization_points[-1], values[..., -1:], res,
+                    )
+                return res.reshape(res.shape[:-1] + x.shape)
+
             return res_average
 
         if self._timeseries_type == ParameterType.POINT_TIMESERIES:
-            res_point = interpolate.interp1d(
-                time_points,
-                values,
-                kind=self._get_scipy_interpolation_arg(),
-                **self._get_scipy_extrapolation_args(values),
-            )  # type: Callable[[float], float]
-            return res_point
 
-        raise NotImplementedError
+            def res_point(x: np.ndarray) -> np.ndarray:
+                return _interpolate_linearly(
+                    values,
+                    *_calc_interpolation_brackets(
+                        time_points, np.asarray(x), self._extrapolation_type
+                    )
+                )
+
+            return res_point
 
-    def _get_scipy_extrapolation_args(self, values: np.ndarray) -> Dict[str, Any]:
-        if self._extrapolation_type == ExtrapolationType.LINEAR:
-            return {"fill_value": "extrapolate"}
-        if self._extrapolation_type == ExtrapolationType.CONSTANT:
-            return {"fill_value": (values[0], values[-1]), "bounds_error": False}
-        # TODO: add cubic support
-        return {}
-
-    def _get_scipy_interpolation_arg(self) -> str:
-        if self._interpolation_type == InterpolationType.LINEAR:
-            return "linear"
-        # TODO: add cubic support
         raise NotImplementedError
 
     def _convert(
@@ -295,22 +1480,28 @@ class TimeseriesConverter:
         values: np.ndarray,
         source_time_points: np.ndarray,
         target_time_points: np.ndarray,
+        conversion_matrix: Optional[sparse.csr_matrix] = None,
     ) -> np.ndarray:
         """
         Wrap ``self._convert_unsafe`` to provide proper error handling.
 
         ``self._convert_unsafe`` converts time period average timeseries data
         ``values`` for timeseries time points ``source_time_points`` to the time
-        points ``target_time_points``.
+        points ``target_time_points``. If a precomputed ``conversion_matrix`` is given,
+        it is used instead.
 
         Parameters
         ----------
         values
-            Array of data to convert
+            Array of data to convert (either a single timeseries or an array of shape
+            ``(n_series, n_time)`` of several timeseries)
         source_time_points
             Source timeseries time points
         target_time_points
             Target timeseries time points
+        conversion_matrix
+            Precomputed conversion matrix for ``source_time_points`` and
+            ``target_time_points`` (see :func:`_calc_conversion_matrix`)
 
         Raises
         ------
@@ -321,23 +1512,36 @@ class TimeseriesConverter:
             Target time points are outside the source time points and
             ``self._extrapolation_type`` is ``ExtrapolationType.None``
 
+        TimeseriesPointsValuesMismatchError
+            Length of ``values`` does not match ``conversion_matrix``
+
         Returns
         -------
         np.ndarray
-            Converted time period average data for timeseries ``target``
+            Converted time period average data for timeseries ``target`` (of the same
+            number of dimensions as ``values``)
         """
-        if len(values) < 3:
+        values = np.asarray(values)
+        if values.shape[-1] < 3:
             raise InsufficientDataError
 
-        try:
-            return self._convert_unsafe(values, source_time_points, target_time_points)
-        except ValueError:
+        if conversion_matrix is not None:
+            if values.shape[-1] != conversion_matrix.shape[1]:
+                raise TimeseriesPointsValuesMismatchError
+            # time is along the last axis, the matrix acts on the first
+            return cast(np.ndarray, conversion_matrix.dot(values.T).T)
+
+        if self._extrapolation_type == ExtrapolationType.NONE and _is_outside(
+            source_time_points, target_time_points
+        ):
             error_msg = (
                 "Target time points are outside the source time points, use an "
                 "extrapolation type other than None"
             )
             raise InsufficientDataError(error_msg)
 
+        return self._convert_unsafe(values, source_time_points, target_time_points)
+
     def _convert_unsafe(
         self,
         values: np.ndarray,
@@ -367,9 +1571,22 @@ class TimeseriesConverter:
         np.ndarray
             Converted time period average data for timeseries ``target``
         """
+        if self._interpolation_type == InterpolationType.CUBIC:
+            return cast(
+                np.ndarray,
+                _calc_cubic_spline_conversion_operator(
+                    source_time_points,
+                    target_time_points,
+                    self._timeseries_type,
+                    self._extrapolation_type,
+                )
+                .dot(values.T)
+                .T,
+            )
         if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES:
             return _calc_interval_averages(
                 self._calc_continuous_representation(source_time_points, values),
+                _calc_linearization_points(source_time_points),
                 target_time_points,
             )
         if self._timeseries_type == ParameterType.POINT_TIMESERIES:
@@ -394,7 +1611,9 @@ class TimeseriesConverter:
         np.ndarray
             Converted array
         """
-        return self._convert(values, self._source, self._target)
+        return self._convert(
+            values, self._source, self._target, self._conversion_matrix_from
+        )
 
     def convert_to(self, values: np.ndarray) -> np.ndarray:
         """
@@ -411,7 +1630,174 @@ class TimeseriesConverter:
         np.ndarray
             Converted array
         """
-        return self._convert(values, self._target, self._source)
+        return self._convert(
+            values, self._target, self._source, self._conversion_matrix_to
+        )
+
+    def create_incremental_conversion(
+        self, inverse: bool = False
+    ) -> IncrementalTimeseriesConversion:
+        """
+        Create an incremental conversion **from** source timeseries time points to
+        target timeseries time points (or, if ``inverse`` is ``True``, from target
+        timeseries time points **to** source timeseries time points).
+
+        The converter itself is shared (see :func:`get_timeseries_converter`), so the
+        state of the incremental conversion is kept in the returned object.
+
+        Parameters
+        ----------
+        inverse
+            If ``True``, convert from target to source timeseries time points
+
+        Returns
+        -------
+        IncrementalTimeseriesConversion
+            Incremental conversion
+
+        Raises
+        ------
+        InsufficientDataError
+            Timeseries too short to convert or target time points outside the source
+            time points and ``self._extrapolation_type`` is ``ExtrapolationType.None``
+
+        NotImplementedError
+            Incremental conversion of cubic interpolation requested (the spline
+            depends on all values of the timeseries)
+        """
+        if self._interpolation_type == InterpolationType.CUBIC:
+            raise NotImplementedError(
+                "Incremental conversion is only supported for linear interpolation"
+            )
+
+        conversion_matrix = (
+            self._conversion_matrix_to if inverse else self._conversion_matrix_from
+        )
+        if conversion_matrix is None:
+            raise InsufficientDataError
+
+        return IncrementalTimeseriesConversion(conversion_matrix)
+
+    def create_affine_conversion(
+        self, scaling: float, offset: float = 0.0, inverse: bool = False
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Create a conversion **from** source timeseries time points to target timeseries
+        time points (or, if ``inverse`` is ``True``, from target timeseries time points
+        **to** source timeseries time points) of the values ``scaling * values +
+        offset`` (e.g. of values converted into another unit).
+
+        As the conversion is linear in the values, converting the transformed values is
+        the same as transforming the converted values, i.e. :math:`M (s v + o) = s M v
+        + o M 1`. The scaling is hence folded into a copy of the conversion matrix and
+        the offset into a precomputed vector, so that the returned function needs a
+        single pass over the values (and a single allocation for the result).
+        Conversions are kept by the converter, so the same conversion is returned for
+        the same arguments.
+
+        Parameters
+        ----------
+        scaling
+            Factor to scale the values with before the conversion
+        offset
+            Offset to add to the values before the conversion
+        inverse
+            If ``True``, convert from target to source timeseries time points
+
+        Returns
+        -------
+        Callable[[np.ndarray], np.ndarray]
+            Function converting (a single or several) timeseries, raising the same
+            errors as :func:`convert_from` and :func:`convert_to`
+        """
+        key = (scaling, offset, inverse)
+        conversion = self._affine_conversions.get(key)
+        if conversion is None:
+            conversion = self._affine_conversions.setdefault(
+                key, self._create_affine_conversion(scaling, offset, inverse)
+            )
+
+        return conversion
+
+    def _create_affine_conversion(
+        self, scaling: float, offset: float, inverse: bool
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Create a conversion of the values ``scaling * values + offset`` (see
+        :func:`create_affine_conversion`).
+        """
+        if inverse:
+            source, target = self._target, self._source
+            conversion_matrix = self._conversion_matrix_to
+        else:
+            source, target = self._source, self._target
+            conversion_matrix = self._conversion_matrix_from
+
+        if conversion_matrix is None:
+            # the conversion fails anyway, leave raising the error to ``_convert``
+            def convert_unfused(values: np.ndarray) -> np.ndarray:
+                return self._convert(
+                    scaling * np.asarray(values) + offset, source, target
+                )
+
+            return convert_unfused
+
+        offset_values = (
+            conversion_matrix.dot(np.full(conversion_matrix.shape[1], float(offset)))
+            if offset
+            else None
+        )
+        if isinstance(conversion_matrix, sparse.spmatrix):
+            conversion_matrix = conversion_matrix * scaling
+            scaling = 1.0
+
+        def convert(values: np.ndarray) -> np.ndarray:
+            res = self._convert(values, source, target, conversion_matrix)
+            if scaling != 1.0:
+                res *= scaling
+            if offset_values is not None:
+                res += offset_values
+            return res
+
+        return convert
+
+    def convert_batch(self, values: np.ndarray, inverse: bool = False) -> np.ndarray:
+        """
+        Convert several timeseries at once **from** source timeseries time points to
+        target timeseries time points (or, if ``inverse`` is ``True``, from target
+        timeseries time points **to** source timeseries time points).
+
+        All timeseries are converted in one vectorized operation. :func:`convert_from`
+        and :func:`convert_to` also accept two-dimensional arrays, this method
+        additionally ensures that input and output are two-dimensional.
+
+        Parameters
+        ----------
+        values
+            Values of shape ``(n_series, n_time)``
+        inverse
+            If ``True``, convert from target to source timeseries time points
+
+        Returns
+        -------
+        np.ndarray
+            Converted array of shape ``(n_series, n_converted_time)``
+
+        Raises
+        ------
+        ValueError
+            ``values`` is not two-dimensional
+        """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError(
+                "Expected values of shape (n_series, n_time), got {}".format(
+                    values.shape
+                )
+            )
+        if inverse:
+            return self.convert_to(values)
+        return self.convert_from(values)
 
     @property
     def source_length(self) -> int:
@@ -430,3 +1816,88 @@ class TimeseriesConverter:
         return len(self._target) - (
             1 if self._timeseries_type == ParameterType.AVERAGE_TIMESERIES else 0
         )
+
+
+@lru_cache(maxsize=_TIMESERIES_CONVERTER_CACHE_SIZE)
+def _get_cached_timeseries_converter(
+    source_time_points: bytes,
+    target_time_points: bytes,
+    timeseries_type: ParameterType,
+    interpolation_type: InterpolationType,
+    extrapolation_type: ExtrapolationType,
+) -> TimeseriesConverter:
+    return TimeseriesConverter(
+        np.frombuffer(source_time_points),
+        np.frombuffer(target_time_points),
+        timeseries_type,
+        interpolation_type,
+        extrapolation_type,
+    )
+
+
+def get_timeseries_converter(
+    source_time_points: np.ndarray,
+    target_time_points: np.ndarray,
+    timeseries_type: ParameterType,
+    interpolation_type: InterpolationType,
+    extrapolation_type: ExtrapolationType,
+) -> TimeseriesConverter:
+    """
+    Get a timeseries converter from a process-wide cache (or create and add it if not
+    found).
+
+    Converters are keyed by their time points, timeseries type, interpolation type and
+    extrapolation type. The cache is bounded (least recently used converters are
+    dropped first), see :func:`timeseries_converter_cache_info` for its statistics. As
+    the returned converter is shared, it must not be modified.
+
+    Parameters
+    ----------
+    source_time_points
+        Source timeseries time points
+    target_time_points
+        Target timeseries time points
+    timeseries_type
+        Time series type
+    interpolation_type
+        Interpolation type
+    extrapolation_type
+        Extrapolation type
+
+    Returns
+    -------
+    TimeseriesConverter
+        Shared timeseries converter
+
+    Raises
+    ------
+    InsufficientDataError
+        Timeseries too short to extrapolate
+    """
+    return _get_cached_timeseries_converter(
+        np.asarray(source_time_points, dtype=float).tobytes(),
+        np.asarray(target_time_points, dtype=float).tobytes(),
+        timeseries_type,
+        interpolation_type,
+        extrapolation_type,
+    )
+
+
+def timeseries_converter_cache_info() -> Any:
+    """
+    Get statistics of the cache used by :func:`get_timeseries_converter`.
+
+    Returns
+    -------
+    Any
+        Named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize`` (see
+        :func:`functools.lru_cache`)
+    """
+    return _get_cached_timeseries_converter.cache_info()
+
+
+def clear_timeseries_converter_cache() -> None:
+    """
+    Clear the cache used by :func:`get_timeseries_converter` and reset its statistics.
+    """
+    _get_cached_timeseries_converter.cache_clear()
@@ -101,16 +101,67 @@ prevent inadvertent conversions from 'NOx' to e.g. 'N2O', the conversion 'NOx' <
     >>> uc = UnitConverter("NOx", "N2O", context="NOx_conversions")
     >>> uc.convert_from(1)
     0.9565217391304348
+
+**A note on the unit registry cache**
+
+Building the unit registry requires parsing several hundred unit definitions. To keep
+imports fast, the populated registry is cached in ``openscm`` in the user's cache
+directory (or the directory given by the ``OPENSCM_CACHE_DIR`` environment variable, an
+empty value disables the cache) and restored from there on import. The cache is
+rebuilt automatically whenever this module (e.g. the standard gases) or the Pint version
+change. Use :func:`build_unit_registry_cache` to prepare it ahead of time,
+e.g. when building a container image. The cache is plain JSON data, reading it cannot
+execute any code.
 """
+import csv
+import hashlib
+import json
+import os
+import pkgutil
+import re
+import sys
+import tempfile
+import threading
 import warnings
-from typing import Dict, Optional, Sequence, Union
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 import numpy as np
 import pint
+from pint.converters import OffsetConverter, ScaleConverter
+from pint.definitions import DimensionDefinition, PrefixDefinition, UnitDefinition
 from pint.errors import (  # noqa: F401 # pylint: disable=unused-import
     DimensionalityError,
     UndefinedUnitError,
 )
+from pint.util import UnitsContainer, to_units_container
+
+_UNIT_CONVERTER_CACHE_SIZE = 1024
+"""Maximum number of unit converters kept by :func:`get_unit_converter`"""
+
+_CANONICAL_UNITS_SIZE = 4096
+"""
+Maximum number of units whose canonical spelling is kept by :func:`_normalize_unit`
+(more than the number of standard emissions units in the conversion table)
+"""
+
+_UNIT_REGISTRY_CACHE_DIR_ENV = "OPENSCM_CACHE_DIR"
+"""
+Environment variable overriding the directory of the unit registry cache, set it to an
+empty string to disable the cache
+"""
 
 # Standard gases. If the value is:
 # - str: this entry defines a base gas unit
@@ -235,13 +286,28 @@ _standard_gases = {
 }
 
 
+_standard_definitions = (
+    "a = 1 * year = annum = yr",
+    "h = hour",
+    "d = day",
+    "degreeC = degC",
+    "degreeF = degF",
+    "kt = 1000 * t",  # since kt is used for "knot" in the defaults
+    "ppt = [concentrations]",
+    "ppb = 1000 * ppt",
+    "ppm = 1000 * ppb",
+)
+"""Standard unit definitions added on top of the gases"""
+
+
 class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
     """
     Unit registry class for OpenSCM. Provides some convenience methods to add standard
     unit and contexts.
     """
 
-    _contexts_loaded: bool = False
+    _metric_conversions: Optional[Tuple[Sequence[str], np.ndarray]] = None
+    """Species and factors relative to carbon of the metric conversions (if loaded)"""
 
     def add_standards(self):
         """
@@ -251,27 +317,35 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
         """
         self._add_gases(_standard_gases)
 
-        self.define("a = 1 * year = annum = yr")
-        self.define("h = hour")
-        self.define("d = day")
-        self.define("degreeC = degC")
-        self.define("degreeF = degF")
-        self.define("kt = 1000 * t")  # since kt is used for "knot" in the defaults
-
-        self.define("ppt = [concentrations]")
-        self.define("ppb = 1000 * ppt")
-        self.define("ppm = 1000 * ppb")
+        for definition in _standard_definitions:
+            self.define(definition)
 
     def enable_contexts(self, *names_or_contexts, **kwargs):
         """
-        Overload pint's `enable_contexts` to load contexts once (the first time they are
-        used) to avoid (unnecessary) file operations on import.
+        Overload pint's `enable_contexts` to load contexts the first time they are used
+        to avoid (unnecessary) file operations and context construction on import.
         """
-        if not self._contexts_loaded:
-            self._load_contexts()
-        self._contexts_loaded = True
+        with _unit_registry_lock:
+            for name in names_or_contexts:
+                if isinstance(name, str) and name not in self._contexts:
+                    self._load_context(name)
         super().enable_contexts(*names_or_contexts, **kwargs)
 
+    def _get_context_names(self) -> List[str]:
+        """
+        Get the names of all available contexts, including those not loaded yet.
+
+        Returns
+        -------
+        List[str]
+            Names of the available contexts
+        """
+        return list(self._contexts.keys()) + [
+            name
+            for name in _openscm_context_names + _load_metric_conversion_table()[0]
+            if name not in self._contexts
+        ]
+
     def _add_mass_emissions_joint_version(self, symbol: str) -> None:
         """
         Add a unit which is the combination of mass and emissions.
@@ -307,62 +381,182 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
                 self.define("{} = {}".format(symbol.upper(), symbol))
                 self._add_mass_emissions_joint_version(symbol.upper())
 
-    def _load_contexts(self) -> None:
+    def _load_context(self, name: str) -> None:
         """
-        Load contexts.
+        Load an OpenSCM context, does nothing if ``name`` is not an OpenSCM context.
+
+        Parameters
+        ----------
+        name
+            Name of the context to load
         """
-        _ch4_context = pint.Context("CH4_conversions")
-        _ch4_context.add_transformation(
-            "[carbon]",
-            "[methane]",
-            lambda registry, x: 16 / 12 * registry.CH4 * x / registry.C,
-        )
-        _ch4_context.add_transformation(
-            "[methane]",
-            "[carbon]",
-            lambda registry, x: x * registry.C / registry.CH4 / (16 / 12),
-        )
-        self.add_context(_ch4_context)
-
-        _n2o_context = pint.Context("NOx_conversions")
-        _n2o_context.add_transformation(
-            "[nitrogen]",
-            "[NOx]",
-            lambda registry, x: (14 + 2 * 16)
-            / 14
-            * registry.NOx
-            * x
-            / registry.nitrogen,
-        )
-        _n2o_context.add_transformation(
-            "[NOx]",
-            "[nitrogen]",
-            lambda registry, x: x
-            * registry.nitrogen
-            / registry.NOx
-            / ((14 + 2 * 16) / 14),
-        )
-        self.add_context(_n2o_context)
+        if name == "CH4_conversions":
+            _ch4_context = pint.Context("CH4_conversions")
+            _ch4_context.add_transformation(
+                "[carbon]",
+                "[methane]",
+                lambda registry, x: 16 / 12 * registry.CH4 * x / registry.C,
+            )
+            _ch4_context.add_transformation(
+                "[methane]",
+                "[carbon]",
+                lambda registry, x: x * registry.C / registry.CH4 / (16 / 12),
+            )
+            self.add_context(_ch4_context)
+        elif name == "NOx_conversions":
+            _n2o_context = pint.Context("NOx_conversions")
+            _n2o_context.add_transformation(
+                "[nitrogen]",
+                "[NOx]",
+                lambda registry, x: (14 + 2 * 16)
+                / 14
+                * registry.NOx
+                * x
+                / registry.nitrogen,
+            )
+            _n2o_context.add_transformation(
+                "[NOx]",
+                "[nitrogen]",
+                lambda registry, x: x
+                * registry.nitrogen
+                / registry.NOx
+                / ((14 + 2 * 16) / 14),
+            )
+            self.add_context(_n2o_context)
+        elif name in _load_metric_conversion_table()[0]:
+            self._load_metric_conversion(name)
+
+    def _get_metric_conversions(self) -> Tuple[Sequence[str], np.ndarray]:
+        """
+        Get the metric conversion factors relative to carbon.
 
-        self._load_metric_conversions()
+        The factors are computed once for all metrics from the metric conversion table.
 
-    def _load_metric_conversions(self) -> None:
+        Returns
+        -------
+        Sequence[str]
+            Base dimension of each species e.g. ``"[methane]"``
+        np.ndarray
+            Factor converting one base unit of each species (first axis) into base
+            units of carbon for each metric (second axis), nan where a metric does not
+            define a species
         """
-        Load metric conversion contexts from file.
+        if self._metric_conversions is None:
+            _, species, values = _load_metric_conversion_table()
+            co2_factor = self.get_root_units("CO2")[0]
+            dimensions = []
+            species_factors = np.empty(len(species))
+            for i, label in enumerate(species):
+                species_factors[i] = self.get_root_units(label)[0]
+                dimensions.append(next(iter(self.get_dimensionality(label))))
+            self._metric_conversions = (
+                dimensions,
+                values * (co2_factor / species_factors)[:, np.newaxis],
+            )
 
-        This is done only when contexts are needed to avoid reading files on import.
+        return self._metric_conversions
+
+    def _get_metric_conversion_factor(
+        self, source: str, target: str, metric: str
+    ) -> float:
         """
-        import pandas as pd
-        from os import path
+        Get the factor converting ``source`` to ``target`` units using a metric.
 
-        metric_conversions = pd.read_csv(
-            path.join(path.dirname(path.abspath(__file__)), "metric_conversions.csv"),
-            skiprows=1,  # skip source row
-            header=0,
-            index_col=0,
-        ).iloc[
-            1:, :
-        ]  # drop out 'OpenSCM base unit' row
+        The factor is taken directly from the metric conversion table, i.e. without
+        enabling the metric's context, so the registry is not modified. ``source`` and
+        ``target`` may differ only in one species each (including carbon) e.g.
+        ``"kg CH4 / yr"`` and ``"Mt N2O / yr"``.
+
+        Parameters
+        ----------
+        source
+            Unit to convert **from** e.g. ``"kg CH4 / yr"``
+        target
+            Unit to convert **to** e.g. ``"Mt CO2 / yr"``
+        metric
+            Name of the metric e.g. ``"AR4GWP100"``
+
+        Returns
+        -------
+        float
+            Conversion factor, nan if the metric does not define the source species
+
+        Raises
+        ------
+        pint.errors.DimensionalityError
+            Units cannot be converted into each other using the metric.
+        pint.errors.UndefinedUnitError
+            Unit undefined.
+        ValueError
+            Unknown metric or units with an offset.
+        """
+        metrics = _load_metric_conversion_table()[0]
+        if metric not in metrics:
+            raise ValueError("Unknown metric {}".format(metric))
+
+        def _get_factor(carbon_factor_ratio: float) -> float:
+            for unit in (source, target):
+                if not all(
+                    self._is_multiplicative(u)
+                    for u in to_units_container(self.parse_units(unit))
+                ):
+                    raise ValueError("Offset unit {} cannot use a metric".format(unit))
+
+            return float(
+                self.get_root_units(source)[0]
+                * carbon_factor_ratio
+                / self.get_root_units(target)[0]
+            )
+
+        source_dimensionality = self.Unit(source).dimensionality
+        target_dimensionality = self.Unit(target).dimensionality
+        if source_dimensionality == target_dimensionality:
+            return _get_factor(1)
+
+        dimensions, factors = self._get_metric_conversions()
+        # later table entries for the same dimension win, like in the metric contexts
+        carbon_factors = dict(zip(dimensions, factors[:, metrics.index(metric)]))
+        carbon_factors["[carbon]"] = 1.0
+
+        def _get_carbon_dimensionalities(dimensionality):
+            for dimension, exponent in dimensionality.items():
+                if exponent == 1 and dimension in carbon_factors:
+                    if dimension != "[carbon]" and "[carbon]" in dimensionality:
+                        continue
+                    carbon_dimensionality = UnitsContainer(
+                        {
+                            "[carbon]" if d == dimension else d: e
+                            for d, e in dimensionality.items()
+                        }
+                    )
+                    if carbon_dimensionality in _metric_dimensionalities:
+                        yield dimension, carbon_dimensionality
+
+        for source_dimension, source_carbon in _get_carbon_dimensionalities(
+            source_dimensionality
+        ):
+            for target_dimension, target_carbon in _get_carbon_dimensionalities(
+                target_dimensionality
+            ):
+                if source_carbon == target_carbon:
+                    return _get_factor(
+                        carbon_factors[source_dimension]
+                        / carbon_factors[target_dimension]
+                    )
+
+        raise DimensionalityError(
+            source, target, source_dimensionality, target_dimensionality
+        )
+
+    def _load_metric_conversion(self, metric: str) -> None:
+        """
+        Load the context of a single metric conversion.
+
+        Parameters
+        ----------
+        metric
+            Name of the metric e.g. ``"AR4GWP100"``
+        """
 
         def _get_transform_func(ureg_unit, conversion_factor, forward=True):
             if forward:
@@ -377,75 +571,551 @@ class ScmUnitRegistry(pint.UnitRegistry):  # type: ignore
 
             return result_backward
 
-        for col in metric_conversions:
-            tc = pint.Context(col)
-            for label, val in metric_conversions[col].iteritems():
-                conv_val = (
-                    val
-                    * (self("CO2").to_base_units()).magnitude
-                    / (self(label).to_base_units()).magnitude
-                )
-                base_unit = [
-                    s
-                    for s, _ in self._get_dimensionality(
-                        self(label)  # pylint: disable=protected-access
-                        .to_base_units()
-                        ._units
-                    ).items()
-                ][0]
-
-                unit_reg_unit = getattr(
-                    self, base_unit.replace("[", "").replace("]", "")
-                )
-                tc.add_transformation(
-                    base_unit, "[carbon]", _get_transform_func(unit_reg_unit, conv_val)
-                )
-                tc.add_transformation(
-                    "[carbon]",
-                    base_unit,
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "[mass] * {} / [time]".format(base_unit),
-                    "[mass] * [carbon] / [time]",
-                    _get_transform_func(unit_reg_unit, conv_val),
-                )
-                tc.add_transformation(
-                    "[mass] * [carbon] / [time]",
-                    "[mass] * {} / [time]".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "[mass] * {}".format(base_unit),
-                    "[mass] * [carbon]",
-                    _get_transform_func(unit_reg_unit, conv_val),
+        dimensions, factors = self._get_metric_conversions()
+        factors = factors[:, _load_metric_conversion_table()[0].index(metric)]
+
+        # pass dimensions as containers rather than strings so that pint does not have
+        # to parse them for every transformation (newly created as pint 0.9 does not
+        # update the hash of containers derived with e.g. ``remove``)
+        tc = pint.Context(metric)
+        for dimension, conv_val in zip(dimensions, factors):
+            unit_reg_unit = getattr(self, dimension[1:-1])
+            forward = _get_transform_func(unit_reg_unit, conv_val)
+            backward = _get_transform_func(unit_reg_unit, conv_val, forward=False)
+            for dst in _metric_dimensionalities:
+                src = UnitsContainer(
+                    {dimension if d == "[carbon]" else d: e for d, e in dst.items()}
                 )
-                tc.add_transformation(
-                    "[mass] * [carbon]",
-                    "[mass] * {}".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
-                )
-                tc.add_transformation(
-                    "{} / [time]".format(base_unit),
-                    "[carbon] / [time]",
-                    _get_transform_func(unit_reg_unit, conv_val),
-                )
-                tc.add_transformation(
-                    "[carbon] / [time]",
-                    "{} / [time]".format(base_unit),
-                    _get_transform_func(unit_reg_unit, conv_val, forward=False),
+                tc.add_transformation(src, dst, forward)
+                tc.add_transformation(dst, src, backward)
+
+        self.add_context(tc)
+
+
+_metric_dimensionalities = [
+    UnitsContainer({"[carbon]": 1}),
+    UnitsContainer({"[mass]": 1, "[carbon]": 1, "[time]": -1}),
+    UnitsContainer({"[mass]": 1, "[carbon]": 1}),
+    UnitsContainer({"[carbon]": 1, "[time]": -1}),
+]
+"""Dimensionalities (in terms of carbon) between which metric contexts convert"""
+
+_openscm_context_names = ["CH4_conversions", "NOx_conversions"]
+"""Names of the contexts defined by OpenSCM in addition to the metric conversions"""
+
+
+@lru_cache(maxsize=None)
+def _load_metric_conversion_table() -> Tuple[List[str], List[str], np.ndarray]:
+    """
+    Load the metric conversion table from ``metric_conversions.csv``.
+
+    This is done only when contexts are needed to avoid reading files on import.
+
+    Returns
+    -------
+    List[str]
+        Names of the metrics
+    List[str]
+        Names of the species
+    np.ndarray
+        Metric values of the species (first axis) relative to CO2 for each metric
+        (second axis), nan where a metric does not define a species
+    """
+    with open(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "metric_conversions.csv"
+        ),
+        encoding="utf-8",
+        newline="",
+    ) as f:
+        reader = csv.reader(f)
+        next(reader)  # skip source row
+        metrics = next(reader)[1:]
+        next(reader)  # skip 'OpenSCM species' row
+        species = []
+        values = []
+        for row in reader:
+            species.append(row[0])
+            values.append([float(v) if v else np.nan for v in row[1:]])
+
+    return metrics, species, np.array(values, dtype=float).reshape(-1, len(metrics))
+
+
+_UNIT_REGISTRY_STATE_ATTRIBUTES = (
+    "_defaults",
+    "_dimensions",
+    "_units",
+    "_units_casei",
+    "_prefixes",
+    "_suffixes",
+    "_dimensional_equivalents",
+    "_root_units_cache",
+    "_dimensionality_cache",
+    "_parse_unit_cache",
+    "_base_units_cache",
+    "_default_system",
+)
+"""Registry attributes which are stored as they are in the unit registry cache"""
+
+
+_UNIT_REGISTRY_STATE_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        DimensionDefinition,
+        OffsetConverter,
+        PrefixDefinition,
+        ScaleConverter,
+        UnitDefinition,
+    )
+}
+"""pint classes whose instances can be part of the unit registry cache"""
+
+
+def _get_registry_attributes(
+    registry: pint.UnitRegistry, names: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Get private attributes of a unit registry.
+
+    pint has no public API exposing the state of a registry, so the unit registry cache
+    stores its private attributes. This is the only place reading them, check it when
+    upgrading pint.
+
+    Parameters
+    ----------
+    registry
+        Unit registry
+    names
+        Attribute names
+
+    Returns
+    -------
+    Dict[str, Any]
+        Attribute values by name
+    """
+    return {name: registry.__dict__[name] for name in names}
+
+
+def _get_unit_registry_state(registry: ScmUnitRegistry) -> Dict[str, Any]:
+    """
+    Get the state of a unit registry (see :func:`_encode_unit_registry_state`).
+
+    Contexts are built from functions which cannot be stored as data, so the state
+    holds the definition lines of pint's default contexts instead. OpenSCM's own
+    contexts are loaded lazily anyway.
+
+    Parameters
+    ----------
+    registry
+        Unit registry
+
+    Returns
+    -------
+    Dict[str, Any]
+        State from which :func:`_restore_unit_registry` restores an equivalent registry
+    """
+    attributes = _get_registry_attributes(registry, _UNIT_REGISTRY_STATE_ATTRIBUTES)
+    # pint's ``ParserHelper`` is stored without its scale, so the cache keys are
+    # stored as the equivalent (equal and equally hashed) ``UnitsContainer``
+    for name in ("_root_units_cache", "_dimensionality_cache"):
+        attributes[name] = {
+            UnitsContainer(key): value
+            for key, value in attributes[name].items()
+            if getattr(key, "scale", 1) == 1
+        }
+    groups_and_systems = _get_registry_attributes(registry, ("_groups", "_systems"))
+
+    return {
+        "attributes": attributes,
+        "groups": {
+            name: vars(group) for name, group in groups_and_systems["_groups"].items()
+        },
+        "systems": {
+            name: vars(system)
+            for name, system in groups_and_systems["_systems"].items()
+        },
+        "context_definitions": _get_default_context_definitions(),
+    }
+
+
+def _restore_unit_registry(state: Dict[str, Any]) -> ScmUnitRegistry:
+    """
+    Restore a unit registry from its state without parsing any unit definitions.
+
+    Parameters
+    ----------
+    state
+        State as returned by :func:`_get_unit_registry_state`
+
+    Returns
+    -------
+    :obj:`ScmUnitRegistry`
+        Restored registry
+    """
+    registry = ScmUnitRegistry(filename=None)
+    registry.__dict__.update(state["attributes"])
+    # create all groups and systems before restoring their state as creating a group
+    # modifies the root group
+    groups = [
+        (registry.get_group(name), attrs) for name, attrs in state["groups"].items()
+    ]
+    systems = [
+        (registry.get_system(name), attrs) for name, attrs in state["systems"].items()
+    ]
+    for group_or_system, attrs in groups + systems:
+        group_or_system.__dict__.update(attrs)
+    registry.load_definitions(state["context_definitions"])
+
+    return registry
+
+
+def _encode_unit_registry_items(obj: Dict[Any, Any]) -> List[List[Any]]:
+    """
+    Encode the items of a dictionary of unit registry state as JSON data.
+
+    Parameters
+    ----------
+    obj
+        Dictionary
+
+    Returns
+    -------
+    List[List[Any]]
+        Encoded key-value pairs (JSON object keys can only be strings)
+    """
+    return [
+        [_encode_unit_registry_state(k), _encode_unit_registry_state(v)]
+        for k, v in obj.items()
+    ]
+
+
+def _encode_unit_registry_state(obj: Any) -> Any:
+    """
+    Encode (nested) unit registry state as JSON data.
+
+    Lists, strings, numbers and ``None`` are kept as they are. All other values are
+    encoded as a JSON object with a single key tagging their type, so that
+    :func:`_decode_unit_registry_state` restores them without executing any code
+    (in contrast to e.g. unpickling).
+
+    Parameters
+    ----------
+    obj
+        State to encode (dictionaries, sets, tuples, pint ``UnitsContainer`` and
+        instances of the classes in :data:`_UNIT_REGISTRY_STATE_CLASSES`)
+
+    Returns
+    -------
+    Any
+        JSON data
+
+    Raises
+    ------
+    TypeError
+        ``obj`` contains a value of another type
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, list):
+        return [_encode_unit_registry_state(v) for v in obj]
+
+    value: List[Any]
+    if isinstance(obj, UnitsContainer):
+        tag, value = "units", [[k, v] for k, v in obj.items()]
+    elif isinstance(obj, defaultdict) and obj.default_factory is set:
+        tag, value = "defaultdict_set", _encode_unit_registry_items(obj)
+    elif type(obj) is dict:  # pylint: disable=unidiomatic-typecheck
+        tag, value = "dict", _encode_unit_registry_items(obj)
+    elif isinstance(obj, tuple):
+        tag, value = "tuple", [_encode_unit_registry_state(v) for v in obj]
+    elif isinstance(obj, set):
+        tag, value = "set", [_encode_unit_registry_state(v) for v in obj]
+    elif _UNIT_REGISTRY_STATE_CLASSES.get(type(obj).__name__) is type(obj):
+        tag, value = (
+            "object",
+            [type(obj).__name__, _encode_unit_registry_state(vars(obj))],
+        )
+    else:
+        raise TypeError("Cannot store {} in the unit registry cache".format(type(obj)))
+
+    return {tag: value}
+
+
+def _decode_unit_registry_object(value: List[Any]) -> Any:
+    """
+    Decode an instance of one of the classes in :data:`_UNIT_REGISTRY_STATE_CLASSES`.
+
+    Parameters
+    ----------
+    value
+        Class name and (decoded) instance dictionary
+
+    Returns
+    -------
+    Any
+        Decoded instance
+
+    Raises
+    ------
+    ValueError
+        The class is not one of :data:`_UNIT_REGISTRY_STATE_CLASSES`
+    """
+    if value[0] not in _UNIT_REGISTRY_STATE_CLASSES:
+        raise ValueError(
+            "Invalid unit registry cache entry of class {}".format(value[0])
+        )
+
+    cls = _UNIT_REGISTRY_STATE_CLASSES[value[0]]
+    res = cls.__new__(cls)
+    res.__dict__.update(value[1])
+    return res
+
+
+_UNIT_REGISTRY_STATE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "units": lambda value: UnitsContainer(dict(value)),
+    "dict": dict,
+    "defaultdict_set": lambda value: defaultdict(set, value),
+    "tuple": tuple,
+    "set": set,
+    "object": _decode_unit_registry_object,
+}
+"""Decoders of the values of the JSON objects tagging types in the unit registry cache"""
+
+
+def _decode_unit_registry_state(obj: Dict[str, Any]) -> Any:
+    """
+    Decode a JSON object of unit registry state encoded by
+    :func:`_encode_unit_registry_state`.
+
+    Used as ``object_hook`` of :func:`json.load`, so the values of ``obj`` are
+    decoded already.
+
+    Parameters
+    ----------
+    obj
+        JSON object
+
+    Returns
+    -------
+    Any
+        Decoded value
+
+    Raises
+    ------
+    ValueError
+        ``obj`` is not a valid encoding
+    """
+    if len(obj) == 1:
+        ((tag, value),) = obj.items()
+        if tag in _UNIT_REGISTRY_STATE_DECODERS:
+            return _UNIT_REGISTRY_STATE_DECODERS[tag](value)
+
+    raise ValueError("Invalid unit registry cache entry {}".format(list(obj)))
+
+
+def _get_default_context_definitions() -> List[str]:
+    """
+    Get the definition lines of the contexts in pint's default definitions file.
+
+    Returns
+    -------
+    List[str]
+        Lines of all ``@context`` blocks
+    """
+    definitions = pkgutil.get_data(pint.__name__, "default_en.txt") or b""
+    result = []
+    in_context = False
+    for line in definitions.decode("utf-8").splitlines():
+        if line.startswith("@context"):
+            in_context = True
+        if in_context:
+            result.append(line)
+            in_context = line.strip() != "@end"
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def _get_unit_registry_source_hash() -> str:
+    """
+    Get the hash of the source of this module.
+
+    The unit registry and the format of its cache are defined here, so any change to
+    this module invalidates the unit registry cache.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of this module's source
+    """
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_unit_registry_cache_path(cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Get the path of the unit registry cache file.
+
+    The file name contains a hash of everything the registry is built from (including
+    the source of this module) so that a change to e.g. ``_standard_gases``, to the
+    format of the cache or an upgrade of pint invalidates the cache.
+
+    Parameters
+    ----------
+    cache_dir
+        Cache directory, if ``None`` it is taken from the ``OPENSCM_CACHE_DIR``
+        environment variable, falling back to ``openscm`` in the user's cache directory
+
+    Returns
+    -------
+    Optional[str]
+        Path of the cache file, ``None`` if the cache is disabled
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(_UNIT_REGISTRY_CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "openscm",
+        )
+    if not cache_dir:
+        return None
+
+    key = repr(
+        (
+            _get_unit_registry_source_hash(),
+            pint.__version__,
+            sys.version_info[:2],
+            _standard_gases,
+            _standard_definitions,
+        )
+    )
+    return os.path.join(
+        cache_dir,
+        "unit_registry-{}.json".format(
+            hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        ),
+    )
+
+
+def build_unit_registry_cache(cache_dir: Optional[str] = None) -> str:
+    """
+    Build the standard unit registry and write it to the unit registry cache.
+
+    On import, :mod:`openscm.units` restores the registry from this cache if it is
+    valid and builds (and caches) it from scratch otherwise, so calling this is only
+    needed to prepare the cache ahead of time, e.g. when building a container image.
+
+    Parameters
+    ----------
+    cache_dir
+        Cache directory, see :func:`_get_unit_registry_cache_path`
+
+    Returns
+    -------
+    str
+        Path of the written cache file
+
+    Raises
+    ------
+    ValueError
+        The cache is disabled
+    """
+    path = _get_unit_registry_cache_path(cache_dir)
+    if path is None:
+        raise ValueError("Unit registry cache is disabled")
+
+    registry = ScmUnitRegistry()
+    registry.add_standards()
+    _write_unit_registry_cache(registry, path)
+
+    return path
+
+
+def _write_unit_registry_cache(registry: ScmUnitRegistry, path: str) -> None:
+    """
+    Write the state of ``registry`` to the cache file ``path``.
+
+    The file is written to a temporary file first and then moved into place so that
+    concurrent imports never read a partially written cache.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    state = _encode_unit_registry_state(_get_unit_registry_state(registry))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_unit_registry(cache_dir: Optional[str] = None) -> ScmUnitRegistry:
+    """
+    Load the standard unit registry, from the unit registry cache if possible.
+
+    If the cache is missing or cannot be read, the registry is built from scratch and
+    (best effort) written to the cache.
+
+    Parameters
+    ----------
+    cache_dir
+        Cache directory, see :func:`_get_unit_registry_cache_path`
+
+    Returns
+    -------
+    :obj:`ScmUnitRegistry`
+        Registry with the standard units
+    """
+    path = _get_unit_registry_cache_path(cache_dir)
+    if path is not None and os.path.isfile(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return _restore_unit_registry(
+                    json.load(f, object_hook=_decode_unit_registry_state)
                 )
+        except Exception:  # pylint: disable=broad-except
+            warnings.warn(
+                "Could not load unit registry cache {}, rebuilding it".format(path)
+            )
 
-            self.add_context(tc)
+    registry = ScmUnitRegistry()
+    registry.add_standards()
+    if path is not None:
+        try:
+            _write_unit_registry_cache(registry, path)
+        except (OSError, TypeError):
+            pass
 
+    return registry
 
-_unit_registry = ScmUnitRegistry()
+
+_unit_registry = _load_unit_registry()
 """
 OpenSCM standard unit registry
 
 The unit registry contains all of the recognised units.
 """
-_unit_registry.add_standards()
+
+_unit_registry_lock = threading.RLock()
+"""
+Lock serializing access to :data:`_unit_registry` from OpenSCM (pint's registry caches
+and enabled contexts are shared and not thread-safe)
+"""
+
+
+def _warn_nan_conversion(source: str, target: str) -> None:
+    """
+    Warn that converting from ``source`` to ``target`` gives nan (as a metric does not
+    define one of the species).
+    """
+    warn_msg = (
+        "No conversion from {} to {} available, nan will be returned "
+        "upon conversion".format(source, target)
+    )
+    warnings.warn(warn_msg)
 
 
 class UnitConverter:
@@ -465,6 +1135,9 @@ class UnitConverter:
     _scaling: float
     """Scaling factor between units"""
 
+    _is_identity: bool
+    """Whether the conversion leaves values unchanged"""
+
     def __init__(self, source: str, target: str, context: Optional[str] = None):
         """
         Initialize.
@@ -490,8 +1163,36 @@ class UnitConverter:
         self._source = source
         self._target = target
 
-        source_unit = _unit_registry.Unit(source)
-        target_unit = _unit_registry.Unit(target)
+        metrics = _load_metric_conversion_table()[0]
+        with _unit_registry_lock:
+            source_unit = _unit_registry.Unit(source)
+            target_unit = _unit_registry.Unit(target)
+            if source_unit.dimensionality == target_unit.dimensionality:
+                # pint only applies contexts between different dimensionalities
+                context = None
+            if context in metrics:
+                # metric conversions do not need the context to be enabled on the
+                # shared registry
+                self._scaling = _unit_registry._get_metric_conversion_factor(  # pylint: disable=protected-access
+                    source, target, context
+                )
+                self._offset = 0.0
+            else:
+                self._scaling, self._offset = self._calc_scaling_and_offset(context)
+
+        if np.isnan(self._scaling) or np.isnan(self._offset):
+            _warn_nan_conversion(source, target)
+        self._is_identity = self._scaling == 1 and self._offset == 0
+
+    def _calc_scaling_and_offset(self, context: Optional[str]) -> Tuple[float, float]:
+        """
+        Calculate scaling and offset of the conversion with pint.
+
+        Has to be called with :data:`_unit_registry_lock` held as enabling a context
+        modifies the shared unit registry.
+        """
+        source_unit = _unit_registry.Unit(self._source)
+        target_unit = _unit_registry.Unit(self._target)
 
         s1 = _unit_registry.Quantity(1, source_unit)
         s2 = _unit_registry.Quantity(-1, source_unit)
@@ -504,47 +1205,133 @@ class UnitConverter:
                 t1 = s1.to(target_unit)
                 t2 = s2.to(target_unit)
 
-        if np.isnan(t1) or np.isnan(t2):
-            warn_msg = (
-                "No conversion from {} to {} available, nan will be returned "
-                "upon conversion".format(source, target)
-            )
-            warnings.warn(warn_msg)
+        scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
+        return scaling, t1.m - scaling * s1.m
+
+    @overload
+    def convert_from(self, v: float, out: None = None) -> float:
+        ...  # pragma: no cover
 
-        self._scaling = float(t2.m - t1.m) / float(s2.m - s1.m)
-        self._offset = t1.m - self._scaling * s1.m
+    @overload
+    def convert_from(
+        self, v: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        ...  # pragma: no cover
 
-    def convert_from(self, v: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def convert_from(
+        self, v: Union[float, np.ndarray], out: Optional[np.ndarray] = None
+    ) -> Union[float, np.ndarray]:
         """
         Convert value **from** source unit to target unit.
 
+        If the conversion leaves values unchanged (same units), no computation is done:
+        arrays are returned as read-only views, other values as floats.
+
         Parameters
         ----------
-        value
+        v
             Value in source unit
+        out
+            Array to write the converted values to (may be ``v`` itself)
 
         Returns
         -------
         Union[float, np.ndarray]
-            Value in target unit
+            Value in target unit (``out`` if given)
         """
-        return self._offset + v * self._scaling
-
-    def convert_to(self, v: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        if self._is_identity:
+            return self._convert_identity(v, out)
+        if out is None:
+            return self._offset + v * self._scaling
+
+        np.multiply(v, self._scaling, out=out)
+        if self._offset:
+            np.add(out, self._offset, out=out)
+        return out
+
+    @overload
+    def convert_to(self, v: float, out: None = None) -> float:
+        ...  # pragma: no cover
+
+    @overload
+    def convert_to(self, v: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        ...  # pragma: no cover
+
+    def convert_to(
+        self, v: Union[float, np.ndarray], out: Optional[np.ndarray] = None
+    ) -> Union[float, np.ndarray]:
         """
         Convert value from target unit **to** source unit.
 
+        If the conversion leaves values unchanged (same units), no computation is done:
+        arrays are returned as read-only views, other values as floats.
+
         Parameters
         ----------
-        value
+        v
             Value in target unit
+        out
+            Array to write the converted values to (may be ``v`` itself)
 
         Returns
         -------
         Union[float, np.ndarray]
-            Value in source unit
+            Value in source unit (``out`` if given)
+        """
+        if self._is_identity:
+            return self._convert_identity(v, out)
+        if out is None:
+            return (v - self._offset) / self._scaling
+
+        np.subtract(v, self._offset, out=out)
+        np.divide(out, self._scaling, out=out)
+        return out
+
+    def convert_from_inplace(self, v: np.ndarray) -> np.ndarray:
         """
-        return (v - self._offset) / self._scaling
+        Convert values **from** source unit to target unit in place.
+
+        Parameters
+        ----------
+        v
+            Values in source unit, overwritten with the values in target unit
+
+        Returns
+        -------
+        np.ndarray
+            ``v``
+        """
+        return self.convert_from(v, out=v)
+
+    def convert_to_inplace(self, v: np.ndarray) -> np.ndarray:
+        """
+        Convert values from target unit **to** source unit in place.
+
+        Parameters
+        ----------
+        v
+            Values in target unit, overwritten with the values in source unit
+
+        Returns
+        -------
+        np.ndarray
+            ``v``
+        """
+        return self.convert_to(v, out=v)
+
+    @staticmethod
+    def _convert_identity(
+        v: Union[float, np.ndarray], out: Optional[np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        if out is not None:
+            if out is not v:
+                np.copyto(out, v)
+            return out
+        if isinstance(v, np.ndarray):
+            view = v.view()
+            view.flags.writeable = False
+            return view
+        return float(v)
 
     @property
     def contexts(self) -> Sequence[str]:
@@ -556,7 +1343,7 @@ class UnitConverter:
         Sequence[str]
             List of names of the available contexts
         """
-        return list(_unit_registry._contexts.keys())  # pylint: disable=protected-access
+        return _unit_registry._get_context_names()  # pylint: disable=protected-access
 
     @property
     def unit_registry(self) -> ScmUnitRegistry:
@@ -569,3 +1356,592 @@ class UnitConverter:
             Unit registry used by this unit converter
         """
         return _unit_registry
+
+
+_canonical_units: "OrderedDict[Any, str]" = OrderedDict()
+"""
+Map from the key of a unit (see :func:`_normalize_unit`) to its canonical spelling,
+least recently used first
+"""
+
+_HYPHEN_UNDERSCORE_RE = re.compile(r"(?<=[A-Za-z0-9])[-_](?=[A-Za-z0-9])")
+"""Hyphens and underscores within names e.g. in ``"HFC-134a"``"""
+
+
+@lru_cache(maxsize=_UNIT_CONVERTER_CACHE_SIZE)
+def _normalize_unit(unit: str) -> str:
+    """
+    Get the canonical spelling of a unit.
+
+    All spellings of the same unit (e.g. ``"Mt CO2/yr"`` and ``"MtCO2 / a"``) are mapped
+    to the (interned) spelling seen first, so that caches keyed by unit strings hit for
+    all of them. Multiplicative units are identified by their factor to root units
+    (rounded to 12 significant digits) and their root units, units with an offset
+    (e.g. ``"degC"``) by their spelling only. Hyphens and underscores within names are
+    dropped for units pint does not know otherwise (e.g. ``"HFC-134a"``).
+
+    Parameters
+    ----------
+    unit
+        Unit to normalize
+
+    Returns
+    -------
+    str
+        Canonical spelling
+
+    Raises
+    ------
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    ValueError
+        Unit cannot be parsed.
+    """
+    with _unit_registry_lock:
+        unit, units = _parse_unit(_unit_registry, unit)
+        return _get_canonical_unit(_get_unit_key(_unit_registry, unit, units), unit)
+
+
+def _get_canonical_unit(key: Any, unit: str) -> str:
+    """
+    Get the canonical spelling of the unit with key ``key``.
+
+    The first spelling seen for a key becomes its canonical spelling. At most
+    :data:`_CANONICAL_UNITS_SIZE` keys are kept, the least recently used ones are
+    dropped. A unit seen again after its key has been dropped is given a new canonical
+    spelling, which only costs cache hits (of :func:`get_unit_converter` and of the
+    conversion table of :func:`get_conversion_factor`).
+
+    Has to be called with :data:`_unit_registry_lock` held.
+
+    Parameters
+    ----------
+    key
+        Key of the unit (see :func:`_get_unit_key`)
+    unit
+        Spelling of the unit
+
+    Returns
+    -------
+    str
+        Canonical (interned) spelling
+    """
+    canonical = _canonical_units.get(key)
+    if canonical is None:
+        canonical = _canonical_units[key] = sys.intern(str(unit))
+        if len(_canonical_units) > _CANONICAL_UNITS_SIZE:
+            _canonical_units.popitem(last=False)
+    else:
+        _canonical_units.move_to_end(key)
+
+    return canonical
+
+
+def _parse_unit(registry: ScmUnitRegistry, unit: str) -> Tuple[str, UnitsContainer]:
+    """
+    Parse a unit, dropping hyphens and underscores within names if needed.
+
+    Returns
+    -------
+    Tuple[str, UnitsContainer]
+        Spelling which could be parsed and parsed units
+
+    Raises
+    ------
+    Exception
+        Unit cannot be parsed, with hyphens and underscores within names dropped if
+        ``unit`` contains any (caused by the error of parsing ``unit`` as given)
+    """
+    try:
+        return unit, to_units_container(registry.parse_units(unit))
+    except Exception as exc:  # pylint: disable=broad-except
+        # pint fails in various ways on e.g. "HFC-134a" (parsed as a subtraction)
+        stripped = _HYPHEN_UNDERSCORE_RE.sub("", unit)
+        if stripped == unit:
+            raise
+        try:
+            units = registry.parse_units(stripped)
+        except Exception as stripped_exc:  # pylint: disable=broad-except
+            raise stripped_exc from exc
+        return stripped, to_units_container(units)
+
+
+def _get_unit_key(registry: ScmUnitRegistry, unit: str, units: UnitsContainer) -> Any:
+    """
+    Get the key identifying a unit for :func:`_normalize_unit`.
+    """
+    # pylint: disable=protected-access
+    if all(registry._is_multiplicative(u) for u in units):
+        factor, root_units = registry._get_root_units(units)
+        return (float("{:.12g}".format(factor)), root_units)
+
+    return unit
+
+
+@lru_cache(maxsize=_UNIT_CONVERTER_CACHE_SIZE)
+def _get_cached_unit_converter(
+    source: str, target: str, context: Optional[str]
+) -> UnitConverter:
+    return UnitConverter(source, target, context)
+
+
+def get_unit_converter(
+    source: str, target: str, context: Optional[str] = None
+) -> UnitConverter:
+    """
+    Get a unit converter from a process-wide cache (or create and add it if not found).
+
+    Converters are keyed by their (normalized, see :func:`_normalize_unit`) source
+    unit, target unit and context, so the units are only parsed and converted by pint
+    once per key, whichever way they are spelled. The cache is bounded (least
+    recently used converters are dropped first), see :func:`unit_converter_cache_info`
+    for its statistics. As the returned converter is shared, it must not be modified.
+
+    Parameters
+    ----------
+    source
+        Unit to convert **from**
+    target
+        Unit to convert **to**
+    context
+        Context to use for the conversion (see :class:`UnitConverter`)
+
+    Returns
+    -------
+    UnitConverter
+        Shared unit converter
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        Units cannot be converted into each other.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    return _get_cached_unit_converter(
+        _normalize_unit(source), _normalize_unit(target), context
+    )
+
+
+def unit_converter_cache_info() -> Any:
+    """
+    Get statistics of the cache used by :func:`get_unit_converter`.
+
+    Returns
+    -------
+    Any
+        Named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize`` (see
+        :func:`functools.lru_cache`)
+    """
+    return _get_cached_unit_converter.cache_info()
+
+
+def clear_unit_converter_cache() -> None:
+    """
+    Clear the cache used by :func:`get_unit_converter` and reset its statistics.
+    """
+    _get_cached_unit_converter.cache_clear()
+
+
+@lru_cache(maxsize=_UNIT_CONVERTER_CACHE_SIZE)
+def _get_cached_co2_equivalent_factor(source: str, target: str, metric: str) -> float:
+    with _unit_registry_lock:
+        return _unit_registry._get_metric_conversion_factor(  # pylint: disable=protected-access
+            source, target, metric
+        )
+
+
+def get_co2_equivalent_factors(
+    source_units: Sequence[str], target_unit: str, metric: str
+) -> np.ndarray:
+    """
+    Get the factors converting emissions of several gases into CO2-equivalents.
+
+    The factors are taken directly from the metric conversion table, so no context has
+    to be enabled, and are cached per unit.
+
+    Parameters
+    ----------
+    source_units
+        Unit of each gas e.g. ``["Mt CH4 / yr", "kt N2O / yr"]``
+    target_unit
+        CO2-equivalent unit e.g. ``"Mt CO2 / yr"``
+    metric
+        Name of the metric e.g. ``"AR4GWP100"``
+
+    Returns
+    -------
+    np.ndarray
+        Factor for each gas, nan for gases the metric does not define (a warning is
+        raised for those)
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        A unit cannot be converted into the target unit using the metric.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    ValueError
+        Unknown metric or units with an offset.
+    """
+    factors = np.array(
+        [
+            _get_cached_co2_equivalent_factor(
+                _normalize_unit(source), _normalize_unit(target_unit), metric
+            )
+            for source in source_units
+        ],
+        dtype=float,
+    )
+    for source in np.asarray(source_units)[np.isnan(factors)]:
+        warnings.warn(
+            "No conversion from {} to {} available in {}, nan will be returned upon "
+            "conversion".format(source, target_unit, metric)
+        )
+
+    return factors
+
+
+def calculate_co2_equivalent_totals(
+    values: np.ndarray, source_units: Sequence[str], target_unit: str, metric: str
+) -> np.ndarray:
+    """
+    Calculate CO2-equivalent totals of emissions of several gases.
+
+    The totals are computed as a single matrix-vector product of the metric factors
+    (see :func:`get_co2_equivalent_factors`) with the emissions.
+
+    Parameters
+    ----------
+    values
+        Emissions with gases along the second to last axis and time along the last
+        axis, any leading axes (e.g. ensemble members) are kept
+    source_units
+        Unit of each gas
+    target_unit
+        CO2-equivalent unit of the totals
+    metric
+        Name of the metric e.g. ``"AR4GWP100"``
+
+    Returns
+    -------
+    np.ndarray
+        CO2-equivalent totals, shape of ``values`` without the gases axis
+
+    Raises
+    ------
+    ValueError
+        Number of units does not match the number of gases, unknown metric or units
+        with an offset.
+    pint.errors.DimensionalityError
+        A unit cannot be converted into the target unit using the metric.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    values = np.asarray(values)
+    if values.ndim < 2 or values.shape[-2] != len(source_units):
+        raise ValueError(
+            "Expected {} gases along the second to last axis of values".format(
+                len(source_units)
+            )
+        )
+
+    return cast(
+        np.ndarray,
+        get_co2_equivalent_factors(source_units, target_unit, metric) @ values,
+    )
+
+
+def convert_units(
+    values: np.ndarray,
+    source_units: Sequence[str],
+    target_units: Union[str, Sequence[str]],
+    context: Optional[str] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Convert a block of values with one unit per row.
+
+    Rows are grouped by their unique pair of source and target unit, each pair is
+    resolved once (see :func:`get_unit_converter`) and the resulting affine transforms
+    are applied to all rows at once.
+
+    Parameters
+    ----------
+    values
+        Values with rows along the first axis
+    source_units
+        Unit of each row
+    target_units
+        Unit to convert all rows to or unit of each row to convert to
+    context
+        Context to use for all conversions (see :class:`UnitConverter`)
+    out
+        Array to write the converted values to, must have the shape of ``values`` (may
+        be ``values`` itself)
+
+    Returns
+    -------
+    np.ndarray
+        Converted values (``out`` if given)
+
+    Raises
+    ------
+    ValueError
+        Number of units does not match the number of rows.
+    pint.errors.DimensionalityError
+        Units cannot be converted into each other.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    """
+    values = np.asarray(values)
+    source_array = np.asarray(source_units, dtype=str)
+    target_array = np.broadcast_to(
+        np.asarray(target_units, dtype=str), values.shape[:1]
+    )
+    if source_array.shape != values.shape[:1]:
+        raise ValueError(
+            "Expected {} source units, got {}".format(len(values), len(source_array))
+        )
+
+    unique_sources, source_codes = np.unique(source_array, return_inverse=True)
+    unique_targets, target_codes = np.unique(target_array, return_inverse=True)
+    unique_pairs, pair_codes = np.unique(
+        source_codes * len(unique_targets) + target_codes, return_inverse=True
+    )
+    scaling = np.empty(len(unique_pairs))
+    offset = np.empty(len(unique_pairs))
+    for i, pair in enumerate(unique_pairs):
+        converter = get_unit_converter(
+            unique_sources[pair // len(unique_targets)],
+            unique_targets[pair % len(unique_targets)],
+            context,
+        )
+        scaling[i] = converter._scaling  # pylint: disable=protected-access
+        offset[i] = converter._offset  # pylint: disable=protected-access
+
+    # broadcast the per-row transforms along all other axes
+    shape = (-1,) + (1,) * (values.ndim - 1)
+    out = np.multiply(values, scaling[pair_codes].reshape(shape), out=out)
+    if offset.any():
+        np.add(out, offset[pair_codes].reshape(shape), out=out)
+
+    return out
+
+
+_EMISSIONS_UNIT_MASSES = tuple(
+    prefix + mass for mass in ("g", "t") for prefix in ("", "k", "M", "G", "T")
+)
+"""Masses of the emissions units in the unit conversion table"""
+
+_EMISSIONS_UNIT_TIMES = ("", " / yr")
+"""Time periods of the emissions units in the unit conversion table"""
+
+
+class _UnitConversionTable:
+    """
+    Precomputed conversion factors between all standard emissions units.
+
+    Rather than a dense (unit x unit) matrix per context, which would have millions of
+    entries, the table stores each unit's factor to root units, its species and the
+    dimensionality it has with the species replaced by carbon ("shape"), plus per
+    metric each species' factor relative to carbon. Any factor is then a product of
+    (at most) four table entries.
+    """
+
+    _rows: Dict[str, Tuple[float, int, int]]
+    """
+    Factor to root units, species (index into ``_species_dimensions``) and shape
+    (index into :data:`_metric_dimensionalities`) of each (normalized) unit
+    """
+
+    _species_dimensions: List[str]
+    """Dimensions of the species e.g. ``"[methane]"``"""
+
+    _metric_factors: Dict[str, List[Optional[float]]]
+    """Factor of each species relative to carbon per metric, ``None`` if undefined"""
+
+    def __init__(self, registry: ScmUnitRegistry, units: Sequence[str]):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        registry
+            Unit registry to compute the table with
+        units
+            Units to include, units which are undefined or not emissions units of a
+            single species are skipped
+        """
+        self._rows = {}
+        species_indices: Dict[str, int] = {"[carbon]": 0}
+        # pylint: disable=protected-access
+        for unit in units:
+            try:
+                unit, parsed = _parse_unit(registry, unit)
+                dimensionality = registry._get_dimensionality(parsed)
+            except UndefinedUnitError:
+                continue
+            normalized = _get_canonical_unit(
+                _get_unit_key(registry, unit, parsed), unit
+            )
+            if normalized in self._rows:
+                # e.g. "kt CO2" and "Gg CO2"
+                continue
+            for dimension, exponent in dimensionality.items():
+                if dimension != "[carbon]" and "[carbon]" in dimensionality:
+                    continue
+                carbon_dimensionality = UnitsContainer(
+                    {
+                        "[carbon]" if d == dimension else d: e
+                        for d, e in dimensionality.items()
+                    }
+                )
+                if exponent == 1 and carbon_dimensionality in _metric_dimensionalities:
+                    break
+            else:
+                continue
+
+            self._rows[normalized] = (
+                registry._get_root_units(parsed)[0],
+                species_indices.setdefault(dimension, len(species_indices)),
+                _metric_dimensionalities.index(carbon_dimensionality),
+            )
+
+        self._species_dimensions = list(species_indices)
+
+        metrics = _load_metric_conversion_table()[0]
+        dimensions, metric_factors = registry._get_metric_conversions()
+        self._metric_factors = {}
+        for i, metric in enumerate(metrics):
+            # later table entries for the same dimension win, like in the contexts
+            carbon_factors = dict(zip(dimensions, metric_factors[:, i].tolist()))
+            carbon_factors["[carbon]"] = 1.0
+            self._metric_factors[metric] = [
+                carbon_factors.get(d) for d in self._species_dimensions
+            ]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_factor(
+        self, source: str, target: str, context: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Get the conversion factor between two units from the table.
+
+        Parameters
+        ----------
+        source
+            Normalized unit to convert **from**
+        target
+            Normalized unit to convert **to**
+        context
+            Context to use for the conversion
+
+        Returns
+        -------
+        Optional[float]
+            Conversion factor, ``None`` if the table does not cover the conversion
+
+        Raises
+        ------
+        pint.errors.DimensionalityError
+            Units cannot be converted into each other.
+        """
+        source_row = self._rows.get(source)
+        target_row = self._rows.get(target)
+        if source_row is None or target_row is None:
+            return None
+
+        source_factor, source_species, source_shape = source_row
+        target_factor, target_species, target_shape = target_row
+        if source_shape == target_shape:
+            if source_species == target_species:
+                return source_factor / target_factor
+            metric_factors = self._metric_factors.get(context)  # type: ignore
+            if metric_factors is not None:
+                source_metric_factor = metric_factors[source_species]
+                target_metric_factor = metric_factors[target_species]
+                if (
+                    source_metric_factor is not None
+                    and target_metric_factor is not None
+                ):
+                    return (
+                        source_factor
+                        * source_metric_factor
+                        / (target_factor * target_metric_factor)
+                    )
+        if context is not None and context not in self._metric_factors:
+            # other contexts e.g. "CH4_conversions" are left to pint
+            return None
+
+        raise DimensionalityError(source, target)
+
+
+@lru_cache(maxsize=1)
+def _get_unit_conversion_table() -> _UnitConversionTable:
+    with _unit_registry_lock:
+        return _UnitConversionTable(
+            _unit_registry,
+            [
+                (mass + " " if mass else "") + gas + time
+                for gas in _standard_gases
+                if gas.upper() == gas or gas.upper() not in _standard_gases
+                for mass in ("",) + _EMISSIONS_UNIT_MASSES
+                for time in _EMISSIONS_UNIT_TIMES
+            ],
+        )
+
+
+def get_conversion_factor(
+    source: str, target: str, context: Optional[str] = None
+) -> float:
+    """
+    Get the factor converting values from one unit to another.
+
+    Conversions between the standard emissions units (any gas in any of the masses
+    g, t with prefixes up to T, per year or not) are looked up in a table which is
+    computed on first use, so no pint operations are needed (apart from normalizing
+    unit spellings seen for the first time). Other conversions fall back to
+    :func:`get_unit_converter`.
+
+    Parameters
+    ----------
+    source
+        Unit to convert **from**
+    target
+        Unit to convert **to**
+    context
+        Context to use for the conversion (see :class:`UnitConverter`)
+
+    Returns
+    -------
+    float
+        Conversion factor, nan (with a warning) if a metric does not define a species
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        Units cannot be converted into each other.
+    pint.errors.UndefinedUnitError
+        Unit undefined.
+    ValueError
+        The conversion has an offset (e.g. temperatures), use
+        :func:`get_unit_converter` instead.
+    """
+    source = _normalize_unit(source)
+    target = _normalize_unit(target)
+    factor = _get_unit_conversion_table().get_factor(source, target, context)
+    if factor is not None:
+        if np.isnan(factor):
+            # like :class:`UnitConverter` (which the fallback below creates)
+            _warn_nan_conversion(source, target)
+        return float(factor)
+
+    converter = _get_cached_unit_converter(source, target, context)
+    if converter._offset:  # pylint: disable=protected-access
+        raise ValueError(
+            "Conversion from {} to {} has an offset".format(source, target)
+        )
+    return converter._scaling  # pylint: disable=protected-access
@@ -0,0 +1,10 @@
+"""
+Tests of OpenSCM.
+"""
+import os
+import tempfile
+
+# keep the unit registry cache of the tests out of the user's cache directory (set
+# here as this package is imported before any of the tests import :mod:`openscm`)
+_UNIT_REGISTRY_CACHE_DIR = tempfile.TemporaryDirectory(prefix="openscm-tests-")
+os.environ["OPENSCM_CACHE_DIR"] = _UNIT_REGISTRY_CACHE_DIR.name
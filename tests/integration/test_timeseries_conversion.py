@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from openscm import timeseries_converter
-from openscm.errors import InsufficientDataError
+from openscm.errors import InsufficientDataError, TimeseriesPointsValuesMismatchError
 from openscm.parameters import ParameterType
 
 
@@ -71,3 +71,125 @@ def test_timeseriesconverter(combo):
     )
     values = timeseriesconverter.convert_to(combo.source_values)
     np.testing.assert_allclose(values, combo.target_values, atol=1e-10 * values.max())
+
+
+def test_conversion_matrix(combo):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    assert timeseriesconverter._conversion_matrix_from is not None
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(combo.source_values),
+        timeseriesconverter._convert(combo.source_values, combo.source, combo.target),
+        atol=1e-10 * np.abs(combo.target_values).max(),
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_to(combo.target_values),
+        timeseriesconverter._convert(combo.target_values, combo.target, combo.source),
+        atol=1e-10 * np.abs(combo.source_values).max(),
+    )
+
+    with pytest.raises(TimeseriesPointsValuesMismatchError):
+        timeseriesconverter.convert_from(combo.target_values)
+
+
+def test_batch_conversion(combo):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    factors = np.array([1, 2, -0.5])
+    source_values = factors[:, np.newaxis] * combo.source_values
+    target_values = factors[:, np.newaxis] * combo.target_values
+
+    atol = 1e-10 * np.abs(target_values).max()
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(source_values), target_values, atol=atol
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_batch(source_values), target_values, atol=atol
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter._convert(source_values, combo.source, combo.target),
+        target_values,
+        atol=atol,
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_batch(target_values, inverse=True),
+        np.array([timeseriesconverter.convert_to(v) for v in target_values]),
+    )
+
+    with pytest.raises(InsufficientDataError):
+        timeseriesconverter.convert_batch(source_values[:, :2])
+    with pytest.raises(ValueError):
+        timeseriesconverter.convert_batch(combo.source_values)
+
+
+@pytest.mark.parametrize("chunk_length", [1, 2, 5])
+def test_incremental_conversion(combo, chunk_length):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    for inverse, source_values in [
+        (False, combo.source_values),
+        (True, combo.target_values),
+    ]:
+        conversion = timeseriesconverter.create_incremental_conversion(inverse)
+        expected = timeseriesconverter.convert_batch(
+            source_values[np.newaxis, :], inverse
+        )[0]
+        assert conversion.source_length == len(source_values)
+        assert conversion.target_length == len(expected)
+        res = []
+        for i in range(0, len(source_values), chunk_length):
+            res.append(conversion.append(source_values[i : i + chunk_length]))
+            assert conversion.converted_length == sum(len(r) for r in res)
+            # only the tail of the values needed for further target values is kept
+            assert conversion._tail.shape[-1] <= conversion.received_length
+        assert conversion.received_length == len(source_values)
+        assert conversion.converted_length == len(expected)
+        np.testing.assert_allclose(
+            np.concatenate(res), expected, atol=1e-10 * np.abs(expected).max()
+        )
+
+        with pytest.raises(TimeseriesPointsValuesMismatchError):
+            conversion.append(source_values[:1])
+
+
+@pytest.mark.parametrize("scaling,offset", [(1, 0), (1e-3, 0), (1.8, 32)])
+def test_affine_conversion(combo, scaling, offset):
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    for inverse, source_values in [
+        (False, combo.source_values),
+        (True, combo.target_values),
+    ]:
+        conversion = timeseriesconverter.create_affine_conversion(
+            scaling, offset, inverse
+        )
+        for values in [source_values, np.array([source_values, -source_values])]:
+            expected = timeseriesconverter.convert_batch(
+                np.atleast_2d(scaling * values + offset), inverse
+            ).reshape(values.shape[:-1] + (-1,))
+            np.testing.assert_allclose(
+                conversion(values), expected, atol=1e-10 * np.abs(expected).max()
+            )
+
+        with pytest.raises(TimeseriesPointsValuesMismatchError):
+            conversion(source_values[:-1])
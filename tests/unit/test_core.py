@@ -1,4 +1,6 @@
+import gc
 import warnings
+import weakref
 
 import numpy as np
 import pytest
@@ -14,13 +16,18 @@ from openscm.errors import (
     RegionAggregatedError,
     TimeseriesPointsValuesMismatchError,
 )
+from openscm.parameter_views import (
+    RegionAggregatedScalarView,
+    RegionAggregatedTimeseriesView,
+)
 from openscm.parameters import ParameterType
 from openscm.timeseries_converter import (
     ExtrapolationType,
     InterpolationType,
+    clear_timeseries_converter_cache,
     create_time_points,
 )
-from openscm.units import DimensionalityError
+from openscm.units import DimensionalityError, UnitConverter
 
 
 @pytest.fixture
@@ -98,6 +105,19 @@ def test_parameter(core):
     assert param_co2.full_name == ("Emissions", "CO2")
     assert param_co2.info.region == ("World", "DEU", "BER")
     assert param_co2.info.name == "CO2"
+    # compact nodes without per-instance dicts, leaves share their (empty) children
+    for node in [param_co2, param_co2.info, region_ber]:
+        assert not hasattr(node, "__dict__")
+    assert (
+        param_co2._children
+        is parameterset._get_or_create_parameter(
+            ("Emissions", "CH4"), region_ber
+        )._children
+    )
+    assert param_co2.parent._children == {
+        "CO2": param_co2,
+        "CH4": param_co2.parent._children["CH4"],
+    }
     assert (
         parameterset.get_parameter_info(("Emissions", "CO2"), ("World", "DEU", "BER"))
         == param_co2.info
@@ -181,6 +201,97 @@ def test_parameterset_named_initialization():
     assert paraset_named._get_or_create_region(("Earth",)) == paraset_named._root
 
 
+def test_parameterset_block_storage(start_time):
+    paraset = ParameterSet(block_storage=True)
+    assert ParameterSet().timeseries_blocks == []
+    time_points = create_time_points(
+        start_time, 365 * 24 * 3600, 3, ParameterType.AVERAGE_TIMESERIES
+    )
+    names = [("Emissions", "CO2", gas) for gas in ["Fossil", "Land", "Other"]]
+    views = [
+        paraset.get_writable_timeseries_view(
+            name, ("World",), "GtC/a", time_points, ParameterType.AVERAGE_TIMESERIES
+        )
+        for name in names
+    ]
+    paraset.get_writable_timeseries_view(
+        ("Surface Temperature",),
+        ("World",),
+        "K",
+        time_points,
+        ParameterType.POINT_TIMESERIES,
+    )
+    # aggregated parameters are not stored in blocks
+    total = paraset.get_timeseries_view(
+        ("Emissions", "CO2"),
+        ("World",),
+        "GtC/a",
+        time_points,
+        ParameterType.AVERAGE_TIMESERIES,
+    )
+
+    blocks = paraset.timeseries_blocks
+    assert len(blocks) == 2
+    block = blocks[0]
+    assert block.parameter_type == ParameterType.AVERAGE_TIMESERIES
+    np.testing.assert_array_equal(block.time_points, time_points)
+    assert [info.name for info in block.parameter_infos] == [n[-1] for n in names]
+    assert block.data.shape == (3, 3)
+    assert np.isnan(block.data).all()
+
+    for i, view in enumerate(views):
+        view.set(np.array([1, 2, 3]) * (i + 1))
+    np.testing.assert_allclose(block.data, [[1, 2, 3], [2, 4, 6], [3, 6, 9]])
+    for i, view in enumerate(views):
+        assert np.shares_memory(view._parameter._data, block.data)
+        np.testing.assert_allclose(view.get(), np.array([1, 2, 3]) * (i + 1))
+    np.testing.assert_allclose(total.get(), [6, 12, 18])
+
+    # data is read-only, so writes through a held array cannot go unnoticed by
+    # memoized reads
+    data = block.data
+    np.testing.assert_allclose(views[0].get(), [1, 2, 3])
+    with pytest.raises(ValueError):
+        data[0] = 0
+    np.testing.assert_allclose(views[0].get(), [1, 2, 3])
+
+    # whole-set operations act on the parameters
+    with block.modify() as data:
+        data *= 2
+    np.testing.assert_allclose(views[0].get(), [2, 4, 6])
+    np.testing.assert_allclose(total.get(), [12, 24, 36])
+    with pytest.raises(ValueError):
+        data[0] = 0
+
+    # parameters cannot be added while a block is modified, as the block may move
+    # its data when growing
+    with block.modify():
+        with pytest.raises(RuntimeError):
+            with block.modify():
+                pass  # pragma: no cover
+        with pytest.raises(RuntimeError):
+            paraset.get_timeseries_view(
+                ("Concentrations", "CH4"),
+                ("World",),
+                "ppb",
+                time_points,
+                ParameterType.AVERAGE_TIMESERIES,
+            )
+    # the block grows, so data obtained before is not updated anymore
+    data = block.data
+    for gas in ["CO2", "N2O"]:
+        paraset.get_writable_timeseries_view(
+            ("Concentrations", gas),
+            ("World",),
+            "ppm",
+            time_points,
+            ParameterType.AVERAGE_TIMESERIES,
+        ).set(np.array([1, 1, 1]))
+    views[0].set(np.array([0, 0, 0]))
+    np.testing.assert_allclose(block.data[[0, -1]], [[0, 0, 0], [1, 1, 1]])
+    np.testing.assert_allclose(data[0], [2, 4, 6])
+
+
 def test_scalar_parameter_view(core):
     parameterset = core.parameters
     cs = parameterset.get_scalar_view(("Climate Sensitivity"), ("World",), "degC")
@@ -194,6 +305,13 @@ def test_scalar_parameter_view(core):
     assert cs_writable.get() == 68
     assert not cs.is_empty
     np.testing.assert_allclose(cs.get(), 20)
+    # values set without a unit conversion are stored as floats as well
+    cs_writable = parameterset.get_writable_scalar_view(
+        ("Climate Sensitivity"), ("World",), "degC"
+    )
+    cs_writable.set(3)
+    assert isinstance(cs.get(), float)
+    assert cs.get() == 3
     with pytest.raises(ParameterTypeError):
         parameterset.get_timeseries_view(
             ("Climate Sensitivity"),
@@ -316,6 +434,119 @@ def test_timeseries_parameter_view(core, start_time, series):
         )
 
 
+def test_timeseries_parameter_view_offset_unit(core, start_time):
+    parameterset = core.parameters
+    time_points = create_time_points(
+        start_time, 365 * 24 * 3600, 5, ParameterType.POINT_TIMESERIES
+    )
+    temperature_writable = parameterset.get_writable_timeseries_view(
+        ("Surface Temperature",),
+        ("World",),
+        "degC",
+        time_points,
+        ParameterType.POINT_TIMESERIES,
+        InterpolationType.LINEAR,
+        ExtrapolationType.LINEAR,
+    )
+    temperature_writable.set(np.array([0, 1, 2, 3, 4]))
+    np.testing.assert_allclose(temperature_writable.get(), [0, 1, 2, 3, 4])
+
+    temperature = parameterset.get_timeseries_view(
+        ("Surface Temperature",),
+        ("World",),
+        "degF",
+        create_time_points(
+            start_time, 365 * 12 * 3600, 9, ParameterType.POINT_TIMESERIES
+        ),
+        ParameterType.POINT_TIMESERIES,
+        InterpolationType.LINEAR,
+        ExtrapolationType.LINEAR,
+    )
+    np.testing.assert_allclose(temperature.get(), 32 + 1.8 * np.arange(0, 4.5, 0.5))
+
+
+def test_timeseries_parameter_view_zero_scaling(core, start_time, monkeypatch):
+    # a unit conversion without an inverse must not break read-only views
+    unit_converter = UnitConverter("GtC/yr", "GtC/yr")
+    unit_converter._scaling = 0.0
+    monkeypatch.setattr(
+        "openscm.parameter_views.get_unit_converter", lambda *args: unit_converter
+    )
+    parameterset = core.parameters
+    time_points = create_time_points(
+        start_time, 365 * 24 * 3600, 3, ParameterType.POINT_TIMESERIES
+    )
+    view_args = (
+        ("Emissions", "CO2"),
+        ("World",),
+        "GtC/yr",
+        time_points,
+        ParameterType.POINT_TIMESERIES,
+        InterpolationType.LINEAR,
+        ExtrapolationType.LINEAR,
+    )
+    writable = parameterset.get_writable_timeseries_view(*view_args)
+    readonly = parameterset.get_timeseries_view(*view_args)
+    assert len(readonly.get()) == 3
+    with pytest.raises(ZeroDivisionError):
+        writable.set(np.array([1, 2, 3]))
+
+
+def test_timeseries_parameter_view_converter_released(core, start_time):
+    clear_timeseries_converter_cache()
+    view = core.parameters.get_writable_timeseries_view(
+        ("Emissions", "CO2"),
+        ("World",),
+        "MtCO2/yr",
+        create_time_points(start_time, 24 * 3600, 3, ParameterType.POINT_TIMESERIES),
+        ParameterType.POINT_TIMESERIES,
+        InterpolationType.LINEAR,
+        ExtrapolationType.LINEAR,
+    )
+    view.set(np.array([1, 2, 3]))
+    np.testing.assert_allclose(view.get(), [1, 2, 3])
+    converter = weakref.ref(view._timeseries_converter)
+
+    # the fused unit and timeseries conversions do not keep converters alive
+    del view
+    clear_timeseries_converter_cache()
+    gc.collect()
+    assert converter() is None
+
+
+def test_scalar_parameter_view_aggregation_cached(core):
+    parameterset = core.parameters
+    for name, value in [("Land", 1), ("Ocean", 2)]:
+        parameterset.get_writable_scalar_view(
+            ("Heat Uptake", name), ("World",), "W/m^2"
+        ).set(value)
+    total = parameterset.get_scalar_view(("Heat Uptake",), ("World",), "W/m^2")
+    assert total.get() == 3
+
+    # without a write in between, the cached sum is returned without recomputing it
+    total._aggregation._groups = []
+    assert total.get() == 3
+
+
+def test_timeseries_parameter_view_aggregation_offset(core, start_time):
+    parameterset = core.parameters
+    timeseries_args = (
+        create_time_points(start_time, 24 * 3600, 3, ParameterType.POINT_TIMESERIES),
+        ParameterType.POINT_TIMESERIES,
+        InterpolationType.LINEAR,
+        ExtrapolationType.LINEAR,
+    )
+    for name, values in [("Land", [1, 2, 3]), ("Ocean", [0, 1, 0])]:
+        parameterset.get_writable_timeseries_view(
+            ("Surface Temperature", name), ("World",), "degC", *timeseries_args
+        ).set(np.array(values))
+
+    total = parameterset.get_timeseries_view(
+        ("Surface Temperature",), ("World",), "K", *timeseries_args
+    )
+    np.testing.assert_allclose(total.get(), np.array([1, 3, 3]) + 2 * 273.15)
+
+
 def test_timeseries_parameter_view_aggregation(core, start_time):
     fossil_industry_emms = np.array([0, 1, 2])
     fossil_energy_emms = np.array([2, 1, 4])
@@ -489,6 +720,160 @@ def test_timeseries_parameter_view_aggregation(core, start_time):
     )
 
 
+def test_parameter_view_reads_memoized(core, start_time):
+    parameterset = core.parameters
+    year = 365 * 24 * 3600
+    yearly = create_time_points(start_time, year, 4, ParameterType.POINT_TIMESERIES)
+    leaves = [
+        (("Emissions", "CO2", "Fossil"), "GtC/yr", yearly),
+        (
+            ("Emissions", "CO2", "Land"),
+            "MtC/yr",
+            create_time_points(start_time, year / 2, 7, ParameterType.POINT_TIMESERIES),
+        ),
+        (("Emissions", "CO2", "Other"), "GtCO2/yr", yearly),
+    ]
+    writables = []
+    for name, unit, time_points in leaves:
+        writable = parameterset.get_writable_timeseries_view(
+            name, ("World",), unit, time_points, ParameterType.POINT_TIMESERIES
+        )
+        writable.set(np.ones(len(time_points)))
+        writables.append(writable)
+        scalar_writable = parameterset.get_writable_scalar_view(
+            ("Scalar",) + name, ("World",), unit
+        )
+        scalar_writable.set(1)
+        writables.append(scalar_writable)
+
+    total = parameterset.get_timeseries_view(
+        ("Emissions", "CO2"),
+        ("World",),
+        "GtC/yr",
+        yearly,
+        ParameterType.POINT_TIMESERIES,
+    )
+    scalar_total = parameterset.get_scalar_view(
+        ("Scalar", "Emissions", "CO2"), ("World",), "GtC/yr"
+    )
+    # leaves on the same time points are converted together
+    assert len(total._aggregation._groups) == 2
+    expected = 1 + 1e-3 + 12 / 44
+    np.testing.assert_allclose(total.get(), [expected] * 4)
+    np.testing.assert_allclose(scalar_total.get(), expected)
+
+    # reads are memoized until a leaf is written to
+    values = total.get()
+    assert total.get() is values
+    with pytest.raises(ValueError):
+        values[:] = 0
+    fossil = parameterset.get_timeseries_view(
+        leaves[0][0], ("World",), "MtC/yr", yearly, ParameterType.POINT_TIMESERIES
+    )
+    assert fossil.get() is fossil.get()
+    np.testing.assert_allclose(fossil.get(), [1000] * 4)
+
+    writables[2].set(np.arange(7) * 1000)
+    writables[3].set(3000)
+    assert total.get() is not values
+    np.testing.assert_allclose(total.get(), 1 + 12 / 44 + np.arange(0, 7, 2))
+    writables[0].set(np.full(4, 2))
+    np.testing.assert_allclose(fossil.get(), [2000] * 4)
+    np.testing.assert_allclose(scalar_total.get(), 1 + 12 / 44 + 3)
+
+
+def test_region_aggregated_parameter_views(start_time):
+    parameterset = ParameterSet(block_storage=True)
+    year = 365 * 24 * 3600
+    yearly = create_time_points(start_time, year, 4, ParameterType.AVERAGE_TIMESERIES)
+    leaves = [
+        (("World", "ASIA"), "GtC/yr", yearly),
+        (
+            ("World", "OECD", "USA"),
+            "MtC/yr",
+            create_time_points(
+                start_time, year / 2, 8, ParameterType.AVERAGE_TIMESERIES
+            ),
+        ),
+        (("World", "OECD", "EU"), "GtCO2/yr", yearly),
+    ]
+    writables = {}
+    for region, unit, time_points in leaves:
+        for sector in ["Energy", "Land"]:
+            writable = parameterset.get_writable_timeseries_view(
+                ("Emissions", "CO2", sector),
+                region,
+                unit,
+                time_points,
+                ParameterType.AVERAGE_TIMESERIES,
+            )
+            writable.set(np.ones(len(time_points) - 1))
+            writables[region, sector] = writable
+        parameterset.get_writable_scalar_view(("Carbon Stock",), region, "Mt").set(2)
+
+    world = parameterset.get_region_aggregated_timeseries_view(
+        ("Emissions", "CO2"),
+        ("World",),
+        "GtC/yr",
+        yearly,
+        ParameterType.AVERAGE_TIMESERIES,
+    )
+    oecd = parameterset.get_region_aggregated_timeseries_view(
+        ("Emissions", "CO2", "Energy"),
+        ("World", "OECD"),
+        "MtC/yr",
+        yearly,
+        ParameterType.AVERAGE_TIMESERIES,
+    )
+    stock = parameterset.get_region_aggregated_scalar_view(
+        ("Carbon Stock",), ("World",), "Gt"
+    )
+    assert world.length == 4
+    np.testing.assert_allclose(world.get(), [2 * (1 + 1e-3 + 12 / 44)] * 4)
+    np.testing.assert_allclose(oecd.get(), [1 + 1000 * 12 / 44] * 4)
+    assert stock.get() == pytest.approx(6e-3)
+
+    writables[("World", "OECD", "USA"), "Energy"].set(np.arange(8) * 1000)
+    values = world.get()
+    np.testing.assert_allclose(
+        values, 2 * (1 + 12 / 44) + 1e-3 + np.array([0.5, 2.5, 4.5, 6.5])
+    )
+    assert world.get() is values
+    np.testing.assert_allclose(
+        oecd.get(), 1000 * 12 / 44 + np.array([500, 2500, 4500, 6500])
+    )
+
+    # no subregions can be added below aggregated regions
+    with pytest.raises(RegionAggregatedError):
+        parameterset._get_or_create_region(("World", "OECD", "USA", "CAL"))
+    with pytest.raises(ParameterTypeError):
+        parameterset.get_region_aggregated_scalar_view(
+            ("Emissions", "CO2"), ("World",), "GtC/yr"
+        )
+    assert parameterset.get_parameter_info(("Other",), ("World", "ASIA")) is None
+    with pytest.raises(ParameterEmptyError):
+        parameterset.get_region_aggregated_scalar_view(
+            ("Other",), ("World",), "GtC/yr"
+        ).get()
+    # building the view has created the parameter in every leaf region
+    for region, _, _ in leaves:
+        info = parameterset.get_parameter_info(("Other",), region)
+        assert info.parameter_type == ParameterType.SCALAR
+        assert info.unit == "GtC/yr"
+    assert parameterset.get_parameter_info(("Other",), ("World",)) is None
+    with pytest.raises(ParameterEmptyError):
+        RegionAggregatedScalarView([], "GtC/yr")
+    with pytest.raises(ParameterEmptyError):
+        RegionAggregatedTimeseriesView(
+            [],
+            "GtC/yr",
+            yearly,
+            ParameterType.AVERAGE_TIMESERIES,
+            InterpolationType.LINEAR,
+            ExtrapolationType.NONE,
+        )
+
+
 def test_generic_parameter_view(core):
     parameterset = core.parameters
     cs = parameterset.get_generic_view(("Model Options", "Generic Option"), ("World",))
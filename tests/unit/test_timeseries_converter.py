@@ -2,9 +2,12 @@ import re
 
 import numpy as np
 import pytest
+import scipy.integrate as integrate
+import scipy.interpolate as interpolate
 
 from openscm import timeseries_converter
 from openscm.errors import InsufficientDataError
+from openscm.parameters import ParameterType
 
 
 def test_short_data(combo):
@@ -35,3 +38,438 @@ def test_none_extrapolation_error(combo):
     )
     with pytest.raises(InsufficientDataError, match=error_msg):
         timeseriesconverter._convert(combo.source_values, combo.source, combo.target)
+
+
+def test_interval_averages_match_numerical_integration(combo):
+    if combo.timeseries_type != ParameterType.AVERAGE_TIMESERIES:
+        pytest.skip("interval averages only apply to average timeseries")
+
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    continuous = timeseriesconverter._calc_continuous_representation(
+        combo.source, combo.source_values
+    )
+    linearization_points = timeseries_converter._calc_linearization_points(combo.source)
+    expected = [
+        integrate.quad(
+            continuous,
+            lower,
+            upper,
+            points=linearization_points[
+                (linearization_points > lower) & (linearization_points < upper)
+            ],
+        )[0]
+        / (upper - lower)
+        for lower, upper in zip(combo.target[:-1], combo.target[1:])
+    ]
+    np.testing.assert_allclose(
+        timeseries_converter._calc_interval_averages(
+            continuous, linearization_points, combo.target
+        ),
+        expected,
+        atol=1e-8,
+    )
+
+
+def test_get_timeseries_converter(combo):
+    timeseries_converter.clear_timeseries_converter_cache()
+
+    timeseriesconverter = timeseries_converter.get_timeseries_converter(
+        combo.source,
+        combo.target,
+        combo.timeseries_type,
+        combo.interpolation_type,
+        combo.extrapolation_type,
+    )
+    assert timeseries_converter.timeseries_converter_cache_info().misses == 1
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(combo.source_values),
+        timeseries_converter.TimeseriesConverter(
+            combo.source,
+            combo.target,
+            combo.timeseries_type,
+            combo.interpolation_type,
+            combo.extrapolation_type,
+        ).convert_from(combo.source_values),
+    )
+
+    assert (
+        timeseries_converter.get_timeseries_converter(
+            list(combo.source),
+            np.array(combo.target),
+            combo.timeseries_type,
+            combo.interpolation_type,
+            combo.extrapolation_type,
+        )
+        is timeseriesconverter
+    )
+    assert timeseries_converter.timeseries_converter_cache_info().hits == 1
+
+    assert (
+        timeseries_converter.get_timeseries_converter(
+            combo.source,
+            combo.target,
+            combo.timeseries_type,
+            combo.interpolation_type,
+            timeseries_converter.ExtrapolationType.NONE,
+        )
+        is not timeseriesconverter
+    )
+    cache_info = timeseries_converter.timeseries_converter_cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.currsize == 2
+
+    timeseries_converter.clear_timeseries_converter_cache()
+    assert timeseries_converter.timeseries_converter_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "timeseries_type",
+    [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+)
+@pytest.mark.parametrize(
+    "source_start,source_period,target_start,target_period",
+    [
+        (0, 1, 0, 1),
+        (0, 1, 0, 4),
+        (0, 1, 3, 5),
+        (0, 4, 0, 1),
+        (0, 4, 6, 1),
+        (0, 3, 3, 9),
+        (0, 9, 9, 3),
+    ],
+)
+def test_regular_conversion_matrix(
+    timeseries_type, source_start, source_period, target_start, target_period
+):
+    source = timeseries_converter.create_time_points(
+        source_start, source_period, 12, timeseries_type
+    )
+    target = timeseries_converter.create_time_points(
+        target_start,
+        target_period,
+        int((source[-1] - target_start) // target_period)
+        + (0 if timeseries_type == ParameterType.AVERAGE_TIMESERIES else 1),
+        timeseries_type,
+    )
+    res = timeseries_converter._calc_regular_conversion_matrix(
+        source, target, timeseries_type
+    )
+    assert res is not None
+
+    if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+        expected = timeseries_converter._calc_interval_averages_matrix(
+            source, target, timeseries_converter.ExtrapolationType.NONE
+        )
+    else:
+        expected = timeseries_converter._calc_linear_interpolation_matrix(
+            source, target, timeseries_converter.ExtrapolationType.NONE
+        )
+    np.testing.assert_allclose(res.toarray(), expected.toarray(), atol=1e-14)
+
+
+def test_regular_conversion_matrix_not_applicable():
+    source = timeseries_converter.create_time_points(
+        0, 2, 12, ParameterType.AVERAGE_TIMESERIES
+    )
+    for target in [
+        # not equidistant
+        np.array([0, 2, 6, 8]),
+        # no integer ratio of period lengths
+        timeseries_converter.create_time_points(
+            0, 3, 4, ParameterType.AVERAGE_TIMESERIES
+        ),
+        # not aligned
+        timeseries_converter.create_time_points(
+            1, 4, 4, ParameterType.AVERAGE_TIMESERIES
+        ),
+        timeseries_converter.create_time_points(
+            0.5, 1, 4, ParameterType.AVERAGE_TIMESERIES
+        ),
+        # extrapolation needed
+        timeseries_converter.create_time_points(
+            -4, 4, 4, ParameterType.AVERAGE_TIMESERIES
+        ),
+    ]:
+        assert (
+            timeseries_converter._calc_regular_conversion_matrix(
+                source, target, ParameterType.AVERAGE_TIMESERIES
+            )
+            is None
+        )
+
+
+@pytest.mark.parametrize(
+    "extrapolation_type",
+    [
+        timeseries_converter.ExtrapolationType.CONSTANT,
+        timeseries_converter.ExtrapolationType.LINEAR,
+    ],
+)
+def test_interval_averages_matrix(extrapolation_type):
+    source = np.array([0, 1, 3, 6, 10, 15])
+    values = np.array([[1, 5, 3, 2, 4], [0, -1, 1, 1, 2]])
+    target = np.array([-3, 0.5, 2, 7, 12, 16, 20])
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        ParameterType.AVERAGE_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        extrapolation_type,
+    )
+
+    res = timeseries_converter._calc_interval_averages_matrix(
+        source, target, extrapolation_type
+    ).dot(values.T)
+
+    expected = timeseries_converter._calc_interval_averages(
+        timeseriesconverter._calc_continuous_representation(source, values),
+        timeseries_converter._calc_linearization_points(source),
+        target,
+    )
+    np.testing.assert_allclose(res.T, expected, atol=1e-12)
+
+
+def test_linear_interpolation_matrix_outside():
+    with pytest.raises(
+        ValueError, match="Target points outside of interpolation range"
+    ):
+        timeseries_converter._calc_linear_interpolation_matrix(
+            np.array([0, 1, 2]),
+            np.array([-1, 1]),
+            timeseries_converter.ExtrapolationType.NONE,
+        )
+
+
+@pytest.mark.parametrize(
+    "extrapolation_type",
+    [
+        timeseries_converter.ExtrapolationType.CONSTANT,
+        timeseries_converter.ExtrapolationType.LINEAR,
+    ],
+)
+def test_interpolate_linearly(extrapolation_type):
+    points = np.array([0, 1, 3, 6, 10])
+    values = np.array([[1, 2, 0, 3, 4], [0, -1, 1, 1, 2]])
+    target_points = np.array([-2, 0, 0.5, 3, 4.5, 10, 12])
+
+    res = timeseries_converter._interpolate_linearly(
+        values,
+        *timeseries_converter._calc_interpolation_brackets(
+            points, target_points, extrapolation_type
+        )
+    )
+
+    if extrapolation_type == timeseries_converter.ExtrapolationType.CONSTANT:
+        expected = [np.interp(target_points, points, v) for v in values]
+    else:
+        expected = [
+            [-1, 1, 1.5, 0, 1.5, 4, 4.5],
+            [2, 0, -0.5, 1, 1, 2, 2.5],
+        ]
+    np.testing.assert_allclose(res, expected)
+
+
+def test_average_continuous_representation_constant_extrapolation():
+    source = np.array([0, 1, 3, 6, 10])
+    values = np.array([[1, 2, 0, 3], [0, -1, 1, 2]])
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        source,
+        ParameterType.AVERAGE_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        timeseries_converter.ExtrapolationType.CONSTANT,
+    )
+    continuous = timeseriesconverter._calc_continuous_representation(source, values)
+
+    np.testing.assert_allclose(
+        continuous(np.array([-2, -0.5, 10.5, 12])), [[1, 1, 3, 3], [0, 0, 2, 2]]
+    )
+    linearization_points = timeseries_converter._calc_linearization_points(source)
+    np.testing.assert_allclose(
+        continuous(linearization_points),
+        timeseries_converter._calc_integral_preserving_linear_interpolation(values),
+    )
+
+
+@pytest.mark.parametrize(
+    "timeseries_type",
+    [ParameterType.AVERAGE_TIMESERIES, ParameterType.POINT_TIMESERIES],
+)
+@pytest.mark.parametrize(
+    "extrapolation_type",
+    [
+        timeseries_converter.ExtrapolationType.CONSTANT,
+        timeseries_converter.ExtrapolationType.LINEAR,
+        timeseries_converter.ExtrapolationType.CUBIC,
+    ],
+)
+def test_cubic_conversion(timeseries_type, extrapolation_type):
+    source = np.array([0, 1, 3, 4, 7, 8, 10], dtype=float)
+    target = np.array([-1.5, 0, 0.5, 2, 4.5, 6, 9.5, 10, 12])
+    values = np.array([[1, 3, 2, -1, 0, 2], [0, 1, 0, -1, 0.5, 1]])
+    if timeseries_type == ParameterType.POINT_TIMESERIES:
+        values = np.concatenate((values, [[0.5], [2]]), axis=1)
+
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        timeseries_type,
+        timeseries_converter.InterpolationType.CUBIC,
+        extrapolation_type,
+    )
+
+    # reference based on scipy's not-a-knot cubic spline, for average timeseries
+    # through the cumulative integral
+    if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+        spline_values = np.concatenate(
+            (np.zeros((2, 1)), np.cumsum(values * np.diff(source), axis=1)), axis=1
+        )
+    else:
+        spline_values = values
+    spline = interpolate.CubicSpline(source, spline_values, axis=1)
+    expected = spline(target)
+    for outside, end, end_idx in [
+        (target < source[0], source[0], 0),
+        (target > source[-1], source[-1], -1),
+    ]:
+        distances = target[outside] - end
+        if extrapolation_type == timeseries_converter.ExtrapolationType.CONSTANT:
+            expected[:, outside] = spline(end)[:, np.newaxis]
+            if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+                expected[:, outside] += values[:, end_idx, np.newaxis] * distances
+        elif extrapolation_type == timeseries_converter.ExtrapolationType.LINEAR:
+            expected[:, outside] = (
+                spline(end)[:, np.newaxis] + spline(end, 1)[:, np.newaxis] * distances
+            )
+            if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+                expected[:, outside] += (
+                    spline(end, 2)[:, np.newaxis] * distances ** 2 / 2
+                )
+    if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+        expected = np.diff(expected, axis=1) / np.diff(target)
+
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(values), expected, atol=1e-12
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter._convert(values, source, target), expected, atol=1e-12
+    )
+    np.testing.assert_allclose(
+        timeseriesconverter.convert_from(values[0]), expected[0], atol=1e-12
+    )
+
+    continuous = timeseriesconverter._calc_continuous_representation(source, values[0])
+    if timeseries_type == ParameterType.AVERAGE_TIMESERIES:
+        # integral preserving
+        np.testing.assert_allclose(
+            [
+                integrate.quad(continuous, lower, upper)[0] / (upper - lower)
+                for lower, upper in zip(source[:-1], source[1:])
+            ],
+            values[0],
+            atol=1e-12,
+        )
+    else:
+        np.testing.assert_allclose(continuous(target), expected[0], atol=1e-12)
+
+
+@pytest.mark.parametrize("derivative", [0, 1, 2, 3, 4])
+def test_cubic_spline_matrix_derivatives(derivative):
+    points = np.array([0, 1, 3, 4, 7, 8, 10], dtype=float)
+    values = np.array([1, 3, 2, -1, 0, 2, 0.5])
+    target_points = np.array([0, 0.5, 2, 4.5, 6, 9.5, 10])
+    spline = interpolate.CubicSpline(points, values)
+
+    res = timeseries_converter._calc_cubic_spline_matrix(
+        points,
+        target_points,
+        timeseries_converter.ExtrapolationType.CUBIC,
+        derivative=derivative,
+    ).dot(np.concatenate((values, spline(points, 2))))
+
+    np.testing.assert_allclose(res, spline(target_points, derivative), atol=1e-12)
+
+
+def test_cubic_extrapolation_of_linear_interpolation():
+    with pytest.raises(ValueError, match="only possible with cubic interpolation"):
+        timeseries_converter.TimeseriesConverter(
+            np.array([0, 1, 2, 3]),
+            np.array([0, 2, 3]),
+            ParameterType.POINT_TIMESERIES,
+            timeseries_converter.InterpolationType.LINEAR,
+            timeseries_converter.ExtrapolationType.CUBIC,
+        )
+
+
+def test_incremental_conversion_errors():
+    source = np.array([0, 1, 2, 3, 4])
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        np.array([0, 2, 4]),
+        ParameterType.POINT_TIMESERIES,
+        timeseries_converter.InterpolationType.CUBIC,
+        timeseries_converter.ExtrapolationType.CUBIC,
+    )
+    with pytest.raises(NotImplementedError):
+        timeseriesconverter.create_incremental_conversion()
+
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        np.array([0, 2, 5]),
+        ParameterType.POINT_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        timeseries_converter.ExtrapolationType.NONE,
+    )
+    with pytest.raises(InsufficientDataError):
+        timeseriesconverter.create_incremental_conversion()
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_affine_conversion_cubic(inverse):
+    source = np.array([0, 1, 3, 4, 7, 8, 10], dtype=float)
+    target = np.array([0, 2, 4.5, 6, 9.5, 10])
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        target,
+        ParameterType.POINT_TIMESERIES,
+        timeseries_converter.InterpolationType.CUBIC,
+        timeseries_converter.ExtrapolationType.CONSTANT,
+    )
+    values = np.array([1, 3, 2, -1, 0, 2, 0.5])
+    if inverse:
+        values = values[: len(target)]
+
+    conversion = timeseriesconverter.create_affine_conversion(1.8, 32, inverse)
+    np.testing.assert_allclose(
+        conversion(values),
+        timeseriesconverter.convert_batch(1.8 * values[np.newaxis, :] + 32, inverse)[0],
+    )
+    # conversions are kept by the converter
+    assert timeseriesconverter.create_affine_conversion(1.8, 32, inverse) is conversion
+
+
+def test_affine_conversion_impossible():
+    source = np.array([0, 1, 2, 3])
+    timeseriesconverter = timeseries_converter.TimeseriesConverter(
+        source,
+        np.array([0, 1, 2, 3, 4]),
+        ParameterType.POINT_TIMESERIES,
+        timeseries_converter.InterpolationType.LINEAR,
+        timeseries_converter.ExtrapolationType.NONE,
+    )
+    conversion = timeseriesconverter.create_affine_conversion(2, 1)
+    with pytest.raises(InsufficientDataError):
+        conversion(np.array([1, 2, 3, 4]))
+    # the inverse conversion does not need extrapolation
+    np.testing.assert_allclose(
+        timeseriesconverter.create_affine_conversion(2, 1, inverse=True)(
+            np.array([1, 2, 3, 4, 5])
+        ),
+        [3, 5, 7, 9],
+    )
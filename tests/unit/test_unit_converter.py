@@ -1,4 +1,6 @@
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -7,7 +9,18 @@ from openscm.units import (
     DimensionalityError,
     UndefinedUnitError,
     UnitConverter,
+    _get_canonical_unit,
+    _get_unit_conversion_table,
+    _normalize_unit,
     _unit_registry,
+    _UnitConversionTable,
+    calculate_co2_equivalent_totals,
+    clear_unit_converter_cache,
+    convert_units,
+    get_co2_equivalent_factors,
+    get_conversion_factor,
+    get_unit_converter,
+    unit_converter_cache_info,
 )
 
 
@@ -64,3 +77,310 @@ def test_metric_conversion_unit_converter_nan():
 def test_properties():
     assert UnitConverter("CO2", "C").contexts
     assert UnitConverter("CO2", "C").unit_registry
+
+
+def test_get_unit_converter():
+    clear_unit_converter_cache()
+    assert unit_converter_cache_info().currsize == 0
+
+    uc = get_unit_converter("kg", "t")
+    assert unit_converter_cache_info().misses == 1
+    np.testing.assert_allclose(uc.convert_from(1000), 1)
+
+    assert get_unit_converter("kg", "t") is uc
+    assert unit_converter_cache_info().hits == 1
+
+    assert get_unit_converter("kg", "t", "AR4GWP100") is not uc
+    uc_context = get_unit_converter("kg SF5CF3 / yr", "kg CO2 / yr", "AR4GWP100")
+    assert uc_context.convert_from(1) == 17700
+    cache_info = unit_converter_cache_info()
+    assert cache_info.misses == 3
+    assert cache_info.currsize == 3
+
+    with pytest.raises(DimensionalityError):
+        get_unit_converter("kg", "degF")
+
+    clear_unit_converter_cache()
+    assert unit_converter_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("metric", ["SARGWP100", "AR4GWP100", "AR5GWP100"])
+def test_calculate_co2_equivalent_totals(metric):
+    source_units = [
+        "Mt CH4 / yr",
+        "kt N2O / yr",
+        "Gt C / yr",
+        "t SF6 / yr",
+        "kt CO2/yr",
+    ]
+    values = np.random.default_rng(0).random((4, len(source_units), 6))
+
+    expected = sum(
+        UnitConverter(unit, "Mt CO2 / yr", metric).convert_from(values[:, i, :])
+        for i, unit in enumerate(source_units)
+    )
+    np.testing.assert_allclose(
+        calculate_co2_equivalent_totals(values, source_units, "Mt CO2 / yr", metric),
+        expected,
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        calculate_co2_equivalent_totals(values[0], source_units, "Mt CO2 / yr", metric),
+        expected[0],
+        rtol=1e-12,
+    )
+
+
+def test_calculate_co2_equivalent_totals_errors():
+    with pytest.raises(ValueError, match="Expected 2 gases"):
+        calculate_co2_equivalent_totals(
+            np.ones((3, 4)), ["CH4", "N2O"], "CO2", "AR4GWP100"
+        )
+    with pytest.raises(ValueError, match="Unknown metric"):
+        get_co2_equivalent_factors(["CH4"], "CO2", "GWP1000")
+    with pytest.raises(DimensionalityError):
+        get_co2_equivalent_factors(["kg CH4"], "kg CO2 / yr", "AR4GWP100")
+    with pytest.raises(DimensionalityError):
+        get_co2_equivalent_factors(["kg CH4 / m**2"], "kg CO2 / m**2", "AR4GWP100")
+
+    with pytest.warns(UserWarning, match="No conversion from CFC13 to CO2"):
+        factors = get_co2_equivalent_factors(["CFC13", "CH4"], "CO2", "SARGWP100")
+    assert np.isnan(factors[0])
+    assert factors[1] == 21
+
+
+def test_convert_units():
+    source_units = ["Mt CO2 / yr", "degC", "kt CH4 / yr", "Mt CO2 / yr", "degC"]
+    target_units = ["Gt C / yr", "K", "Mt CH4 / yr", "Gt C / yr", "degF"]
+    values = np.random.default_rng(0).random((len(source_units), 3, 4))
+    expected = np.array(
+        [
+            UnitConverter(source, target).convert_from(v)
+            for source, target, v in zip(source_units, target_units, values)
+        ]
+    )
+
+    np.testing.assert_allclose(
+        convert_units(values, source_units, target_units), expected
+    )
+
+    out = np.empty_like(values)
+    assert convert_units(values, source_units, target_units, out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+    res = convert_units(values[:, 0, 0], ["Mt CO2 / yr"] * 5, "Gt C / yr")
+    np.testing.assert_allclose(res, values[:, 0, 0] * 12 / 44 / 1000)
+
+    res = convert_units(values[:1], ["Mt CH4 / yr"], "Mt CO2 / yr", "AR4GWP100")
+    np.testing.assert_allclose(res, values[:1] * 25)
+
+    with pytest.raises(ValueError, match="Expected 5 source units, got 2"):
+        convert_units(values, ["kg", "t"], "t")
+    with pytest.raises(DimensionalityError):
+        convert_units(values, source_units, "kg")
+
+
+def test_convert_out():
+    uc = UnitConverter("degC", "degF")
+    values = np.array([0.0, 100.0, -40.0])
+    expected = np.array([32.0, 212.0, -40.0])
+
+    out = np.empty_like(values)
+    assert uc.convert_from(values, out=out) is out
+    np.testing.assert_allclose(out, expected)
+    assert uc.convert_to(out, out=out) is out
+    np.testing.assert_allclose(out, values)
+
+    inplace = values.copy()
+    assert uc.convert_from_inplace(inplace) is inplace
+    np.testing.assert_allclose(inplace, expected)
+    assert uc.convert_to_inplace(inplace) is inplace
+    np.testing.assert_allclose(inplace, values)
+
+    # without an offset
+    uc = UnitConverter("kg", "g")
+    assert uc.convert_from(values, out=out) is out
+    np.testing.assert_allclose(out, values * 1000)
+    assert uc.convert_to(out, out=out) is out
+    np.testing.assert_allclose(out, values)
+
+
+def test_convert_identity():
+    uc = UnitConverter("Mt CO2 / yr", "Mt CO2/yr")
+    assert uc._is_identity
+    assert not UnitConverter("kg", "t")._is_identity
+
+    values = np.arange(3.0)
+    for convert in [uc.convert_from, uc.convert_to]:
+        res = convert(values)
+        assert np.shares_memory(res, values)
+        assert not res.flags.writeable
+        np.testing.assert_array_equal(res, values)
+        assert convert(2.5) == 2.5
+        res = convert(2)
+        assert res == 2
+        assert isinstance(res, float)
+
+        out = np.zeros(3)
+        assert convert(values, out=out) is out
+        np.testing.assert_array_equal(out, values)
+
+    assert values.flags.writeable
+    assert uc.convert_from_inplace(values) is values
+
+
+def test_metric_conversion_without_context(monkeypatch):
+    def enable_contexts(*args, **kwargs):
+        raise AssertionError("shared unit registry modified")
+
+    monkeypatch.setattr(_unit_registry, "enable_contexts", enable_contexts)
+    uc = UnitConverter("Mt CH4 / yr", "Gt N2O / yr", context="AR5GWP100")
+    np.testing.assert_allclose(uc.convert_from(265), 28 / 1000)
+    np.testing.assert_allclose(
+        UnitConverter("t C", "t CO2", context="AR5GWP100").convert_from(12), 44
+    )
+
+    # carbon is not replaced by another species in units already containing carbon
+    with pytest.raises(DimensionalityError):
+        UnitConverter("C * CH4", "C * N2O", context="AR5GWP100")
+    with pytest.raises(ValueError, match="Offset unit degC cannot use a metric"):
+        _unit_registry._get_metric_conversion_factor("degC", "K", "AR5GWP100")
+
+
+def test_unit_converter_threads():
+    conversions = [
+        ("kg CH4 / yr", "kg CO2 / yr", "AR4GWP100", 25),
+        ("CH4", "C", "CH4_conversions", 0.75),
+        ("kg", "t", None, 1e-3),
+        ("degC", "degF", None, 33.8),
+    ] * 25
+
+    def convert(conversion):
+        source, target, context, _ = conversion
+        return UnitConverter(source, target, context).convert_from(1)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(convert, conversions))
+
+    np.testing.assert_allclose(results, [c[-1] for c in conversions])
+    with pytest.raises(DimensionalityError):
+        UnitConverter("CH4", "C")
+
+
+def test_normalize_unit():
+    canonical = _normalize_unit("Mt CO2/yr")
+    for spelling in ["MtCO2 / a", "Mt CO2 / yr", "megatCO2/year", "Tg CO2 / a"]:
+        assert _normalize_unit(spelling) is canonical
+    assert _normalize_unit("Mt C / yr") != canonical
+    assert _normalize_unit("kt HFC-134a / yr") == _normalize_unit("kt HFC134a / yr")
+    assert _normalize_unit("degC") == "degC"
+    assert _normalize_unit("celsius") == "celsius"
+    with pytest.raises(UndefinedUnitError):
+        _normalize_unit("UNKNOWN")
+    with pytest.raises(UndefinedUnitError, match="HFCUNKNOWN") as exc_info:
+        _normalize_unit("kt HFC-UNKNOWN")
+    assert exc_info.value.__cause__ is not None
+
+
+def test_canonical_units_bounded(monkeypatch):
+    monkeypatch.setattr("openscm.units._canonical_units", OrderedDict())
+    monkeypatch.setattr("openscm.units._CANONICAL_UNITS_SIZE", 2)
+    assert _get_canonical_unit(1, "a") == "a"
+    assert _get_canonical_unit(2, "b") == "b"
+    assert _get_canonical_unit(1, "c") == "a"
+    assert _get_canonical_unit(3, "d") == "d"
+    # the least recently used key is dropped
+    assert _get_canonical_unit(2, "e") == "e"
+    assert _get_canonical_unit(1, "f") == "f"
+
+
+def test_get_unit_converter_normalized():
+    clear_unit_converter_cache()
+    uc = get_unit_converter("Mt CO2/yr", "Gt C/yr")
+    assert get_unit_converter("MtCO2 / a", "GtC / yr") is uc
+    assert unit_converter_cache_info().hits == 1
+    np.testing.assert_allclose(
+        get_unit_converter("kt HFC-134a / yr", "kt CO2 / yr", "AR4GWP100").convert_from(
+            1
+        ),
+        1430,
+    )
+
+
+@pytest.mark.parametrize(
+    "source,target,context",
+    [
+        ("Mt CO2 / yr", "Gt C / yr", None),
+        ("kt HFC-134a", "t HFC134a", None),
+        ("Mt CH4 / yr", "kt CO2 / yr", "AR4GWP100"),
+        ("Tg N2O", "Gg CH4", "AR5GWP100"),
+        ("g C / yr", "t CO2 / yr", "SARGWP100"),
+        ("CH4", "C", "CH4_conversions"),
+        ("kg", "t", None),
+        ("m", "km", None),
+    ],
+)
+def test_get_conversion_factor(source, target, context):
+    np.testing.assert_allclose(
+        get_conversion_factor(source, target, context),
+        get_unit_converter(source, target, context).convert_from(1),
+        rtol=1e-12,
+    )
+
+
+def test_get_conversion_factor_table():
+    table = _get_unit_conversion_table()
+    assert len(table) == len(table._rows)
+    assert table.get_factor(
+        _normalize_unit("Mt CH4 / yr"), _normalize_unit("kt CO2 / yr"), "AR4GWP100"
+    ) == pytest.approx(25000)
+    # left to pint
+    assert table.get_factor(_normalize_unit("kg"), _normalize_unit("t")) is None
+    assert (
+        table.get_factor(
+            _normalize_unit("CH4"), _normalize_unit("C"), "CH4_conversions"
+        )
+        is None
+    )
+
+
+def test_get_conversion_factor_errors():
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor("Mt CH4 / yr", "kt CO2 / yr")
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor("Mt CH4 / yr", "kt CO2", "AR4GWP100")
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor("kg", "m")
+    with pytest.raises(UndefinedUnitError):
+        get_conversion_factor("UNKNOWN", "kg")
+    # species not in the metric table
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor("Mt NOx / yr", "kt CO2 / yr", "AR4GWP100")
+    # left to pint by the table, not a conversion of the context either
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor("Mt CH4 / yr", "kt N2O / yr", "CH4_conversions")
+    with pytest.raises(ValueError, match="offset"):
+        get_conversion_factor("degC", "degF")
+
+
+@pytest.mark.parametrize(
+    "source,target,context",
+    [
+        ("t CHCl3 / yr", "t CO2 / yr", "AR4GWP100"),
+        ("CFC13", "C", "SARGWP100"),
+        ("kg CHCl3 / day", "kg CO2 / day", "AR4GWP100"),
+    ],
+)
+def test_get_conversion_factor_nan(source, target, context):
+    clear_unit_converter_cache()
+    with pytest.warns(UserWarning, match="No conversion from"):
+        assert np.isnan(get_conversion_factor(source, target, context))
+    with pytest.warns(UserWarning, match="No conversion from"):
+        assert np.isnan(UnitConverter(source, target, context).convert_from(1))
+
+
+def test_unit_conversion_table_skipped_units():
+    table = _UnitConversionTable(
+        _unit_registry, ["m ** 2", "UNKNOWN", "t CH4", "Mt CH4 / yr", "Mg CH4"]
+    )
+    assert len(table) == 2
@@ -1,6 +1,12 @@
+import json
+import os
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
+from openscm import units
 from openscm.units import DimensionalityError, _unit_registry
 
 
@@ -151,3 +157,152 @@ def test_metric_conversion(metric_name, species, conversion):
         with _unit_registry.context(metric_name):
             np.testing.assert_allclose(base.to(dest).magnitude, conversion)
             np.testing.assert_allclose(dest.to(base).magnitude, 1 / conversion)
+
+
+def test_unit_registry_cache(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir)
+    path = units.build_unit_registry_cache(cache_dir)
+    assert os.path.isfile(path)
+
+    registry = units._load_unit_registry(cache_dir)
+    assert registry is not _unit_registry
+    assert set(registry._units) <= set(_unit_registry._units)
+    assert "spectroscopy" in registry._contexts
+    np.testing.assert_allclose(
+        registry("Gt C / yr").to("Mt CO2 / week").magnitude,
+        _unit_registry("Gt C / yr").to("Mt CO2 / week").magnitude,
+    )
+    np.testing.assert_allclose(registry("degC").to("K").magnitude, 274.15)
+    with registry.context("AR4GWP100"):
+        np.testing.assert_allclose(registry("t CH4").to("t CO2").magnitude, 25)
+
+    # changing the standard gases invalidates the cache
+    monkeypatch.setitem(units._standard_gases, "XYZ", "XYZ")
+    assert units._get_unit_registry_cache_path(cache_dir) != path
+    registry = units._load_unit_registry(cache_dir)
+    assert "tXYZ" in registry._units
+    assert os.path.isfile(units._get_unit_registry_cache_path(cache_dir))
+
+
+def test_unit_registry_cache_other_process(tmpdir):
+    cache_dir = str(tmpdir)
+    # string hashes differ between processes with different hash seeds
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from openscm import units; units.build_unit_registry_cache({!r})".format(
+                cache_dir
+            ),
+        ],
+        check=True,
+        env=dict(os.environ, PYTHONHASHSEED="1"),
+    )
+
+    registry = units._load_unit_registry(cache_dir)
+    assert registry._dimensionality_cache
+    for key in registry._dimensionality_cache:
+        assert registry._dimensionality_cache[key] == registry.get_dimensionality(key)
+    assert "meter" in {str(u) for u in registry.get_compatible_units("m")}
+
+
+def test_unit_registry_cache_invalid(tmpdir):
+    cache_dir = str(tmpdir)
+    path = units._get_unit_registry_cache_path(cache_dir)
+    with open(path, "wb") as f:
+        f.write(b"invalid")
+
+    with pytest.warns(UserWarning, match="Could not load unit registry cache"):
+        registry = units._load_unit_registry(cache_dir)
+    np.testing.assert_allclose(registry("CO2").to("C").magnitude, 12 / 44)
+
+    # the cache has been rebuilt
+    assert units._load_unit_registry(cache_dir)._units.keys() == registry._units.keys()
+
+
+def test_unit_registry_cache_is_data(tmpdir):
+    path = units.build_unit_registry_cache(str(tmpdir))
+    with open(path) as f:
+        state = json.load(f)
+    assert "CO2" in str(state)
+
+    # only the known pint classes can be restored
+    for obj in [
+        {"object": ["Popen", {"dict": []}]},
+        {"__reduce__": "os.system"},
+        {"set": [], "tuple": []},
+    ]:
+        with pytest.raises(ValueError, match="Invalid unit registry cache entry"):
+            units._decode_unit_registry_state(obj)
+    with pytest.raises(TypeError, match="Cannot store"):
+        units._encode_unit_registry_state({"a": object()})
+
+
+def test_unit_registry_cache_disabled(monkeypatch):
+    monkeypatch.setenv("OPENSCM_CACHE_DIR", "")
+    assert units._get_unit_registry_cache_path() is None
+    with pytest.raises(ValueError, match="Unit registry cache is disabled"):
+        units.build_unit_registry_cache()
+    assert "CO2" in units._load_unit_registry()._units
+
+
+def test_unit_registry_cache_default_dir(tmpdir, monkeypatch):
+    monkeypatch.delenv("OPENSCM_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    assert os.path.dirname(units._get_unit_registry_cache_path()) == os.path.join(
+        str(tmpdir), "openscm"
+    )
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmpdir))
+    assert os.path.dirname(units._get_unit_registry_cache_path()) == os.path.join(
+        str(tmpdir), ".cache", "openscm"
+    )
+
+
+def test_unit_registry_cache_write_failure(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir)
+
+    def replace(*args):
+        raise OSError("Read-only file system")
+
+    monkeypatch.setattr(units.os, "replace", replace)
+    with pytest.raises(OSError, match="Read-only file system"):
+        units.build_unit_registry_cache(cache_dir)
+    # the temporary file is removed
+    assert not os.listdir(cache_dir)
+
+    # loading the registry does not fail if the cache cannot be written
+    assert "CO2" in units._load_unit_registry(cache_dir)._units
+    assert not os.listdir(cache_dir)
+
+
+def test_metric_conversion_table():
+    metrics, species, values = units._load_metric_conversion_table()
+    assert metrics == ["SARGWP100", "AR4GWP100", "AR5GWP100"]
+    assert values.shape == (len(species), len(metrics))
+    np.testing.assert_allclose(values[species.index("CH4")], [21, 25, 28])
+    assert np.isnan(values[species.index("CFC13"), 0])
+
+
+def test_contexts_loaded_lazily():
+    registry = units._load_unit_registry()
+    assert "AR4GWP100" not in registry._contexts
+    assert {"AR4GWP100", "SARGWP100", "CH4_conversions"} <= set(
+        registry._get_context_names()
+    )
+
+    with registry.context("AR4GWP100"):
+        np.testing.assert_allclose(registry("t CH4").to("t CO2").magnitude, 25)
+    assert "AR4GWP100" in registry._contexts
+    assert "SARGWP100" not in registry._contexts
+    assert "CH4_conversions" not in registry._contexts
+    assert len(registry._get_context_names()) == len(set(registry._get_context_names()))
+
+
+def test_unknown_context():
+    registry = units._load_unit_registry()
+    with pytest.raises(KeyError):
+        with registry.context("AR1GWP100"):
+            pass
+    assert "AR1GWP100" not in registry._get_context_names()